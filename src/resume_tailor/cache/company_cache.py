@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import sqlite3
+import threading
 import time
+import weakref
+import zlib
+from collections.abc import Iterable
 from pathlib import Path
 
 from resume_tailor.models.company import CompanyProfile
@@ -12,9 +16,36 @@ from resume_tailor.models.company import CompanyProfile
 DEFAULT_DB_PATH = Path.home() / ".resume-tailor" / "cache.db"
 DEFAULT_TTL_DAYS = 7
 
+# Bumped whenever the table layout changes; older tables are dropped and
+# rebuilt on open since the cache can always be repopulated.
+_SCHEMA_VERSION = 2
+_COMPRESS_LEVEL = 3
+
+_SQL_GET = "SELECT profile_blob FROM company_cache WHERE company_name = ? AND cached_at > ?"
+_SQL_PUT = """INSERT OR REPLACE INTO company_cache
+              (company_name, profile_blob, cached_at)
+              VALUES (?, ?, ?)"""
+_SQL_DEL = "DELETE FROM company_cache WHERE company_name = ?"
+_SQL_PURGE = "DELETE FROM company_cache WHERE cached_at <= ?"
+
+
+@functools.lru_cache(maxsize=1024)
+def _norm(company_name: str) -> str:
+    """Normalize a company name into its cache key."""
+    return company_name.strip().lower()
+
+
+def _encode(profile: CompanyProfile) -> bytes:
+    """Serialize and compress a profile for the profile_blob column."""
+    return zlib.compress(profile.model_dump_json().encode(), _COMPRESS_LEVEL)
+
 
 class CompanyCache:
-    """SQLite-backed company profile cache with TTL expiration."""
+    """SQLite-backed company profile cache with TTL expiration.
+
+    Holds a single connection for the lifetime of the instance; access is
+    serialized with a lock so the cache can be shared across threads.
+    """
 
     def __init__(
         self,
@@ -24,75 +55,134 @@ class CompanyCache:
         self.db_path = Path(db_path)
         self.ttl_seconds = ttl_days * 86400
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        # Closes the connection on garbage collection or interpreter exit,
+        # without keeping the instance alive the way atexit.register would
+        self._finalizer = weakref.finalize(self, self._conn.close)
         self._init_db()
 
     def _init_db(self) -> None:
-        with self._connect() as conn:
-            conn.execute("""
+        with self._lock:
+            # auto_vacuum only changes on an existing database after a
+            # VACUUM rebuild, so convert older files once (2 = INCREMENTAL)
+            if self._conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                self._conn.execute("VACUUM")
+            # journal_mode is persistent per database file, so set it once here
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < _SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS company_cache")
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS company_cache (
                     company_name TEXT PRIMARY KEY,
-                    profile_json TEXT NOT NULL,
+                    profile_blob BLOB NOT NULL,
                     cached_at REAL NOT NULL
                 )
             """)
+            # Lets the TTL predicates in stats()/purge_expired() range-scan
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cached_at ON company_cache(cached_at)"
+            )
+            self._conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA journal_mode=WAL")
+        # Autocommit mode: every statement is its own transaction unless an
+        # explicit BEGIN IMMEDIATE is issued for multi-statement writes.
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        # Per-connection settings: WAL makes synchronous=NORMAL safe and
+        # avoids an fsync per commit; busy_timeout waits out concurrent writers.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
         return conn
 
+    def close(self) -> None:
+        """Close the underlying connection. Safe to call more than once."""
+        with self._lock:
+            self._finalizer()
+
     def get(self, company_name: str) -> CompanyProfile | None:
-        """Get cached company profile if not expired."""
-        key = company_name.strip().lower()
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT profile_json, cached_at FROM company_cache WHERE company_name = ?",
-                (key,),
+        """Get cached company profile if not expired.
+
+        Expired rows are filtered out by the query and left in place;
+        they are removed by ``purge_expired()``.
+        """
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            row = self._conn.execute(
+                _SQL_GET, (_norm(company_name), cutoff)
             ).fetchone()
 
         if row is None:
             return None
 
-        profile_json, cached_at = row
-        if time.time() - cached_at > self.ttl_seconds:
-            self.delete(company_name)
-            return None
-
-        return CompanyProfile(**json.loads(profile_json))
+        return CompanyProfile.model_validate_json(zlib.decompress(row[0]))
 
     def put(self, company_name: str, profile: CompanyProfile) -> None:
         """Cache a company profile."""
-        key = company_name.strip().lower()
-        with self._connect() as conn:
-            conn.execute(
-                """INSERT OR REPLACE INTO company_cache
-                   (company_name, profile_json, cached_at)
-                   VALUES (?, ?, ?)""",
-                (key, profile.model_dump_json(), time.time()),
-            )
+        blob = _encode(profile)
+        with self._lock:
+            self._conn.execute(_SQL_PUT, (_norm(company_name), blob, time.time()))
+
+    def put_many(self, items: Iterable[tuple[str, CompanyProfile]]) -> None:
+        """Cache several company profiles in a single transaction."""
+        now = time.time()
+        rows = [(_norm(name), _encode(profile), now) for name, profile in items]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(_SQL_PUT, rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
 
     def delete(self, company_name: str) -> None:
         """Delete a cached company profile."""
-        key = company_name.strip().lower()
-        with self._connect() as conn:
-            conn.execute(
-                "DELETE FROM company_cache WHERE company_name = ?", (key,)
+        with self._lock:
+            self._conn.execute(_SQL_DEL, (_norm(company_name),))
+
+    def purge_expired(self) -> int:
+        """Delete all expired entries. Returns count of deleted rows."""
+        with self._lock:
+            cursor = self._conn.execute(
+                _SQL_PURGE, (time.time() - self.ttl_seconds,)
             )
+            return cursor.rowcount
+
+    def maintenance(self) -> int:
+        """Purge expired entries and compact the database file.
+
+        Returns count of purged rows.
+        """
+        purged = self.purge_expired()
+        with self._lock:
+            self._conn.execute("PRAGMA optimize")
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            self._conn.execute("PRAGMA incremental_vacuum").fetchall()
+        return purged
 
     def clear(self) -> int:
         """Clear all cached entries. Returns count of deleted rows."""
-        with self._connect() as conn:
-            cursor = conn.execute("DELETE FROM company_cache")
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM company_cache")
             return cursor.rowcount
 
     def stats(self) -> dict:
         """Return cache statistics."""
-        with self._connect() as conn:
-            total = conn.execute(
-                "SELECT COUNT(*) FROM company_cache"
-            ).fetchone()[0]
-            expired = conn.execute(
-                "SELECT COUNT(*) FROM company_cache WHERE ? - cached_at > ?",
-                (time.time(), self.ttl_seconds),
-            ).fetchone()[0]
+        with self._lock:
+            total, expired = self._conn.execute(
+                """SELECT
+                       COUNT(*),
+                       COALESCE(SUM(CASE WHEN cached_at <= ? THEN 1 ELSE 0 END), 0)
+                   FROM company_cache""",
+                (time.time() - self.ttl_seconds,),
+            ).fetchone()
         return {"total": total, "expired": expired, "active": total - expired}
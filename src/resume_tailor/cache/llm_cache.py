@@ -0,0 +1,168 @@
+"""Two-tier (memory + SQLite) cache for deterministic (temperature 0) LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_DB_PATH = Path.home() / ".resume-tailor" / "cache.db"
+DEFAULT_TTL_DAYS = 7
+# Most recently used responses kept in process memory in front of SQLite
+DEFAULT_MEMORY_ENTRIES = 256
+
+_SQL_GET = (
+    "SELECT text, input_tokens, output_tokens, cached_at FROM llm_cache "
+    "WHERE cache_key = ? AND cached_at > ?"
+)
+_SQL_PUT = """INSERT OR REPLACE INTO llm_cache
+              (cache_key, text, input_tokens, output_tokens, cached_at)
+              VALUES (?, ?, ?, ?, ?)"""
+
+
+_HSPACE_RE = re.compile(r"[ \t\f\v\u00a0\u3000]+")
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+\n")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def _normalize(text: str) -> str:
+    """Canonicalize whitespace so layout-only differences share a key.
+
+    Resumes and JDs are pasted or parsed from PDF/DOCX, so the same content
+    routinely arrives with CRLF line endings, trailing spaces, doubled
+    spaces or extra blank lines; none of that changes the model's answer.
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = _HSPACE_RE.sub(" ", text)
+    text = _TRAILING_SPACE_RE.sub("\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
+    return text.strip()
+
+
+def make_key(
+    model: str, system: str, prompt: str, max_tokens: int, tool: str = ""
+) -> str:
+    """Build the content-addressed cache key for one LLM request.
+
+    Fields are fed to the hash length-prefixed, so no field boundary can be
+    forged by content and no intermediate JSON document is built. ``tool``
+    names a forced output tool; it is only hashed when set, so plain-text
+    requests keep their existing keys.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for field in (model, _normalize(system), _normalize(prompt)):
+        data = field.encode()
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    h.update(max_tokens.to_bytes(8, "little"))
+    if tool:
+        h.update(tool.encode())
+    return h.hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed LLM response cache with TTL expiration.
+
+    Shares the database file with ``CompanyCache`` but owns its own table.
+    The most recently used entries are also kept in an in-process LRU, so
+    repeated lookups skip the database query.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path = DEFAULT_DB_PATH,
+        ttl_days: int = DEFAULT_TTL_DAYS,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_days * 86400
+        self.memory_entries = memory_entries
+        # cache_key -> (cached_at, (text, input_tokens, output_tokens))
+        self._memory: OrderedDict[str, tuple[float, tuple[str, int, int]]] = OrderedDict()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        # Closes the connection on garbage collection or interpreter exit,
+        # without keeping the instance alive the way atexit.register would
+        self._finalizer = weakref.finalize(self, self._conn.close)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    cached_at REAL NOT NULL
+                )
+            """)
+
+    def close(self) -> None:
+        """Close the underlying connection. Safe to call more than once."""
+        with self._lock:
+            self._finalizer()
+
+    def get(self, key: str) -> tuple[str, int, int] | None:
+        """Return (text, input_tokens, output_tokens) if cached and not expired."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > cutoff:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+            row = self._conn.execute(_SQL_GET, (key, cutoff)).fetchone()
+            if row is None:
+                return None
+            response = row[:3]
+            self._remember(key, row[3], response)
+            return response
+
+    def put(self, key: str, text: str, input_tokens: int, output_tokens: int) -> None:
+        """Cache a response."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(_SQL_PUT, (key, text, input_tokens, output_tokens, now))
+            self._remember(key, now, (text, input_tokens, output_tokens))
+
+    def _remember(self, key: str, cached_at: float, response: tuple[str, int, int]) -> None:
+        # Caller holds self._lock
+        self._memory[key] = (cached_at, response)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove one cached response, if present."""
+        with self._lock:
+            self._memory.pop(key, None)
+            self._conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """Delete all expired responses. Returns count of deleted rows."""
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            for key in [k for k, (cached_at, _) in self._memory.items() if cached_at <= cutoff]:
+                del self._memory[key]
+            return self._conn.execute(
+                "DELETE FROM llm_cache WHERE cached_at <= ?", (cutoff,)
+            ).rowcount
+
+    def clear(self) -> int:
+        """Clear all cached responses. Returns count of deleted rows."""
+        with self._lock:
+            self._memory.clear()
+            return self._conn.execute("DELETE FROM llm_cache").rowcount
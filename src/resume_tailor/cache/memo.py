@@ -0,0 +1,66 @@
+"""In-process LRU memo for async agent results."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAXSIZE = 32
+
+
+class AsyncMemo(Generic[T]):
+    """Bounded LRU of coroutine results keyed by string.
+
+    Concurrent misses on the same key share a single computation. Cancelling
+    one caller leaves the computation running for the others; it is
+    cancelled only once no caller is waiting. Failed or cancelled
+    computations are not stored, so the next call retries.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._results: OrderedDict[str, T] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[T]] = {}
+        self._waiters: dict[str, int] = {}
+
+    async def get_or_compute(
+        self, key: str, compute: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Return the memoized result for key, computing it on a miss."""
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        fut = self._pending.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(compute())
+            self._pending[key] = fut
+            fut.add_done_callback(functools.partial(self._settle, key))
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            # Shielded, so one caller's cancellation doesn't reach the others
+            return await asyncio.shield(fut)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                if not fut.done():
+                    fut.cancel()
+
+    def _settle(self, key: str, fut: asyncio.Future[T]) -> None:
+        del self._pending[key]
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        self._results[key] = fut.result()
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all memoized results."""
+        self._results.clear()
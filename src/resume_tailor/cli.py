@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import asyncio
-import webbrowser
+import os
+import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -12,29 +13,10 @@ load_dotenv()
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from resume_tailor.cache.company_cache import CompanyCache
-from resume_tailor.clients.llm_client import LLMClient
-from resume_tailor.clients.search_client import SearchClient
-from resume_tailor.config import load_config
-from resume_tailor.parsers.jd_parser import load_jd_file
-from resume_tailor.parsers.resume_parser import parse_resume
-from resume_tailor.pipeline.orchestrator import PipelineOrchestrator
-from resume_tailor.templates.docx_renderer import (
-    fill_docx_template,
-    generate_docx,
-    list_docx_placeholders,
-)
-from resume_tailor.templates.smart_filler import (
-    smart_fill_docx_sync,
-)
-from resume_tailor.parsers.form_parser import extract_from_url, parse_text
-from resume_tailor.pipeline.form_filler import generate_form_answers, extract_structured_fields
-from resume_tailor.models.resume import TailoredResume, ResumeSection
-from resume_tailor.templates.loader import list_templates, load_template
-from resume_tailor.templates.renderer import render_to_html, save_html
+
+# Command-specific modules (anthropic, the pipeline, docx/PDF renderers,
+# playwright-backed parsers) are imported inside each command so that
+# --help and light commands don't pay their import cost.
 
 app = typer.Typer(
     name="resume-tailor",
@@ -43,6 +25,9 @@ app = typer.Typer(
 )
 console = Console()
 
+cache_app = typer.Typer(help="회사 정보 캐시 관리")
+app.add_typer(cache_app, name="cache")
+
 
 @app.command()
 def tailor(
@@ -57,33 +42,59 @@ def tailor(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="상세 출력"),
 ) -> None:
     """채용공고에 맞춤화된 이력서를 생성합니다."""
-    if not jd.exists():
-        console.print(f"[red]채용공고 파일을 찾을 수 없습니다: {jd}[/red]")
-        raise typer.Exit(1)
-    if not resume.exists():
-        console.print(f"[red]이력서 파일을 찾을 수 없습니다: {resume}[/red]")
-        raise typer.Exit(1)
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from resume_tailor.cache.company_cache import CompanyCache
+    from resume_tailor.clients.llm_client import LLMClient
+    from resume_tailor.clients.search_client import SearchClient
+    from resume_tailor.config import load_config
+    from resume_tailor.parsers.jd_parser import load_jd_file
+    from resume_tailor.parsers.resume_parser import parse_resume
+    from resume_tailor.pipeline.orchestrator import PipelineOrchestrator
+    from resume_tailor.templates.docx_renderer import (
+        fill_docx_template,
+        generate_docx,
+        list_docx_placeholders,
+    )
+    from resume_tailor.templates.renderer import render_to_html, save_html
+    from resume_tailor.templates.smart_filler import smart_fill_docx
+
+    jd_stat = _stat_or_exit(jd, "채용공고 파일")
+    resume_stat = _stat_or_exit(resume, "이력서 파일")
+
+    async def _prepare():
+        # Config + cache DB open, JD read and resume parsing are independent
+        # blocking I/O; run them on worker threads so they overlap.
+        async def _open_cache():
+            cfg = await asyncio.to_thread(load_config)
+            db = await asyncio.to_thread(
+                CompanyCache,
+                db_path=cfg.cache.resolved_db_path,
+                ttl_days=cfg.cache.ttl_days,
+            )
+            return cfg, db
 
-    config = load_config()
-    jd_text = load_jd_file(str(jd))
-    resume_text = parse_resume(str(resume))
+        return await asyncio.gather(
+            _open_cache(),
+            asyncio.to_thread(load_jd_file, str(jd)),
+            asyncio.to_thread(parse_resume, str(resume)),
+        )
+
+    (config, cache), jd_text, resume_text = asyncio.run(_prepare())
 
     if verbose:
         console.print(f"[dim]회사: {company}[/dim]")
-        console.print(f"[dim]채용공고: {len(jd_text)}자[/dim]")
-        console.print(f"[dim]이력서: {len(resume_text)}자[/dim]")
+        console.print(f"[dim]채용공고: {len(jd_text)}자 ({jd_stat.st_size:,} bytes)[/dim]")
+        console.print(f"[dim]이력서: {len(resume_text)}자 ({resume_stat.st_size:,} bytes)[/dim]")
         console.print(f"[dim]템플릿: {template}[/dim]")
 
     # Check cache
-    cache = CompanyCache(
-        db_path=config.cache.resolved_db_path,
-        ttl_days=config.cache.ttl_days,
-    )
     cached_profile = cache.get(company)
     if cached_profile:
         console.print(f"[green]캐시된 회사 정보 사용: {company}[/green]")
 
-    llm = LLMClient(timeout=config.llm.timeout)
+    llm = LLMClient.from_config(config)
     search = SearchClient()
     orchestrator = PipelineOrchestrator(
         llm,
@@ -94,6 +105,17 @@ def tailor(
         max_rewrites=config.pipeline.max_rewrites,
     )
 
+    # A template without {{placeholders}} is filled by the LLM (smart fill),
+    # which must run before the client's connection pool is closed
+    docx_placeholders = list_docx_placeholders(docx) if docx and docx.exists() else []
+    smart_fill = docx is not None and docx.exists() and not docx_placeholders
+    smart_fill_error: Exception | None = None
+
+    def _output_path(job_title: str) -> Path:
+        if output is not None:
+            return output
+        return Path(f"./output/{company}_{job_title}.md".replace(" ", "_"))
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -104,24 +126,41 @@ def tailor(
         def on_phase(phase: str, detail: str) -> None:
             progress.update(task, description=detail)
 
-        result = asyncio.run(
-            orchestrator.run(
-                company_name=company,
-                jd_text=jd_text,
-                resume_text=resume_text,
-                template_name=template,
-                company_profile=cached_profile,
-                on_phase=on_phase,
-            )
-        )
+        async def _run():
+            nonlocal smart_fill_error
+            async with llm:
+                result = await orchestrator.run(
+                    company_name=company,
+                    jd_text=jd_text,
+                    resume_text=resume_text,
+                    template_name=template,
+                    company_profile=cached_profile,
+                    on_phase=on_phase,
+                )
+                if smart_fill:
+                    # Universal smart fill (LLM이 양식 구조 분석 → 자동 채움)
+                    on_phase("smart_fill", "양식 구조 분석 중 (LLM smart fill)...")
+                    docx_path = _output_path(result.job.title).with_suffix(".docx")
+                    try:
+                        await smart_fill_docx(
+                            template_path=docx,
+                            resume=result.resume,
+                            output_path=docx_path,
+                            llm=llm,
+                        )
+                    except Exception as exc:
+                        # Reported after the Markdown output has been saved
+                        smart_fill_error = exc
+                return result
+
+        result = asyncio.run(_run())
 
     # Cache company profile
     if not cached_profile:
         cache.put(company, result.company)
 
     # Determine output path
-    if output is None:
-        output = Path(f"./output/{company}_{result.job.title}.md".replace(" ", "_"))
+    output = _output_path(result.job.title)
 
     output.parent.mkdir(parents=True, exist_ok=True)
     output.write_text(result.resume.full_markdown, encoding="utf-8")
@@ -158,8 +197,7 @@ def tailor(
             console.print(f"[red]DOCX 템플릿을 찾을 수 없습니다: {docx}[/red]")
         else:
             docx_path = output.with_suffix(".docx")
-            placeholders = list_docx_placeholders(docx)
-            if placeholders:
+            if docx_placeholders:
                 # Placeholder-based template ({{자기소개}} 등)
                 fill_docx_template(
                     template_path=docx,
@@ -167,15 +205,10 @@ def tailor(
                     output_path=docx_path,
                 )
                 console.print(f"[green]DOCX 저장 (플레이스홀더): {docx_path}[/green]")
+            elif smart_fill_error is not None:
+                console.print(f"[red]DOCX smart fill 실패: {smart_fill_error}[/red]")
             else:
-                # Universal smart fill (LLM이 양식 구조 분석 → 자동 채움)
-                console.print("[dim]양식 구조 분석 중 (LLM smart fill)...[/dim]")
-                smart_fill_docx_sync(
-                    template_path=docx,
-                    resume=result.resume,
-                    output_path=docx_path,
-                    llm=llm,
-                )
+                # Filled by smart fill inside the pipeline's event loop above
                 console.print(f"[green]DOCX 저장 (smart fill): {docx_path}[/green]")
 
     # DOCX output — from scratch
@@ -188,24 +221,128 @@ def tailor(
         )
         console.print(f"[green]DOCX 저장: {docx_path}[/green]")
 
+    if smart_fill_error is not None:
+        raise typer.Exit(1)
+
+
+@app.command("tailor-batch")
+def tailor_batch(
+    jobs: list[str] = typer.Argument(help="'회사명=채용공고파일' 형식 (여러 개)"),
+    resume: Path = typer.Option(..., "--resume", help="내 이력서 파일 경로 (PDF/DOCX/TXT)"),
+    template: str = typer.Option("korean_standard", "--template", "-t", help="이력서 템플릿명"),
+    output_dir: Path = typer.Option(Path("./output"), "--output-dir", "-o", help="출력 디렉토리"),
+    concurrency: int = typer.Option(3, "--concurrency", help="동시에 실행할 파이프라인 수"),
+) -> None:
+    """하나의 이력서를 여러 채용공고에 맞춰 동시에 생성합니다.
+
+    사용법:
+      resume-tailor tailor-batch 네이버=./naver_jd.txt 카카오=./kakao_jd.txt --resume ./my_resume.pdf
+    """
+    from resume_tailor.cache.company_cache import CompanyCache
+    from resume_tailor.clients.llm_client import LLMClient
+    from resume_tailor.clients.search_client import SearchClient
+    from resume_tailor.config import load_config
+    from resume_tailor.parsers.jd_parser import load_jd_file
+    from resume_tailor.parsers.resume_parser import parse_resume
+    from resume_tailor.pipeline.orchestrator import PipelineOrchestrator
+
+    pairs = []
+    for job in jobs:
+        company, sep, jd_path = job.partition("=")
+        if not sep or not company or not jd_path:
+            console.print(f"[red]'회사명=채용공고파일' 형식이 아닙니다: {job}[/red]")
+            raise typer.Exit(1)
+        _stat_or_exit(Path(jd_path), "채용공고 파일")
+        pairs.append((company, jd_path))
+    _stat_or_exit(resume, "이력서 파일")
+
+    config = load_config()
+    cache = CompanyCache(
+        db_path=config.cache.resolved_db_path,
+        ttl_days=config.cache.ttl_days,
+    )
+    resume_text = parse_resume(str(resume))
+    cached = {company: cache.get(company) for company, _ in pairs}
+
+    llm = LLMClient.from_config(config)
+    search = SearchClient()
+    orchestrator = PipelineOrchestrator(
+        llm,
+        search,
+        haiku_model=config.llm.haiku_model,
+        sonnet_model=config.llm.sonnet_model,
+        qa_threshold=config.pipeline.qa_threshold,
+        max_rewrites=config.pipeline.max_rewrites,
+    )
+
+    run_jobs = [
+        {
+            "company_name": company,
+            "jd_text": load_jd_file(jd_path),
+            "resume_text": resume_text,
+            "template_name": template,
+            "company_profile": cached[company],
+        }
+        for company, jd_path in pairs
+    ]
+
+    async def _run():
+        async with llm:
+            return await orchestrator.run_batch(run_jobs, concurrency=concurrency)
+
+    with console.status(f"이력서 {len(pairs)}건 생성 중..."):
+        results = asyncio.run(_run())
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    researched = []
+    failed = False
+    for (company, _), result in zip(pairs, results):
+        if isinstance(result, BaseException):
+            console.print(f"[red]{company}: 실패 ({type(result).__name__}: {result})[/red]")
+            failed = True
+            continue
+        if cached[company] is None:
+            researched.append((company, result.company))
+        path = output_dir / f"{company}_{result.job.title}.md".replace(" ", "_")
+        path.write_text(result.resume.full_markdown, encoding="utf-8")
+        console.print(
+            f"[green]{company}: {path}[/green] "
+            f"(QA {result.qa.overall_score}점, {result.elapsed_seconds:.1f}초)"
+        )
+    cache.put_many(researched)
+
+    if failed:
+        raise typer.Exit(1)
+
 
 @app.command()
 def research(
-    company: str = typer.Argument(help="리서치할 회사명"),
+    companies: list[str] = typer.Argument(help="리서치할 회사명 (여러 개 가능)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="상세 출력"),
 ) -> None:
-    """회사 리서치만 실행합니다 (결과 캐시 저장)."""
+    """회사 리서치만 실행합니다 (결과 캐시 저장).
+
+    여러 회사를 지정하면 동시에 리서치한 뒤 한 번에 캐시에 저장합니다.
+    """
+    from rich.panel import Panel
+
+    from resume_tailor.cache.company_cache import CompanyCache
+    from resume_tailor.clients.llm_client import LLMClient
+    from resume_tailor.clients.search_client import SearchClient
+    from resume_tailor.config import load_config
+    from resume_tailor.pipeline.orchestrator import PipelineOrchestrator
+
     config = load_config()
     cache = CompanyCache(
         db_path=config.cache.resolved_db_path,
         ttl_days=config.cache.ttl_days,
     )
 
-    cached = cache.get(company)
-    if cached:
-        console.print(f"[yellow]이미 캐시된 정보가 있습니다 ({company}). 새로 검색합니다.[/yellow]")
+    for company in companies:
+        if cache.get(company):
+            console.print(f"[yellow]이미 캐시된 정보가 있습니다 ({company}). 새로 검색합니다.[/yellow]")
 
-    llm = LLMClient(timeout=config.llm.timeout)
+    llm = LLMClient.from_config(config)
     search = SearchClient()
     orchestrator = PipelineOrchestrator(
         llm,
@@ -214,26 +351,70 @@ def research(
         sonnet_model=config.llm.sonnet_model,
     )
 
+    async def _research():
+        async with llm:
+            return await asyncio.gather(
+                *(orchestrator.research_only(company) for company in companies),
+                return_exceptions=True,
+            )
+
     with console.status("회사 리서치 중..."):
-        profile = asyncio.run(orchestrator.research_only(company))
+        results = asyncio.run(_research())
 
-    cache.put(company, profile)
+    researched = []
+    for company, result in zip(companies, results):
+        if isinstance(result, BaseException):
+            console.print(f"[red]{company}: 실패 ({type(result).__name__}: {result})[/red]")
+        else:
+            researched.append((company, result))
+    cache.put_many(researched)
 
-    console.print(Panel(
-        f"[bold]{profile.name}[/bold] ({profile.industry})\n"
-        f"{profile.description}\n\n"
-        f"기업문화: {', '.join(profile.culture_values)}\n"
-        f"기술스택: {', '.join(profile.tech_stack)}\n"
-        f"사업방향: {profile.business_direction}\n"
-        f"최근소식: {', '.join(profile.recent_news[:3])}",
-        title="회사 프로필",
-    ))
-    console.print("[green]캐시에 저장되었습니다.[/green]")
+    for _, profile in researched:
+        console.print(Panel(
+            f"[bold]{profile.name}[/bold] ({profile.industry})\n"
+            f"{profile.description}\n\n"
+            f"기업문화: {', '.join(profile.culture_values)}\n"
+            f"기술스택: {', '.join(profile.tech_stack)}\n"
+            f"사업방향: {profile.business_direction}\n"
+            f"최근소식: {', '.join(profile.recent_news[:3])}",
+            title="회사 프로필",
+        ))
+    if researched:
+        console.print("[green]캐시에 저장되었습니다.[/green]")
+
+    if len(researched) < len(companies):
+        raise typer.Exit(1)
+
+
+@cache_app.command("vacuum")
+def cache_vacuum() -> None:
+    """만료된 캐시를 삭제하고 DB 파일을 정리합니다."""
+    from resume_tailor.cache.company_cache import CompanyCache
+    from resume_tailor.cache.llm_cache import LLMResponseCache
+    from resume_tailor.config import load_config
+
+    config = load_config()
+    # Purge LLM responses first so maintenance() vacuums their pages too
+    purged = LLMResponseCache(
+        db_path=config.cache.resolved_db_path,
+        ttl_days=config.cache.ttl_days,
+    ).purge_expired()
+    cache = CompanyCache(
+        db_path=config.cache.resolved_db_path,
+        ttl_days=config.cache.ttl_days,
+    )
+    purged += cache.maintenance()
+    stats = cache.stats()
+    console.print(
+        f"[green]캐시 정리 완료: 만료 {purged}건 삭제, 남은 항목 {stats['total']}건[/green]"
+    )
 
 
 @app.command()
 def templates() -> None:
     """사용 가능한 이력서 템플릿 목록을 표시합니다."""
+    from resume_tailor.templates.loader import list_templates, load_template
+
     names = list_templates()
     if not names:
         console.print("[yellow]템플릿이 없습니다.[/yellow]")
@@ -250,9 +431,9 @@ def docx_check(
     file: Path = typer.Argument(help="DOCX 템플릿 파일 경로"),
 ) -> None:
     """DOCX 템플릿의 {{플레이스홀더}} 목록을 확인합니다."""
-    if not file.exists():
-        console.print(f"[red]파일을 찾을 수 없습니다: {file}[/red]")
-        raise typer.Exit(1)
+    from resume_tailor.templates.docx_renderer import list_docx_placeholders
+
+    _stat_or_exit(file, "파일")
 
     placeholders = list_docx_placeholders(file)
     if not placeholders:
@@ -280,6 +461,9 @@ def fill_form(
     company: str = typer.Option("", "--company", "-c", help="회사명 (선택)"),
     output: Path = typer.Option(None, "--output", "-o", help="결과 저장 경로 (.txt)"),
     auto_fill: bool = typer.Option(False, "--auto-fill", help="브라우저를 열고 폼에 자동 입력"),
+    batch: bool = typer.Option(
+        False, "--batch", help="Message Batches API로 답변 생성 (비용 50% 절감, 수 분 소요)"
+    ),
 ) -> None:
     """채용 지원서 문항에 맞는 답변을 생성합니다.
 
@@ -292,10 +476,24 @@ def fill_form(
 
       # 대화형 (직접 붙여넣기)
       resume-tailor fill-form --resume ./my_resume.pdf
+
+      # 배치 API로 저렴하게 생성 (결과까지 수 분 소요)
+      resume-tailor fill-form --resume ./my_resume.pdf --questions ./questions.txt --batch
     """
-    if not resume.exists():
-        console.print(f"[red]이력서 파일을 찾을 수 없습니다: {resume}[/red]")
-        raise typer.Exit(1)
+    import json
+    import threading
+
+    from rich.panel import Panel
+
+    from resume_tailor.clients.llm_client import LLMClient
+    from resume_tailor.config import load_config
+    from resume_tailor.models.resume import TailoredResume
+    from resume_tailor.parsers.form_parser import extract_from_url_sync, parse_text
+    from resume_tailor.parsers.jd_parser import load_jd_file
+    from resume_tailor.parsers.resume_parser import parse_resume
+    from resume_tailor.pipeline.form_filler import extract_structured_fields, generate_form_answers
+
+    _stat_or_exit(resume, "이력서 파일")
 
     # Load resume
     if resume.suffix == ".md":
@@ -303,10 +501,22 @@ def fill_form(
     else:
         md_content = parse_resume(str(resume))
 
-    tailored = TailoredResume(
-        full_markdown=md_content,
-        sections=[ResumeSection(id="full", label="전체", content=md_content)],
-        metadata={},
+    tailored = TailoredResume.from_markdown(md_content)
+
+    # Structured fields depend only on the resume, so extract them on a
+    # background event loop (with its own client) while questions are
+    # fetched or pasted. The thread is a daemon so Ctrl-C or an early exit
+    # never waits for the call; the exit path also cancels it.
+    config = load_config()
+
+    async def _extract_structured():
+        async with LLMClient.from_config(config) as structured_llm:
+            return await extract_structured_fields(structured_llm, tailored)
+
+    structured_loop = asyncio.new_event_loop()
+    threading.Thread(target=structured_loop.run_forever, daemon=True).start()
+    structured_future = asyncio.run_coroutine_threadsafe(
+        _extract_structured(), structured_loop
     )
 
     # Load JD if provided
@@ -320,7 +530,7 @@ def fill_form(
     if url:
         with console.status("페이지에서 문항 추출 중..."):
             try:
-                form_questions = asyncio.run(extract_from_url(url))
+                form_questions = extract_from_url_sync(url)
             except Exception as e:
                 console.print(f"[red]URL 접근 실패: {e}[/red]")
                 console.print("[yellow]문항을 직접 입력해주세요.[/yellow]")
@@ -331,26 +541,20 @@ def fill_form(
 
     if not form_questions:
         # Interactive mode
-        console.print("\n[bold]문항을 붙여넣기 하세요[/bold] (빈 줄 2개로 종료):\n")
-        lines: list[str] = []
-        empty_count = 0
+        console.print(
+            "\n[bold]문항을 붙여넣기 하세요[/bold] "
+            "(입력 후 Ctrl-D, Windows는 Ctrl-Z + Enter로 종료):\n"
+        )
         try:
-            while True:
-                line = input()
-                if not line.strip():
-                    empty_count += 1
-                    if empty_count >= 2:
-                        break
-                else:
-                    empty_count = 0
-                lines.append(line)
-        except (EOFError, KeyboardInterrupt):
-            pass
-
-        if lines:
-            form_questions = parse_text("\n".join(lines))
+            pasted = sys.stdin.read()
+        except KeyboardInterrupt:
+            pasted = ""
+
+        if pasted.strip():
+            form_questions = parse_text(pasted)
 
     if not form_questions:
+        structured_future.cancel()
         console.print("[red]문항을 찾을 수 없습니다.[/red]")
         raise typer.Exit(1)
 
@@ -360,27 +564,26 @@ def fill_form(
         limit_str = f" [dim]({q.max_length}자)[/dim]" if q.max_length else ""
         console.print(f"  {i}. {q.label}{limit_str}")
 
-    # Generate answers + structured data
-    config = load_config()
-    llm = LLMClient(timeout=config.llm.timeout)
-
-    async def _run_all():
-        import asyncio as aio
-        structured_task = extract_structured_fields(llm, tailored)
-        answers_task = generate_form_answers(
-            llm=llm,
-            questions=form_questions,
-            resume=tailored,
-            jd_text=jd_text,
-            company_name=company,
-        )
-        return await aio.gather(structured_task, answers_task)
+    # Generate answers; structured data has been extracting meanwhile
+    async def _answer():
+        async with LLMClient.from_config(config) as llm:
+            return await generate_form_answers(
+                llm=llm,
+                questions=form_questions,
+                resume=tailored,
+                jd_text=jd_text,
+                company_name=company,
+                batch=batch,
+            )
 
     with console.status("구조화 데이터 추출 + 답변 생성 중..."):
-        structured, answers = asyncio.run(_run_all())
+        answers = asyncio.run(_answer())
+        structured = structured_future.result()
+    structured_loop.call_soon_threadsafe(structured_loop.stop)
 
     # --- Display structured fields ---
     result_parts = []
+    structured_json = json.dumps(structured, ensure_ascii=False, indent=2) if structured else ""
 
     if structured:
         console.print("\n[bold]== 구조화 필드 (복붙용) ==[/bold]\n")
@@ -448,8 +651,7 @@ def fill_form(
 
         # Build structured section for file output
         result_parts.append("# 구조화 필드\n")
-        import json
-        result_parts.append(f"```json\n{json.dumps(structured, ensure_ascii=False, indent=2)}\n```\n")
+        result_parts.append(f"```json\n{structured_json}\n```\n")
 
     # --- Display essay answers ---
     console.print("\n[bold]== 서술형 답변 ==[/bold]\n")
@@ -481,11 +683,10 @@ def fill_form(
     # Build plain text output — easy to copy-paste
     txt_parts = []
     if structured:
-        import json
         txt_parts.append("=" * 50)
         txt_parts.append("구조화 필드 (JSON)")
         txt_parts.append("=" * 50)
-        txt_parts.append(json.dumps(structured, ensure_ascii=False, indent=2))
+        txt_parts.append(structured_json)
         txt_parts.append("")
 
     for i, ans in enumerate(answers, 1):
@@ -507,14 +708,25 @@ def fill_form(
     #     console.print(f"[green]{filled}개 필드 자동 입력 완료[/green]")
 
 
+def _stat_or_exit(path: Path, label: str) -> os.stat_result:
+    """Stat an input file, exiting with an error message if it is missing."""
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        console.print(f"[red]{label}을 찾을 수 없습니다: {path}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command()
 def preview(
     file: Path = typer.Argument(help="미리보기할 마크다운 파일"),
 ) -> None:
     """생성된 이력서를 HTML로 변환하여 브라우저에서 미리봅니다."""
-    if not file.exists():
-        console.print(f"[red]파일을 찾을 수 없습니다: {file}[/red]")
-        raise typer.Exit(1)
+    import webbrowser
+
+    from resume_tailor.templates.renderer import render_to_html, save_html
+
+    _stat_or_exit(file, "파일")
 
     md_content = file.read_text(encoding="utf-8")
     html_path = file.with_suffix(".html")
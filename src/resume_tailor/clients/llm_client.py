@@ -2,17 +2,142 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import contextlib
+import functools
+import importlib.util
+import io
+import json
 import logging
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import anthropic
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
 
+from resume_tailor.cache.llm_cache import LLMResponseCache, make_key
 from resume_tailor.utils.json_parser import extract_json
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
+    from resume_tailor.config import AppConfig
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Pipeline phases run back-to-back with multi-second gaps, so keep idle
+# connections around long enough to be reused by the next call.
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=32,
+    max_keepalive_connections=16,
+    keepalive_expiry=60.0,
+)
+
+
+# Images whose longest edge exceeds this are resized server-side anyway;
+# shrinking them first cuts upload size and billed image tokens.
+MAX_IMAGE_EDGE = 1568
+_PIL_FORMATS = {"image/png": "PNG", "image/jpeg": "JPEG", "image/webp": "WEBP"}
+
+# Token logs of clients whose usage the current task tracks on its own; see
+# LLMClient.track_task_usage()
+_TASK_TOKEN_LOGS: ContextVar[dict[LLMClient, list] | None] = ContextVar(
+    "task_token_logs", default=None
+)
+
+
+def _fit_image(image_bytes: bytes, media_type: str) -> bytes:
+    """Downscale an image to ``MAX_IMAGE_EDGE`` on its longest side.
+
+    Returns the original bytes when the image is already small enough, the
+    format is not re-encodable (e.g. animated GIF) or it cannot be decoded.
+    """
+    fmt = _PIL_FORMATS.get(media_type)
+    if fmt is None:
+        return image_bytes
+
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            if max(img.size) <= MAX_IMAGE_EDGE:
+                return image_bytes
+            img.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE))
+            if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            out = io.BytesIO()
+            img.save(out, format=fmt)
+    except OSError:
+        logger.warning("Could not decode %s image; sending as-is", media_type)
+        return image_bytes
+    return out.getvalue()
+
+
+def _log_api_error(what: str, exc: Exception) -> None:
+    """Log an API failure according to whether it was worth retrying.
+
+    The SDK already retried connection errors, 408/409/429 and 5xx with
+    backoff; anything else (auth, bad request) failed on the first attempt.
+    """
+    if isinstance(exc, (anthropic.APIConnectionError, anthropic.RateLimitError)):
+        logger.warning("%s failed after retries: %s", what, exc)
+    elif isinstance(exc, anthropic.APIStatusError):
+        logger.error("%s rejected (HTTP %d): %s", what, exc.status_code, exc.message)
+    else:
+        logger.error("%s failed", what, exc_info=True)
+
+
+def _usage_entry(model: str, usage: anthropic.types.Usage) -> tuple[str, int, int, int, int]:
+    """Flatten API usage into a token-log entry.
+
+    ``input_tokens`` excludes prompt-cache reads and writes, which are
+    reported (and billed) separately.
+    """
+    return (
+        model,
+        usage.input_tokens,
+        usage.output_tokens,
+        usage.cache_read_input_tokens or 0,
+        usage.cache_creation_input_tokens or 0,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _shared_response_cache(db_path: Path, ttl_days: int) -> LLMResponseCache:
+    # One cache per database per process, so its in-memory tier outlives the
+    # short-lived clients built for each CLI command or Streamlit action
+    return LLMResponseCache(db_path=db_path, ttl_days=ttl_days)
+
+
+@functools.cache
+def _schema_tool(schema: type[BaseModel]) -> dict:
+    """Tool definition whose input schema is the given Pydantic model."""
+    return {
+        "name": f"emit_{schema.__name__}",
+        "description": f"Return the result as a {schema.__name__} object.",
+        "input_schema": schema.model_json_schema(by_alias=True),
+    }
+
+
+def _message_text(message: anthropic.types.Message) -> str:
+    """Response text, or the serialized input of a forced tool call."""
+    for block in message.content:
+        if block.type == "tool_use":
+            return json.dumps(block.input, ensure_ascii=False)
+    return message.content[0].text
+
+
+# Stop reasons of a complete reply; only those are stored in the response cache
+_COMPLETE_STOP_REASONS = frozenset({"end_turn", "tool_use"})
+
 
 @dataclass
 class LLMResponse:
@@ -21,44 +146,119 @@ class LLMResponse:
     text: str
     input_tokens: int
     output_tokens: int
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
 
 
 class LLMClient:
-    """Async Claude API client with exponential-backoff retries."""
+    """Async Claude API client with exponential-backoff retries.
+
+    Retries (with jittered backoff on connection errors, 408/409/429 and
+    5xx responses) are handled by the anthropic SDK's transport layer.
+    """
 
-    def __init__(self, api_key: str | None = None, timeout: float | None = None):
-        kwargs: dict = {}
+    def __init__(
+        self,
+        api_key: str | None = None,
+        timeout: float | None = None,
+        max_retries: int = 3,
+        cache: LLMResponseCache | None = None,
+    ):
+        kwargs: dict = {"max_retries": max_retries}
         if api_key is not None:
             kwargs["api_key"] = api_key
         if timeout is not None:
             kwargs["timeout"] = timeout
+        kwargs["http_client"] = anthropic.DefaultAsyncHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=_CONNECTION_LIMITS,
+        )
         self.client = anthropic.AsyncAnthropic(**kwargs)
-        self._token_log: list[tuple[str, int, int]] = []  # (model, input_tokens, output_tokens)
+        # (model, input_tokens, output_tokens, cache_read_tokens, cache_creation_tokens)
+        self._client_token_log: list[tuple[str, int, int, int, int]] = []
+        self.cache = cache
+        self._cache_hits = 0
+        self._cache_misses = 0
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(min=1, max=10),
-        reraise=True,
-    )
-    async def _call_api(
-        self,
+    async def __aenter__(self) -> LLMClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections.
+
+        Connections belong to the event loop that opened them, so call this
+        (or use the client as an async context manager) inside the last
+        loop that used the client.
+        """
+        await self.client.close()
+
+    @classmethod
+    def from_config(cls, config: AppConfig) -> LLMClient:
+        """Build a client from app config, attaching the response cache if enabled."""
+        cache = None
+        if config.cache.llm_responses:
+            cache = _shared_response_cache(
+                config.cache.resolved_db_path, config.cache.ttl_days
+            )
+        return cls(
+            timeout=config.llm.timeout,
+            max_retries=config.llm.max_retries,
+            cache=cache,
+        )
+
+    @staticmethod
+    def _build_request(
         prompt: str,
         system: str,
         model: str,
         temperature: float,
         max_tokens: int,
-    ) -> anthropic.types.Message:
-        """Make the actual API call with retry logic."""
-        messages = [{"role": "user", "content": prompt}]
+        cache_system: bool = False,
+        tool: dict | None = None,
+    ) -> dict:
+        """Build Messages API kwargs.
+
+        With ``cache_system`` the system prompt is marked as an ephemeral
+        prompt-cache breakpoint, so repeat calls sharing it only pay full
+        input price for the user prompt. With ``tool`` the model is forced
+        to answer through that tool, so its output follows the schema.
+        """
         kwargs: dict = {
             "model": model,
             "max_tokens": max_tokens,
             "temperature": temperature,
-            "messages": messages,
+            "messages": [{"role": "user", "content": prompt}],
         }
-        if system:
+        if system and cache_system:
+            kwargs["system"] = [
+                {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}
+            ]
+        elif system:
             kwargs["system"] = system
-        return await self.client.messages.create(**kwargs)
+        if tool is not None:
+            kwargs["tools"] = [tool]
+            kwargs["tool_choice"] = {"type": "tool", "name": tool["name"]}
+        return kwargs
+
+    async def _call_api(
+        self,
+        prompt: str,
+        system: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        cache_system: bool = False,
+        tool: dict | None = None,
+    ) -> anthropic.types.Message:
+        """Make the actual API call."""
+        return await self.client.messages.create(
+            **self._build_request(
+                prompt, system, model, temperature, max_tokens, cache_system, tool
+            )
+        )
 
     async def generate(
         self,
@@ -67,8 +267,25 @@ class LLMClient:
         model: str = "claude-haiku-4-5-20251001",
         temperature: float = 0.0,
         max_tokens: int = 8192,
+        cache_system: bool = False,
+        tool: dict | None = None,
     ) -> LLMResponse:
-        """Send a prompt to Claude and return the text response with usage."""
+        """Send a prompt to Claude and return the text response with usage.
+
+        With a forced ``tool`` the text is the tool input serialized as JSON.
+        Deterministic calls (temperature 0) are served from the response
+        cache when one is attached; cache hits are not added to the token log.
+        """
+        key = self._cache_key(model, system, prompt, temperature, max_tokens, tool)
+        if key is not None:
+            hit = self.cache.get(key)
+            if hit is not None:
+                self._cache_hits += 1
+                logger.debug("LLM cache hit: model=%s", model)
+                text, input_tokens, output_tokens = hit
+                return LLMResponse(text=text, input_tokens=input_tokens, output_tokens=output_tokens)
+            self._cache_misses += 1
+
         logger.debug("LLM call: model=%s", model)
         try:
             message = await self._call_api(
@@ -77,20 +294,164 @@ class LLMClient:
                 model=model,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                cache_system=cache_system,
+                tool=tool,
             )
-        except Exception:
-            logger.error("LLM call failed", exc_info=True)
+        except Exception as exc:
+            _log_api_error("LLM call", exc)
             raise
-        input_tokens = message.usage.input_tokens
-        output_tokens = message.usage.output_tokens
-        logger.debug("LLM response: %d input, %d output tokens", input_tokens, output_tokens)
-        self._token_log.append((model, input_tokens, output_tokens))
+        entry = _usage_entry(model, message.usage)
+        _, input_tokens, output_tokens, cache_read, cache_creation = entry
+        logger.debug(
+            "LLM response: %d input (%d cache read, %d cache write), %d output tokens",
+            input_tokens, cache_read, cache_creation, output_tokens,
+        )
+        self._token_log.append(entry)
+        text = _message_text(message)
+        # A reply cut off by max_tokens (or otherwise incomplete) must not be
+        # replayed for the whole TTL
+        if key is not None and message.stop_reason in _COMPLETE_STOP_REASONS:
+            self.cache.put(key, text, input_tokens, output_tokens)
         return LLMResponse(
-            text=message.content[0].text,
+            text=text,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cache_read_tokens=cache_read,
+            cache_creation_tokens=cache_creation,
         )
 
+    def _cache_key(
+        self,
+        model: str,
+        system: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        tool: dict | None,
+    ) -> str | None:
+        """Response-cache key, or None when the request is not cacheable."""
+        if self.cache is None or temperature != 0.0:
+            return None
+        return make_key(model, system, prompt, max_tokens, tool["name"] if tool else "")
+
+    async def generate_many(
+        self, jobs: list[dict], concurrency: int = 8
+    ) -> list[LLMResponse]:
+        """Run independent ``generate`` calls concurrently.
+
+        Each job is a dict of ``generate`` keyword arguments. At most
+        ``concurrency`` requests are in flight at once; results are returned
+        in job order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(job: dict) -> LLMResponse:
+            async with sem:
+                return await self.generate(**job)
+
+        return await asyncio.gather(*(_one(job) for job in jobs))
+
+    async def batch_generate(
+        self,
+        jobs: list[dict],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+    ) -> list[LLMResponse | None]:
+        """Run ``generate`` jobs through the Message Batches API.
+
+        Batches are billed at half the real-time price but may take minutes
+        to finish, so this is for non-interactive bulk work only. Each job is
+        a dict of ``generate`` keyword arguments; its index is the batch
+        ``custom_id``. The batch is polled with exponential backoff capped at
+        ``max_poll_interval`` seconds. Results are returned in job order,
+        with ``None`` for requests that errored, expired or were cancelled.
+        Batch calls bypass the response cache.
+        """
+        requests = [
+            {
+                "custom_id": str(i),
+                "params": self._build_request(
+                    job["prompt"],
+                    job.get("system", ""),
+                    job.get("model", "claude-haiku-4-5-20251001"),
+                    job.get("temperature", 0.0),
+                    job.get("max_tokens", 8192),
+                    job.get("cache_system", False),
+                    job.get("tool"),
+                ),
+            }
+            for i, job in enumerate(jobs)
+        ]
+        try:
+            batch = await self.client.messages.batches.create(requests=requests)
+            logger.debug("LLM batch %s submitted: %d requests", batch.id, len(requests))
+            delay = poll_interval
+            while batch.processing_status != "ended":
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+
+            results: list[LLMResponse | None] = [None] * len(jobs)
+            async for entry in await self.client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    logger.warning(
+                        "LLM batch request %s %s", entry.custom_id, entry.result.type
+                    )
+                    continue
+                index = int(entry.custom_id)
+                message = entry.result.message
+                usage = _usage_entry(requests[index]["params"]["model"], message.usage)
+                self._token_log.append(usage)
+                _, input_tokens, output_tokens, cache_read, cache_creation = usage
+                results[index] = LLMResponse(
+                    text=_message_text(message),
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    cache_read_tokens=cache_read,
+                    cache_creation_tokens=cache_creation,
+                )
+        except Exception as exc:
+            _log_api_error("LLM batch", exc)
+            raise
+        return results
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        system: str = "",
+        model: str = "claude-haiku-4-5-20251001",
+        temperature: float = 0.0,
+        max_tokens: int = 8192,
+        cache_system: bool = False,
+    ) -> AsyncIterator[str]:
+        """Stream the text response chunk by chunk as it is generated.
+
+        Usage is recorded in the token log once the stream completes. Closing
+        the iterator early aborts the request; usage seen up to that point is
+        still recorded. Stream calls bypass the response cache.
+        """
+        logger.debug("LLM stream: model=%s", model)
+        request = self._build_request(prompt, system, model, temperature, max_tokens, cache_system)
+        message = None
+        try:
+            async with self.client.messages.stream(**request) as stream:
+                try:
+                    async for text in stream.text_stream:
+                        yield text
+                    message = await stream.get_final_message()
+                finally:
+                    if message is None:
+                        # Closed early by the caller or failed mid-stream
+                        with contextlib.suppress(Exception):
+                            message = stream.current_message_snapshot
+                    if message is not None:
+                        entry = _usage_entry(model, message.usage)
+                        logger.debug("LLM response: %d input, %d output tokens", entry[1], entry[2])
+                        self._token_log.append(entry)
+        except Exception as exc:
+            _log_api_error("LLM stream", exc)
+            raise
+
     async def generate_json(
         self,
         prompt: str,
@@ -98,22 +459,33 @@ class LLMClient:
         model: str = "claude-haiku-4-5-20251001",
         temperature: float = 0.0,
         max_tokens: int = 8192,
+        cache_system: bool = False,
+        schema: type[BaseModel] | None = None,
     ) -> dict:
-        """Send a prompt and parse JSON from response."""
+        """Send a prompt and parse JSON from response.
+
+        With ``schema`` the call uses forced tool use, so the API returns
+        arguments matching the model's JSON schema instead of free text.
+        """
+        tool = _schema_tool(schema) if schema is not None else None
         response = await self.generate(
             prompt=prompt,
             system=system,
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
+            cache_system=cache_system,
+            tool=tool,
         )
-        return extract_json(response.text)
+        try:
+            return extract_json(response.text)
+        except ValueError:
+            # Drop the unparseable reply so a retry reaches the API again
+            key = self._cache_key(model, system, prompt, temperature, max_tokens, tool)
+            if key is not None:
+                self.cache.delete(key)
+            raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(min=1, max=10),
-        reraise=True,
-    )
     async def extract_text_from_image(
         self,
         image_bytes: bytes,
@@ -130,44 +502,77 @@ class LLMClient:
         Returns:
             Extracted text preserving structure and formatting.
         """
-        b64_data = base64.b64encode(image_bytes).decode("utf-8")
+        image_bytes = _fit_image(image_bytes, image_media_type)
+        b64_data = base64.b64encode(image_bytes).decode("ascii")
 
-        message = await self.client.messages.create(
-            model=model,
-            max_tokens=4096,
-            messages=[{
-                "role": "user",
-                "content": [
-                    {
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": image_media_type,
-                            "data": b64_data,
+        try:
+            message = await self.client.messages.create(
+                model=model,
+                max_tokens=4096,
+                messages=[{
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "image",
+                            "source": {
+                                "type": "base64",
+                                "media_type": image_media_type,
+                                "data": b64_data,
+                            },
                         },
-                    },
-                    {
-                        "type": "text",
-                        "text": (
-                            "이 채용공고 이미지의 모든 텍스트를 정확히 추출하세요. "
-                            "원본의 구조와 포맷(제목, 목록, 표 등)을 최대한 유지하세요. "
-                            "추출된 텍스트만 출력하고, 설명이나 코멘트는 추가하지 마세요."
-                        ),
-                    },
-                ],
-            }],
-        )
-        input_tokens = message.usage.input_tokens
-        output_tokens = message.usage.output_tokens
-        self._token_log.append((model, input_tokens, output_tokens))
+                        {
+                            "type": "text",
+                            "text": (
+                                "이 채용공고 이미지의 모든 텍스트를 정확히 추출하세요. "
+                                "원본의 구조와 포맷(제목, 목록, 표 등)을 최대한 유지하세요. "
+                                "추출된 텍스트만 출력하고, 설명이나 코멘트는 추가하지 마세요."
+                            ),
+                        },
+                    ],
+                }],
+            )
+        except Exception as exc:
+            _log_api_error("Vision call", exc)
+            raise
+        self._token_log.append(_usage_entry(model, message.usage))
         return message.content[0].text
 
+    @property
+    def _token_log(self) -> list[tuple[str, int, int, int, int]]:
+        logs = _TASK_TOKEN_LOGS.get()
+        if logs is not None and self in logs:
+            return logs[self]
+        return self._client_token_log
+
+    @_token_log.setter
+    def _token_log(self, log: list[tuple[str, int, int, int, int]]) -> None:
+        self._client_token_log = log
+
+    def track_task_usage(self) -> None:
+        """Keep token usage of the current task separate from the client's.
+
+        From now on, calls made by the current asyncio task (and tasks it
+        starts) are logged apart, and ``get_token_summary()`` inside that
+        task reports only them. This lets concurrent pipeline runs share one
+        client and still report their own usage. Cache hit/miss counters
+        stay client-wide.
+        """
+        logs = _TASK_TOKEN_LOGS.get() or {}
+        _TASK_TOKEN_LOGS.set({**logs, self: []})
+
     def get_token_summary(self) -> dict:
-        """Return accumulated token usage and reset the log."""
+        """Return accumulated token usage and cache stats, and reset them."""
+        log = self._token_log
         summary = {
-            "input": sum(t[1] for t in self._token_log),
-            "output": sum(t[2] for t in self._token_log),
-            "calls": list(self._token_log),
+            "input": sum(t[1] for t in log),
+            "output": sum(t[2] for t in log),
+            "cache_read": sum(t[3] for t in log),
+            "cache_creation": sum(t[4] for t in log),
+            "calls": list(log),
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
         }
-        self._token_log.clear()
+        log.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
         return summary
@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
+import importlib.util
 import logging
 import os
+from contextvars import ContextVar
+from operator import itemgetter
 
+import httpx
 from tavily import AsyncTavilyClient
 
 logger = logging.getLogger(__name__)
 
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=16, max_keepalive_connections=8, keepalive_expiry=60.0
+)
+
+_RESULT_KEYS = ("title", "url", "content")
+_get_result_fields = itemgetter(*_RESULT_KEYS)
+
+# Search counts of clients whose usage the current task tracks on its own;
+# see SearchClient.track_task_usage()
+_TASK_SEARCH_COUNTS: ContextVar[dict[SearchClient, int] | None] = ContextVar(
+    "task_search_counts", default=None
+)
+
 
 class SearchClient:
     """Async Tavily search client."""
@@ -19,7 +37,13 @@ class SearchClient:
             raise ValueError(
                 "Tavily API key required. Set TAVILY_API_KEY env var or pass api_key."
             )
-        self.client = AsyncTavilyClient(api_key=key)
+        # Own pooled transport so research fan-out reuses one (HTTP/2 when
+        # h2 is installed) connection. Tavily sets its auth header on this
+        # client, so it must not be shared with other API clients.
+        self._http = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE, limits=_CONNECTION_LIMITS, timeout=60.0
+        )
+        self.client = AsyncTavilyClient(api_key=key, client=self._http)
         self._search_count: int = 0
 
     async def search(
@@ -30,7 +54,11 @@ class SearchClient:
     ) -> list[dict]:
         """Search and return list of {title, url, content} dicts."""
         logger.info("Searching: %s", query)
-        self._search_count += 1
+        counts = _TASK_SEARCH_COUNTS.get()
+        if counts is not None and self in counts:
+            counts[self] += 1
+        else:
+            self._search_count += 1
         try:
             response = await self.client.search(
                 query=query,
@@ -41,12 +69,26 @@ class SearchClient:
             logger.error("Search failed", exc_info=True)
             raise
         return [
-            {"title": r["title"], "url": r["url"], "content": r["content"]}
-            for r in response.get("results", [])
+            dict(zip(_RESULT_KEYS, _get_result_fields(r)))
+            for r in response.get("results", ())
         ]
 
+    def track_task_usage(self) -> None:
+        """Count searches of the current task apart from the client's total.
+
+        Searches made by the current asyncio task (and tasks it starts) are
+        then reported only by ``get_search_count()`` calls inside that task.
+        """
+        counts = _TASK_SEARCH_COUNTS.get() or {}
+        _TASK_SEARCH_COUNTS.set({**counts, self: 0})
+
     def get_search_count(self) -> int:
         """Return accumulated search count and reset the counter."""
+        counts = _TASK_SEARCH_COUNTS.get()
+        if counts is not None and self in counts:
+            count = counts[self]
+            counts[self] = 0
+            return count
         count = self._search_count
         self._search_count = 0
         return count
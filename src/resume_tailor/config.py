@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
 
 @dataclass(frozen=True)
 class LLMConfig:
@@ -34,6 +40,7 @@ class PipelineConfig:
 class CacheConfig:
     ttl_days: int = 7
     db_path: str = "~/.resume-tailor/cache.db"
+    llm_responses: bool = True  # cache temperature-0 LLM responses in db_path
 
     @property
     def resolved_db_path(self) -> Path:
@@ -49,23 +56,43 @@ class AppConfig:
 
 
 def load_config(path: str | Path | None = None) -> AppConfig:
-    """Load config from YAML file, falling back to defaults."""
-    if path is None:
-        # Look for config.yaml relative to the project root
-        candidates = [
-            Path.cwd() / "config.yaml",
-            Path(__file__).resolve().parent.parent.parent.parent / "config.yaml",
-        ]
-        for c in candidates:
-            if c.exists():
-                path = c
-                break
+    """Load config from YAML file, falling back to defaults.
 
+    Results are memoized per (path, mtime, size), so repeated loads are
+    free and edits to the file are picked up on the next call. The
+    returned config is frozen.
+    """
+    if path is None:
+        path = _default_config_path(Path.cwd())
+    if path is None:
+        return _build_config(None, None)
+    p = Path(path)
+    try:
+        st = p.stat()
+    except OSError:
+        return _build_config(None, None)
+    return _build_config(str(p), (st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=8)
+def _default_config_path(cwd: Path) -> Path | None:
+    """Find config.yaml relative to ``cwd`` or the project root."""
+    candidates = [
+        cwd / "config.yaml",
+        Path(__file__).resolve().parent.parent.parent.parent / "config.yaml",
+    ]
+    for c in candidates:
+        if c.exists():
+            return c
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def _build_config(path: str | None, stamp: tuple[int, int] | None) -> AppConfig:
+    """Parse and validate config; ``stamp`` only serves as a cache key."""
     raw: dict = {}
     if path is not None:
-        p = Path(path)
-        if p.exists():
-            raw = yaml.safe_load(p.read_text()) or {}
+        raw = yaml.load(Path(path).read_bytes(), Loader=_Loader) or {}
 
     config = AppConfig(
         llm=LLMConfig(**raw.get("llm", {})),
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import html
+import functools
 import logging
-import re
+from html.parser import HTMLParser
 from io import BytesIO
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
-from fpdf import FPDF
+if TYPE_CHECKING:
+    from fpdf import FPDF
 
 logger = logging.getLogger(__name__)
 
@@ -29,18 +31,21 @@ _KOREAN_FONT_PATHS = [
 ]
 
 
+@functools.cache
 def _find_korean_font() -> str | None:
-    """Search for a Korean-capable TTF/TTC font on the system."""
+    """Search for a Korean-capable TTF/TTC font on the system (once per process)."""
     for path in _KOREAN_FONT_PATHS:
         if Path(path).exists() and (path.endswith(".ttf") or path.endswith(".ttc")):
             return path
     return None
 
 
-def html_to_pdf_fpdf2(html_content: str) -> bytes:
-    """Fallback PDF generation using fpdf2 when WeasyPrint is unavailable."""
-    body_match = re.search(r"<body>(.*?)</body>", html_content, re.DOTALL)
-    body = body_match.group(1) if body_match else html_content
+def html_to_pdf_fpdf2(html_content: str, target: BinaryIO | None = None) -> bytes | None:
+    """Fallback PDF generation using fpdf2 when WeasyPrint is unavailable.
+
+    Returns the PDF bytes, or writes into ``target`` and returns ``None``.
+    """
+    from fpdf import FPDF
 
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=20)
@@ -58,7 +63,7 @@ def html_to_pdf_fpdf2(html_content: str) -> bytes:
 
     pdf.set_font(font_name, size=10)
 
-    lines = _parse_html_to_lines(body)
+    lines = _parse_html_to_lines(html_content)
     for line_type, text in lines:
         safe_text = _safe_text(text, pdf)
         try:
@@ -88,6 +93,9 @@ def html_to_pdf_fpdf2(html_content: str) -> bytes:
         except Exception:
             logger.debug("Failed to render line: %s %s", line_type, safe_text[:30])
 
+    if target is not None:
+        pdf.output(target)
+        return None
     buf = BytesIO()
     pdf.output(buf)
     return buf.getvalue()
@@ -105,40 +113,70 @@ def _safe_text(text: str, pdf: FPDF) -> str:
         return text.encode("latin-1", errors="replace").decode("latin-1")
 
 
-def _parse_html_to_lines(body_html: str) -> list[tuple[str, str]]:
-    """Parse simple HTML into (type, text) pairs."""
-    lines: list[tuple[str, str]] = []
-    parts = re.split(r"(</?(?:h[1-3]|p|li|ul|ol|br\s*/?)>)", body_html)
-    current_tag = "text"
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        tag_match = re.match(r"<(/?)(h[1-3]|p|li|ul|ol|br\s*/?)>", part)
-        if tag_match:
-            closing = tag_match.group(1) == "/"
-            tag = tag_match.group(2).rstrip("/").strip()
-            if closing:
-                if tag in ("ul", "ol"):
-                    lines.append(("break", ""))
-                current_tag = "text"
-            else:
-                if tag in ("h1", "h2", "h3"):
-                    current_tag = tag
-                elif tag == "li":
-                    current_tag = "bullet"
-                elif tag in ("br", "br /"):
-                    lines.append(("break", ""))
-                elif tag == "p":
-                    current_tag = "text"
+_HEADINGS = frozenset({"h1", "h2", "h3"})
+_BLOCK_TAGS = frozenset({"h1", "h2", "h3", "p", "li", "ul", "ol", "br"})
+_SKIP_TAGS = frozenset({"head", "style", "script", "title"})
+
+
+class _LineParser(HTMLParser):
+    """Single-pass HTML → (type, text) line splitter.
+
+    Text between block-level tags becomes one line; inline markup such as
+    ``<strong>`` is dropped and entities are decoded by the parser.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.lines: list[tuple[str, str]] = []
+        self._mode = "text"
+        self._buf: list[str] = []
+        self._skip = 0
+
+    def _flush(self) -> None:
+        text = "".join(self._buf).strip()
+        self._buf.clear()
+        if text:
+            self.lines.append((self._mode, text))
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip += 1
+            return
+        if tag not in _BLOCK_TAGS:
+            return
+        self._flush()
+        if tag in _HEADINGS:
+            self._mode = tag
+        elif tag == "li":
+            self._mode = "bullet"
+        elif tag == "br":
+            self.lines.append(("break", ""))
         else:
-            text = _strip_html(part)
-            if text:
-                lines.append((current_tag, text))
-    return lines
+            self._mode = "text"
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip = max(0, self._skip - 1)
+            return
+        if tag not in _BLOCK_TAGS:
+            return
+        self._flush()
+        if tag in ("ul", "ol"):
+            self.lines.append(("break", ""))
+        self._mode = "text"
 
+    def handle_data(self, data: str) -> None:
+        if not self._skip:
+            self._buf.append(data)
 
-def _strip_html(text: str) -> str:
-    """Remove HTML tags and decode entities."""
-    text = re.sub(r"<[^>]+>", "", text)
-    return html.unescape(text).strip()
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+
+def _parse_html_to_lines(body_html: str) -> list[tuple[str, str]]:
+    """Parse simple HTML into (type, text) pairs."""
+    parser = _LineParser()
+    parser.feed(body_html)
+    parser.close()
+    return parser.lines
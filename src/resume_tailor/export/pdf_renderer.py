@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
 
-import markdown
-from jinja2 import Environment, FileSystemLoader
-from markupsafe import Markup
+# markdown/jinja2/weasyprint are imported on first render so that loading
+# this module (e.g. via the CLI or Streamlit) stays cheap.
+if TYPE_CHECKING:
+    from jinja2 import Template
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +22,17 @@ def render_pdf(
     resume_markdown: str,
     theme: str = "professional",
     title: str = "Resume",
-) -> bytes:
-    """Convert resume markdown to PDF bytes."""
+    target: BinaryIO | None = None,
+) -> bytes | None:
+    """Convert resume markdown to PDF bytes.
+
+    When ``target`` is given the PDF is written into that file-like object
+    and ``None`` is returned, avoiding an intermediate ``bytes`` copy.
+    """
     if theme not in AVAILABLE_THEMES:
         theme = "professional"
     html = _md_to_styled_html(resume_markdown, theme, title)
-    return _html_to_pdf(html)
+    return _html_to_pdf(html, target)
 
 
 def render_html_preview(
@@ -38,28 +46,53 @@ def render_html_preview(
     return _md_to_styled_html(resume_markdown, theme, title)
 
 
+@functools.lru_cache(maxsize=1)
+def _base_template() -> Template:
+    """Compile ``base.html`` once per process."""
+    from jinja2 import Environment, FileSystemLoader
+
+    env = Environment(
+        loader=FileSystemLoader(str(BASE_TEMPLATE_DIR)),
+        autoescape=True,
+    )
+    return env.get_template("base.html")
+
+
+@functools.lru_cache(maxsize=len(AVAILABLE_THEMES))
+def _theme_css(theme: str) -> str:
+    """Read a theme stylesheet once per process."""
+    css_path = CSS_THEMES_DIR / f"{theme}.css"
+    return css_path.read_text(encoding="utf-8") if css_path.exists() else ""
+
+
+@functools.lru_cache(maxsize=32)
 def _md_to_styled_html(md_text: str, theme: str, title: str) -> str:
-    """Convert markdown to themed HTML."""
+    """Convert markdown to themed HTML.
+
+    Memoized so preview refreshes of an unchanged resume skip the markdown
+    conversion entirely.
+    """
+    import markdown
+    from markupsafe import Markup
+
     html_body = markdown.markdown(
         md_text,
         extensions=["tables", "fenced_code", "nl2br"],
     )
-    css_path = CSS_THEMES_DIR / f"{theme}.css"
-    css = css_path.read_text(encoding="utf-8") if css_path.exists() else ""
-    env = Environment(
-        loader=FileSystemLoader(str(BASE_TEMPLATE_DIR)),
-        autoescape=True,
+    return _base_template().render(
+        title=title, css=Markup(_theme_css(theme)), body=Markup(html_body)
     )
-    template = env.get_template("base.html")
-    return template.render(title=title, css=Markup(css), body=Markup(html_body))
 
 
-def _html_to_pdf(html: str) -> bytes:
-    """Convert HTML string to PDF bytes using WeasyPrint, with fpdf2 fallback."""
+def _html_to_pdf(html: str, target: BinaryIO | None = None) -> bytes | None:
+    """Convert HTML string to PDF using WeasyPrint, with fpdf2 fallback.
+
+    Returns the PDF bytes, or writes into ``target`` and returns ``None``.
+    """
     try:
         from weasyprint import HTML
-        return HTML(string=html).write_pdf()
+        return HTML(string=html).write_pdf(target=target, optimize_images=True)
     except (ImportError, OSError):
         logger.warning("WeasyPrint not available, using fpdf2 fallback")
         from resume_tailor.export.pdf_fallback import html_to_pdf_fpdf2
-        return html_to_pdf_fpdf2(html)
+        return html_to_pdf_fpdf2(html, target)
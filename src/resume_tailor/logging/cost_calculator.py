@@ -2,34 +2,62 @@
 
 from __future__ import annotations
 
-# Pricing per 1M tokens (USD)
-MODEL_PRICING: dict[str, dict[str, float]] = {
-    "claude-haiku-4-5-20251001": {"input": 0.80, "output": 4.00},
-    "claude-sonnet-4-5-20250929": {"input": 3.00, "output": 15.00},
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Pricing per 1M tokens (USD). Read-only so the derived per-token table
+# below can never drift out of sync with it.
+# Prompt-cache reads bill at 0.1x and cache writes at 1.25x the input rate.
+MODEL_PRICING: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    "claude-haiku-4-5-20251001": MappingProxyType(
+        {"input": 0.80, "output": 4.00, "cache_read": 0.08, "cache_write": 1.00}
+    ),
+    "claude-sonnet-4-5-20250929": MappingProxyType(
+        {"input": 3.00, "output": 15.00, "cache_read": 0.30, "cache_write": 3.75}
+    ),
+})
+
+# (input, output, cache_read, cache_write) USD per single token, derived
+# once from MODEL_PRICING
+_PER_TOKEN: dict[str, tuple[float, float, float, float]] = {
+    model: (
+        p["input"] / 1_000_000,
+        p["output"] / 1_000_000,
+        p["cache_read"] / 1_000_000,
+        p["cache_write"] / 1_000_000,
+    )
+    for model, p in MODEL_PRICING.items()
 }
 
 TAVILY_COST_PER_SEARCH = 0.01
 
 
 def calculate_cost(
-    calls: list[tuple[str, int, int]],
+    calls: list[tuple[str, int, int]] | list[tuple[str, int, int, int, int]],
     search_count: int = 0,
 ) -> float:
     """Calculate total cost for a set of API calls and searches.
 
     Args:
-        calls: List of (model_id, input_tokens, output_tokens) tuples.
+        calls: List of (model_id, input_tokens, output_tokens) tuples,
+            optionally extended with (cache_read_tokens,
+            cache_creation_tokens) as logged by ``LLMClient``.
         search_count: Number of Tavily search API calls.
 
     Returns:
         Total estimated cost in USD.
     """
     total = 0.0
-    for model_id, input_tokens, output_tokens in calls:
-        pricing = MODEL_PRICING.get(model_id)
-        if pricing is None:
+    for model, input_tokens, output_tokens, *cache_tokens in calls:
+        rates = _PER_TOKEN.get(model)
+        if rates is None:
             continue
-        total += (input_tokens / 1_000_000) * pricing["input"]
-        total += (output_tokens / 1_000_000) * pricing["output"]
-    total += search_count * TAVILY_COST_PER_SEARCH
-    return total
+        input_rate, output_rate, cache_read_rate, cache_write_rate = rates
+        total += input_tokens * input_rate + output_tokens * output_rate
+        if cache_tokens:
+            cache_read_tokens, cache_write_tokens = cache_tokens
+            total += (
+                cache_read_tokens * cache_read_rate
+                + cache_write_tokens * cache_write_rate
+            )
+    return total + search_count * TAVILY_COST_PER_SEARCH
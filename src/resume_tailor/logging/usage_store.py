@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+import weakref
 from datetime import datetime
 from pathlib import Path
 
@@ -11,23 +13,54 @@ from resume_tailor.logging.models import UsageLog
 
 DEFAULT_DB_PATH = Path.home() / ".resume-tailor" / "usage.db"
 
+_SQL_INSERT = """INSERT OR REPLACE INTO usage_logs
+                 (id, session_id, timestamp, mode, company_name, job_title,
+                  qa_score, rewrites, elapsed_seconds, total_input_tokens,
+                  total_output_tokens, search_count, estimated_cost_usd,
+                  role_category, language, success, error_message)
+                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_LOGS_BY_SESSION = (
+    "SELECT * FROM usage_logs WHERE session_id = ? ORDER BY timestamp DESC LIMIT ?"
+)
+_SQL_LOGS = "SELECT * FROM usage_logs ORDER BY timestamp DESC LIMIT ?"
+
 
 class UsageStore:
-    """SQLite-backed store for pipeline usage logs with WAL mode."""
+    """SQLite-backed store for pipeline usage logs with WAL mode.
+
+    Holds a single connection for the lifetime of the instance; access is
+    serialized with a lock so the store can be shared across threads.
+    """
 
     def __init__(self, db_path: str | Path = DEFAULT_DB_PATH):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        # Closes the connection on garbage collection or interpreter exit,
+        # without keeping the instance alive the way atexit.register would
+        self._finalizer = weakref.finalize(self, self._conn.close)
         self._init_db()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA journal_mode=WAL")
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
+    def close(self) -> None:
+        """Close the underlying connection. Safe to call more than once."""
+        with self._lock:
+            self._finalizer()
+
     def _init_db(self) -> None:
-        with self._connect() as conn:
-            conn.execute("""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS usage_logs (
                     id TEXT PRIMARY KEY,
                     session_id TEXT NOT NULL,
@@ -48,17 +81,26 @@ class UsageStore:
                     error_message TEXT
                 )
             """)
+            # get_logs(session_id=...) range-scans the first index already in
+            # timestamp order; the second serves the monthly-stats range.
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_logs_session_ts "
+                "ON usage_logs(session_id, timestamp DESC)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_logs_ts ON usage_logs(timestamp)"
+            )
+            has_stats = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if not has_stats:
+                self._conn.execute("ANALYZE")
 
     def save_log(self, log: UsageLog) -> None:
         """Persist a usage log entry."""
-        with self._connect() as conn:
-            conn.execute(
-                """INSERT OR REPLACE INTO usage_logs
-                   (id, session_id, timestamp, mode, company_name, job_title,
-                    qa_score, rewrites, elapsed_seconds, total_input_tokens,
-                    total_output_tokens, search_count, estimated_cost_usd,
-                    role_category, language, success, error_message)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        with self._lock:
+            self._conn.execute(
+                _SQL_INSERT,
                 (
                     log.id,
                     log.session_id,
@@ -86,25 +128,21 @@ class UsageStore:
         limit: int = 50,
     ) -> list[UsageLog]:
         """Retrieve usage logs, optionally filtered by session_id."""
-        with self._connect() as conn:
+        with self._lock:
             if session_id is not None:
-                rows = conn.execute(
-                    "SELECT * FROM usage_logs WHERE session_id = ? ORDER BY timestamp DESC LIMIT ?",
-                    (session_id, limit),
+                rows = self._conn.execute(
+                    _SQL_LOGS_BY_SESSION, (session_id, limit)
                 ).fetchall()
             else:
-                rows = conn.execute(
-                    "SELECT * FROM usage_logs ORDER BY timestamp DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
+                rows = self._conn.execute(_SQL_LOGS, (limit,)).fetchall()
         return [self._row_to_log(row) for row in rows]
 
     def get_monthly_stats(self) -> dict:
         """Get aggregated stats for the current month."""
         now = datetime.now()
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        with self._connect() as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 """SELECT
                        COUNT(*) as total_runs,
                        SUM(total_input_tokens) as total_input,
@@ -130,8 +168,8 @@ class UsageStore:
 
     def get_total_cost(self) -> float:
         """Get total estimated cost across all logs."""
-        with self._connect() as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT SUM(estimated_cost_usd) FROM usage_logs"
             ).fetchone()
         return row[0] or 0.0
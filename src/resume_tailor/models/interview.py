@@ -5,6 +5,15 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+_EXP_MARKERS = ("경력", "경험", "experience", "career", "프로젝트", "project")
+# Bullets and quantitative evidence in one alternation so a single pass
+# over the text yields both. The branches cannot overlap: bullet markers
+# are never digits and the quantity suffixes never include a newline.
+_SCAN_RE = re.compile(
+    r"(?P<bullet>^[\-\*\u2022]\s)|(?P<quant>\d+[%명건만억원]|\d{2,})",
+    re.MULTILINE,
+)
+
 
 @dataclass
 class ResumeQualityCheck:
@@ -27,14 +36,17 @@ def check_resume_quality(resume_text: str) -> ResumeQualityCheck:
     lines = [line for line in resume_text.split("\n") if line.strip()]
 
     # Detect experience sections
-    exp_markers = ["경력", "경험", "experience", "career", "프로젝트", "project"]
-    has_exp = any(m in resume_text.lower() for m in exp_markers)
-
-    # Count experience items (bullet points)
-    exp_items = len(re.findall(r"^[\-\*\u2022]\s", resume_text, re.MULTILINE))
+    lower = resume_text.lower()
+    has_exp = any(m in lower for m in _EXP_MARKERS)
 
-    # Quantitative evidence
-    has_quant = bool(re.search(r"\d+[%명건만억원]|\d{2,}", resume_text))
+    # Count experience items (bullet points) and look for quantitative evidence
+    exp_items = 0
+    has_quant = False
+    for m in _SCAN_RE.finditer(resume_text):
+        if m.lastgroup == "bullet":
+            exp_items += 1
+        else:
+            has_quant = True
 
     # Composite score
     score = min(
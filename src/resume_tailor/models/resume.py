@@ -17,3 +17,13 @@ class TailoredResume(BaseModel):
     sections: list[ResumeSection]
     full_markdown: str
     metadata: dict[str, Any]  # tokens used, model, etc.
+
+    @classmethod
+    def from_markdown(cls, markdown: str) -> TailoredResume:
+        """Wrap an existing resume as a single "full" section.
+
+        The fields are built here from a plain string rather than parsed
+        from LLM output, so validation is skipped via ``model_construct``.
+        """
+        section = ResumeSection.model_construct(id="full", label="전체", content=markdown)
+        return cls.model_construct(sections=[section], full_markdown=markdown, metadata={})
@@ -7,13 +7,18 @@ Supports:
 
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from resume_tailor.utils.url_validator import validate_url
 
+if TYPE_CHECKING:
+    from playwright.async_api import Browser
 
-@dataclass
+
+@dataclass(slots=True)
 class FormQuestion:
     """A single question/field extracted from an application form."""
     label: str
@@ -23,22 +28,64 @@ class FormQuestion:
     section: str = ""              # e.g. "기본정보", "자기소개서"
 
 
-async def extract_from_url(url: str) -> list[FormQuestion]:
-    """Render a URL with Playwright and extract form questions."""
+async def extract_from_url(url: str, browser: Browser | None = None) -> list[FormQuestion]:
+    """Render a URL with Playwright and extract form questions.
+
+    Pass a launched ``browser`` to extract several URLs without starting
+    Chromium for each; the page opens in a fresh context and the browser is
+    left open. Without one, a headless browser is launched for this call.
+    """
     validate_url(url)
+
+    if browser is not None:
+        return await _extract_with_browser(browser, url)
+
     from playwright.async_api import async_playwright
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        try:
+            return await _extract_with_browser(browser, url)
+        finally:
+            await browser.close()
+
+
+async def _extract_with_browser(browser: Browser, url: str) -> list[FormQuestion]:
+    """Extract form questions from ``url`` in a new context on ``browser``."""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
         await page.goto(url, wait_until="networkidle", timeout=30000)
 
         # Wait a bit for dynamic content
         await page.wait_for_timeout(2000)
 
-        # Extract all text content + form structure via JS
-        form_data = await page.evaluate("""() => {
+        # Extract form structure, plus the visible text for the text-based
+        # fallback when it is likely needed, in a single round-trip
+        data = await page.evaluate("""() => {
             const results = [];
+            const seenLabels = new Set();
+
+            // Textareas stacked in one form share ancestors; cache each
+            // ancestor's sibling-heading text so its subtree is read once.
+            const headingCache = new WeakMap();
+            const siblingHeading = el => {
+                if (headingCache.has(el)) return headingCache.get(el);
+                const prev = el.previousElementSibling;
+                const text = prev ? prev.textContent.trim() : '';
+                const heading = text.length > 3 && text.length < 500 ? text : '';
+                headingCache.set(el, heading);
+                return heading;
+            };
+            const nearestHeading = ta => {
+                let el = ta.parentElement;
+                for (let i = 0; i < 5 && el; i++) {
+                    const heading = siblingHeading(el);
+                    if (heading) return heading;
+                    el = el.parentElement;
+                }
+                return '';
+            };
 
             // Strategy 1: Find textareas with labels
             document.querySelectorAll('textarea').forEach(ta => {
@@ -59,24 +106,12 @@ async def extract_from_url(url: str) -> list[FormQuestion]:
                 }
 
                 // Walk up to find nearest heading/label text
-                if (!label) {
-                    let el = ta.parentElement;
-                    for (let i = 0; i < 5 && el; i++) {
-                        const prev = el.previousElementSibling;
-                        if (prev) {
-                            const text = prev.textContent.trim();
-                            if (text.length > 3 && text.length < 500) {
-                                label = text;
-                                break;
-                            }
-                        }
-                        el = el.parentElement;
-                    }
-                }
+                if (!label) label = nearestHeading(ta);
 
                 if (!label) label = ta.placeholder || '';
 
                 if (label) {
+                    seenLabels.add(label);
                     results.push({
                         label: label,
                         maxLength: maxLen,
@@ -91,7 +126,7 @@ async def extract_from_url(url: str) -> list[FormQuestion]:
                 if (!text || text.length < 2) return;
 
                 // Check if this label already captured via textarea
-                if (results.some(r => r.label === text)) return;
+                if (seenLabels.has(text)) return;
 
                 const forId = label.getAttribute('for');
                 let field = null;
@@ -104,6 +139,7 @@ async def extract_from_url(url: str) -> list[FormQuestion]:
 
                 if (field) {
                     const maxLen = field.maxLength > 0 ? field.maxLength : null;
+                    seenLabels.add(text);
                     results.push({
                         label: text,
                         maxLength: maxLen,
@@ -112,64 +148,31 @@ async def extract_from_url(url: str) -> list[FormQuestion]:
                 }
             });
 
-            return results;
+            // innerText forces a full layout; only pay for it when there are
+            // no textareas, i.e. when the text fallback is likely needed
+            const hasTextarea = results.some(r => r.type === 'textarea');
+            return {form: results, text: hasTextarea ? null : document.body.innerText};
         }""")
 
-        # Also grab full visible text for LLM-based extraction if needed
-        visible_text = await page.evaluate("""() => {
-            return document.body.innerText;
-        }""")
-
-        await browser.close()
-
-    # Filter and deduplicate results
-    questions = []
-    seen = set()
-    for item in form_data:
-        label = item["label"].strip()
-        if label in seen or len(label) < 2:
-            continue
-
-        # Skip script content, CSS, generic placeholders
-        if any(skip in label.lower() for skip in [
-            "window.", "function ", "datalayer", "<script",
-            "내용을 입력해", "선택해주세요", "example@",
-        ]):
-            continue
-
-        # Skip very generic short labels that are just field names, not questions
-        if len(label) < 5 and not _QUESTION_KEYWORDS.search(label):
-            continue
-
-        # Skip if it's just "내용 (N자 이내)" — likely a placeholder for a named field above
-        if re.match(r"^내용\s*\(", label):
-            # Try to attach max_length to the previous question
-            maxlen = _extract_char_limit(label)
-            if maxlen and questions:
-                questions[-1].max_length = maxlen
-            continue
-
-        seen.add(label)
-        questions.append(FormQuestion(
-            label=label,
-            max_length=item.get("maxLength") or _extract_char_limit(label),
-            field_type=item.get("type", "textarea"),
-        ))
+        questions, seen = _filter_form_items(data["form"])
 
-    # If Playwright JS didn't find textarea questions, parse the visible text
-    if len([q for q in questions if q.field_type == "textarea"]) < 1:
-        text_questions = parse_text(visible_text)
-        for tq in text_questions:
-            if tq.label not in seen:
-                questions.append(tq)
-                seen.add(tq.label)
+        # If Playwright JS didn't find textarea questions, parse the visible text
+        if not any(q.field_type == "textarea" for q in questions):
+            visible_text = data["text"]
+            if visible_text is None:
+                visible_text = await page.evaluate("() => document.body.innerText")
+            for tq in parse_text(visible_text):
+                if tq.label not in seen:
+                    questions.append(tq)
+                    seen.add(tq.label)
+    finally:
+        await context.close()
 
     return questions
 
 
 def extract_from_url_sync(url: str) -> list[FormQuestion]:
     """Synchronous wrapper for extract_from_url."""
-    import asyncio
     return asyncio.run(extract_from_url(url))
 
 
@@ -195,7 +198,7 @@ def parse_text(text: str) -> list[FormQuestion]:
         # Check if next line is a character counter like "0/1,000" or "0/10,000"
         char_limit = None
         if i + 1 < len(lines):
-            counter_match = re.match(r"^(\d+)\s*/\s*([\d,]+)$", lines[i + 1])
+            counter_match = _COUNTER_RE.match(lines[i + 1])
             if counter_match:
                 char_limit = int(counter_match.group(2).replace(",", ""))
 
@@ -223,6 +226,23 @@ _QUESTION_KEYWORDS = re.compile(
     re.IGNORECASE,
 )
 
+# Script content, CSS and generic placeholders picked up as labels
+_SKIP_LABEL_RE = re.compile(
+    "|".join(map(re.escape, (
+        "window.", "function ", "datalayer", "<script",
+        "내용을 입력해", "선택해주세요", "example@",
+    ))),
+    re.IGNORECASE,
+)
+_COUNTER_RE = re.compile(r"^(\d+)\s*/\s*([\d,]+)$")  # "0/1,000"
+_SKIP_LINE_RE = re.compile(
+    r"^(이름|연락처|이메일|성별|생년월일|우편번호|선택해주세요|내용을 입력|검색)$"
+)
+_NUMBERED_RE = re.compile(r"^\d+\.\s*(.+)")
+_NAEYONG_RE = re.compile(r"^내용\s*\(")
+_CHAR_LIMIT_KOR_RE = re.compile(r"([\d,]+)\s*자\s*(이내|내외|이하|제한|까지)?")
+_CHAR_LIMIT_EN_RE = re.compile(r"max\w*\s*(\d{2,5})", re.IGNORECASE)
+
 
 def _parse_question_line(line: str, override_max_length: int | None = None) -> FormQuestion | None:
     """Try to parse a single line as a question."""
@@ -230,9 +250,9 @@ def _parse_question_line(line: str, override_max_length: int | None = None) -> F
         return None
 
     # Skip obvious non-question lines
-    if re.match(r"^(이름|연락처|이메일|성별|생년월일|우편번호|선택해주세요|내용을 입력|검색)$", line):
+    if _SKIP_LINE_RE.match(line):
         return None
-    if re.match(r"^\d+\s*/\s*[\d,]+$", line):  # character counter
+    if _COUNTER_RE.match(line):  # character counter
         return None
 
     maxlen = override_max_length or _extract_char_limit(line)
@@ -242,7 +262,7 @@ def _parse_question_line(line: str, override_max_length: int | None = None) -> F
         return FormQuestion(label=line, max_length=maxlen, field_type="textarea")
 
     # Numbered section header: "1. 기본정보" — skip these
-    m = re.match(r"^\d+\.\s*(.+)", line)
+    m = _NUMBERED_RE.match(line)
     if m:
         content = m.group(1)
         if len(content) < 6 and not _QUESTION_KEYWORDS.search(content):
@@ -259,10 +279,44 @@ def _parse_question_line(line: str, override_max_length: int | None = None) -> F
 
 def _extract_char_limit(text: str) -> int | None:
     """Extract character limit from text like '(1,000자 내외)' or 'max 1000'."""
-    m = re.search(r"([\d,]+)\s*자\s*(이내|내외|이하|제한|까지)?", text)
+    m = _CHAR_LIMIT_KOR_RE.search(text)
     if m:
         return int(m.group(1).replace(",", ""))
-    m = re.search(r"max\w*\s*(\d{2,5})", text, re.IGNORECASE)
+    m = _CHAR_LIMIT_EN_RE.search(text)
     if m:
         return int(m.group(1))
     return None
+
+
+def _filter_form_items(form_data: list[dict]) -> tuple[list[FormQuestion], set[str]]:
+    """Filter and deduplicate raw label/field items extracted from the page."""
+    questions: list[FormQuestion] = []
+    seen: set[str] = set()
+    for item in form_data:
+        label = item["label"].strip()
+        if label in seen or len(label) < 2:
+            continue
+
+        # Skip script content, CSS, generic placeholders
+        if _SKIP_LABEL_RE.search(label):
+            continue
+
+        # Skip very generic short labels that are just field names, not questions
+        if len(label) < 5 and not _QUESTION_KEYWORDS.search(label):
+            continue
+
+        # Skip if it's just "내용 (N자 이내)" — likely a placeholder for a named field above
+        if _NAEYONG_RE.match(label):
+            # Try to attach max_length to the previous question
+            maxlen = _extract_char_limit(label)
+            if maxlen and questions:
+                questions[-1].max_length = maxlen
+            continue
+
+        seen.add(label)
+        questions.append(FormQuestion(
+            label=label,
+            max_length=item.get("maxLength") or _extract_char_limit(label),
+            field_type=item.get("type", "textarea"),
+        ))
+    return questions, seen
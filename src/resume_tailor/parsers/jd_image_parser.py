@@ -6,9 +6,14 @@ via PyMuPDF (fitz) before sending to the API.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 
-from resume_tailor.clients.llm_client import LLMClient
+from resume_tailor.clients.llm_client import MAX_IMAGE_EDGE, LLMClient
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +27,24 @@ _EXT_MEDIA_TYPES = {
 }
 
 PDF_DPI = 150
+# Pages go straight to the Vision API: JPEG encodes several times faster
+# than PNG's DEFLATE and at this quality is just as legible for OCR.
+PDF_JPEG_QUALITY = 85
+_PAGE_MEDIA_TYPE = "image/jpeg"
+# Max concurrent Vision requests per PDF, to stay clear of rate limits
+OCR_CONCURRENCY = 4
+
+
+@functools.cache
+def _fitz():
+    """Import PyMuPDF on first use; later calls skip the import statement."""
+    import fitz  # PyMuPDF
+
+    return fitz
 
 
 def pdf_to_images(pdf_bytes: bytes) -> list[tuple[bytes, str]]:
-    """Convert PDF pages to PNG images using PyMuPDF.
+    """Convert PDF pages to JPEG images using PyMuPDF.
 
     Args:
         pdf_bytes: Raw PDF file bytes.
@@ -33,27 +52,52 @@ def pdf_to_images(pdf_bytes: bytes) -> list[tuple[bytes, str]]:
     Returns:
         List of (image_bytes, media_type) tuples, one per page.
     """
-    import fitz  # PyMuPDF
-
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    images = []
+    # Pages are rendered serially: PyMuPDF objects are not thread-safe and
+    # rendering holds the GIL, so a thread pool would not help here.
+    doc = _fitz().open(stream=pdf_bytes, filetype="pdf")
     try:
-        for page in doc:
-            mat = fitz.Matrix(PDF_DPI / 72, PDF_DPI / 72)
-            pix = page.get_pixmap(matrix=mat)
-            images.append((pix.tobytes("png"), "image/png"))
+        return [(_render_page(doc, i), _PAGE_MEDIA_TYPE) for i in range(doc.page_count)]
     finally:
         doc.close()
-    return images
+
+
+async def iter_pdf_images(pdf_bytes: bytes) -> AsyncIterator[tuple[bytes, str]]:
+    """Yield (image_bytes, media_type) per PDF page as soon as it is rendered.
+
+    Rendering runs on a single dedicated worker thread (PyMuPDF is not
+    thread-safe), so callers can start OCR on early pages while later
+    pages are still rendering.
+    """
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=1) as worker:
+        doc = await loop.run_in_executor(
+            worker, functools.partial(_fitz().open, stream=pdf_bytes, filetype="pdf")
+        )
+        try:
+            page_count = await loop.run_in_executor(worker, lambda: doc.page_count)
+            for i in range(page_count):
+                img = await loop.run_in_executor(worker, _render_page, doc, i)
+                yield img, _PAGE_MEDIA_TYPE
+        finally:
+            await loop.run_in_executor(worker, doc.close)
+
+
+def _render_page(doc, index: int) -> bytes:
+    """Render one page of an open PyMuPDF document to JPEG bytes.
+
+    Pages render at PDF_DPI, scaled down so the longest edge fits
+    MAX_IMAGE_EDGE; the client would otherwise decode and re-encode the
+    JPEG to shrink it, a second lossy pass.
+    """
+    page = doc[index]
+    zoom = min(PDF_DPI / 72, MAX_IMAGE_EDGE / max(page.rect.width, page.rect.height))
+    pix = page.get_pixmap(matrix=_fitz().Matrix(zoom, zoom))
+    return pix.tobytes("jpg", jpg_quality=PDF_JPEG_QUALITY)
 
 
 def _get_media_type(filename: str) -> str | None:
     """Get media type from filename extension."""
-    lower = filename.lower()
-    for ext, mt in _EXT_MEDIA_TYPES.items():
-        if lower.endswith(ext):
-            return mt
-    return None
+    return _EXT_MEDIA_TYPES.get(os.path.splitext(filename)[1].lower())
 
 
 async def extract_jd_from_file(
@@ -74,16 +118,26 @@ async def extract_jd_from_file(
     lower = filename.lower()
 
     if lower.endswith(".pdf"):
-        images = pdf_to_images(file_bytes)
-        if not images:
-            raise ValueError("PDF에 페이지가 없습니다.")
-
-        parts = []
-        for i, (img_bytes, media_type) in enumerate(images):
-            logger.info("Extracting text from PDF page %d/%d", i + 1, len(images))
-            text = await llm.extract_text_from_image(img_bytes, media_type)
-            parts.append(text)
-
+        sem = asyncio.Semaphore(OCR_CONCURRENCY)
+
+        async def _ocr_page(i: int, img_bytes: bytes, media_type: str) -> str:
+            async with sem:
+                logger.info("Extracting text from PDF page %d", i + 1)
+                return await llm.extract_text_from_image(img_bytes, media_type)
+
+        # Start OCR on each page as soon as it renders, overlapping CPU-bound
+        # rendering with the network-bound Vision calls.
+        tasks: list[asyncio.Task[str]] = []
+        try:
+            async for img_bytes, media_type in iter_pdf_images(file_bytes):
+                tasks.append(asyncio.create_task(_ocr_page(len(tasks), img_bytes, media_type)))
+            if not tasks:
+                raise ValueError("PDF에 페이지가 없습니다.")
+            parts = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
         return "\n\n".join(parts)
 
     media_type = _get_media_type(filename)
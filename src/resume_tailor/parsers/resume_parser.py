@@ -1,4 +1,6 @@
+import functools
 import re
+import zipfile
 from pathlib import Path
 
 # Shared emoji pattern for Google Docs / LLM output cleanup
@@ -8,6 +10,40 @@ EMOJI_PATTERN = (
     r"\u260e\u2709\u2706\u2702]\s*"
 )
 
+_EMOJI_RE = re.compile(EMOJI_PATTERN)
+# BOM, zero-width spaces/joiners, soft hyphen and word joiner, for str.translate
+_ZERO_WIDTH_CHARS = dict.fromkeys(
+    map(ord, "\u200b\u200c\u200d\u00ad\u2060\ufeff"), None
+)
+# Symbol bullets (●, •, ◦, ◆, ■, ▪, ★, ○) and asterisk-heavy bullets
+# ("*" followed by excessive spaces) in a single pass
+_BULLET_RE = re.compile(r"^(\s*)(?:[●•◦◆■▪★○]\s*|\*\s{2,})", re.MULTILINE)
+# Per-line whitespace cleanup, applied to the whole text at once. "[^\S\n]"
+# is any whitespace except the line break itself.
+_TRAILING_WS_RE = re.compile(r"[^\S\n]+$", re.MULTILINE)
+_MIXED_INDENT_RE = re.compile(r"^[^\S\n]*[^ \S\n][^\S\n]*", re.MULTILINE)
+_INTERNAL_WS_RE = re.compile(r"(?<=[^ \t\n])[ \t]{2,}")
+# Step 4 is a no-op unless the text has whitespace other than single spaces
+# and "\n" (tabs, CR, NBSP, ...), a double space, or a space at line end.
+_NEEDS_WS_PASS_RE = re.compile(r"[^\S\n ]| {2}| $", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = _W_NS + "body"
+_W_P = _W_NS + "p"
+_W_R = _W_NS + "r"
+_W_HYPERLINK = _W_NS + "hyperlink"
+_W_T = _W_NS + "t"
+_W_BR = _W_NS + "br"
+_W_TYPE = _W_NS + "type"
+# Run children with a fixed text equivalent, as python-docx renders them
+_W_RUN_CHARS = {
+    _W_NS + "tab": "\t",
+    _W_NS + "ptab": "\t",
+    _W_NS + "cr": "\n",
+    _W_NS + "noBreakHyphen": "-",
+}
+
 
 def parse_resume(file_path: str | Path) -> str:
     """Parse a resume file (PDF, DOCX, TXT, MD) and return clean plain text."""
@@ -23,6 +59,10 @@ def parse_resume(file_path: str | Path) -> str:
         raise ValueError(f"Unsupported file format: {path.suffix}")
 
 
+def _spaces_for_indent(m: re.Match[str]) -> str:
+    return " " * len(m.group().replace("\t", "    "))
+
+
 def clean_markdown(text: str) -> str:
     """Clean Google Docs markdown export artifacts.
 
@@ -30,48 +70,91 @@ def clean_markdown(text: str) -> str:
     inconsistent bullet styles, and trailing whitespace.
     """
     # 1. Remove unicode artifacts (BOM, zero-width spaces, soft hyphens)
-    text = text.lstrip("\ufeff")
-    text = re.sub(r"[\u200b\u200c\u200d\u00ad\u2060\ufeff]", "", text)
+    text = text.translate(_ZERO_WIDTH_CHARS)
 
     # 2. Remove emoji icons commonly used in Google Docs resumes
-    text = re.sub(EMOJI_PATTERN, "", text)
+    text = _EMOJI_RE.sub("", text)
 
-    # 3. Normalize bullet points (●, •, ◦, ◆, ■, ▪, ★, ○ → -)
-    text = re.sub(r"^(\s*)[●•◦◆■▪★○]\s*", r"\1- ", text, flags=re.MULTILINE)
-    # Normalize asterisk-heavy bullets (* followed by excessive spaces)
-    text = re.sub(r"^(\s*)\*\s{2,}", r"\1- ", text, flags=re.MULTILINE)
+    # 3. Normalize bullet points (●, •, ◦, ◆, ■, ▪, ★, ○, "*  " → -)
+    text = _BULLET_RE.sub(r"\1- ", text)
 
     # 4. Collapse multiple spaces/tabs to single space (preserve leading indent)
-    lines = text.splitlines()
-    cleaned_lines = []
-    for line in lines:
-        stripped = line.lstrip()
-        indent = line[: len(line) - len(stripped)]
-        # Normalize indent to consistent spaces
-        indent = " " * (len(indent.replace("\t", "    ")))
-        stripped = re.sub(r"[ \t]{2,}", " ", stripped).rstrip()
-        cleaned_lines.append(f"{indent}{stripped}" if stripped else "")
-    text = "\n".join(cleaned_lines)
+    if _NEEDS_WS_PASS_RE.search(text):
+        text = "\n".join(text.splitlines())
+        text = _TRAILING_WS_RE.sub("", text)
+        # Normalize indent to consistent spaces (tabs count as 4)
+        text = _MIXED_INDENT_RE.sub(_spaces_for_indent, text)
+        text = _INTERNAL_WS_RE.sub(" ", text)
 
     # 5. Remove excessive blank lines (3+ → 2)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANK_LINES_RE.sub("\n\n", text)
 
     return text.strip()
 
 
-def _parse_pdf(path: Path) -> str:
+@functools.cache
+def _fitz():
+    """Import PyMuPDF on first use; later calls skip the import statement."""
     import fitz  # pymupdf
 
-    doc = fitz.open(str(path))
-    text = []
-    for page in doc:
-        text.append(page.get_text())
-    doc.close()
-    return "\n".join(text)
+    return fitz
 
 
-def _parse_docx(path: Path) -> str:
-    from docx import Document
+@functools.cache
+def _etree():
+    """Import lxml.etree on first use; later calls skip the import statement."""
+    from lxml import etree
+
+    return etree
+
 
-    doc = Document(str(path))
-    return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
+def _parse_pdf(path: Path) -> str:
+    with _fitz().open(str(path)) as doc:
+        return "\n".join([page.get_text() for page in doc])
+
+
+def _paragraph_text(p) -> str:
+    """Text of one ``w:p`` element, matching python-docx ``Paragraph.text``.
+
+    Like python-docx, only runs directly under the paragraph or one of its
+    hyperlinks count; text in content controls, tracked insertions and
+    text boxes is skipped.
+    """
+    parts = []
+    for child in p:
+        if child.tag == _W_R:
+            runs = (child,)
+        elif child.tag == _W_HYPERLINK:
+            runs = child.iterchildren(_W_R)
+        else:
+            continue
+        for run in runs:
+            for el in run:
+                if el.tag == _W_T:
+                    parts.append(el.text or "")
+                elif el.tag == _W_BR:
+                    if el.get(_W_TYPE) in (None, "textWrapping"):
+                        parts.append("\n")
+                else:
+                    parts.append(_W_RUN_CHARS.get(el.tag, ""))
+    return "".join(parts)
+
+
+def _parse_docx(path: Path) -> str:
+    # Stream word/document.xml instead of building python-docx's full DOM.
+    # Only direct children of w:body count, as with Document.paragraphs;
+    # each finished top-level element is cleared to keep memory flat.
+    lines = []
+    with zipfile.ZipFile(path) as zf, zf.open("word/document.xml") as xml:
+        for _, el in _etree().iterparse(xml, events=("end",)):
+            parent = el.getparent()
+            if parent is None or parent.tag != _W_BODY:
+                continue
+            if el.tag == _W_P:
+                text = _paragraph_text(el)
+                if text.strip():
+                    lines.append(text)
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
+    return "\n".join(lines)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 
+from resume_tailor.cache.memo import AsyncMemo
 from resume_tailor.clients.llm_client import LLMClient
 from resume_tailor.clients.search_client import SearchClient
 from resume_tailor.models.company import CompanyProfile
@@ -38,9 +39,18 @@ class CompanyResearcher:
         self.llm = llm
         self.search = search
         self.model = model
+        self._memo: AsyncMemo[CompanyProfile] = AsyncMemo()
 
     async def research(self, company_name: str) -> CompanyProfile:
-        """Research a company and return a structured profile."""
+        """Research a company and return a structured profile.
+
+        Results are memoized per instance by normalized company name, so
+        repeated runs skip both the web searches and the LLM call.
+        """
+        key = company_name.strip().lower()
+        return await self._memo.get_or_compute(key, lambda: self._research(company_name))
+
+    async def _research(self, company_name: str) -> CompanyProfile:
         logger.info("Researching company: %s", company_name)
         search_results = await self._search_company(company_name)
         search_context = self._format_search_results(search_results)
@@ -56,10 +66,11 @@ JSON 형식으로만 응답하세요."""
             prompt=prompt,
             system=SYSTEM_PROMPT,
             model=self.model,
+            schema=CompanyProfile,
         )
         if not isinstance(data, dict):
             raise ValueError(f"Expected dict from LLM, got {type(data).__name__}")
-        return CompanyProfile(**data)
+        return CompanyProfile.model_validate(data)
 
     async def _search_company(self, company_name: str) -> list[dict]:
         """Run multiple searches for comprehensive company info."""
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import re
+
 from resume_tailor.utils.url_validator import validate_url
 
+# Labels that are really inline script content rather than form text
+_SCRIPT_LABEL_RE = re.compile(r"window\.|function |datalayer", re.IGNORECASE)
+
 
 async def autofill_form(url: str, answers: list[dict]) -> int:
     """Open the URL in a visible browser, fill textarea fields, and wait.
@@ -23,6 +28,28 @@ async def autofill_form(url: str, answers: list[dict]) -> int:
         # Collect all textareas with their labels
         textarea_info = await page.evaluate("""() => {
             const results = [];
+
+            // Textareas stacked in one form share ancestors; cache each
+            // ancestor's sibling-heading text so its subtree is read once.
+            const headingCache = new WeakMap();
+            const siblingHeading = el => {
+                if (headingCache.has(el)) return headingCache.get(el);
+                const prev = el.previousElementSibling;
+                const text = prev ? prev.textContent.trim() : '';
+                const heading = text.length > 3 && text.length < 500 ? text : '';
+                headingCache.set(el, heading);
+                return heading;
+            };
+            const nearestHeading = ta => {
+                let el = ta.parentElement;
+                for (let i = 0; i < 5 && el; i++) {
+                    const heading = siblingHeading(el);
+                    if (heading) return heading;
+                    el = el.parentElement;
+                }
+                return '';
+            };
+
             document.querySelectorAll('textarea').forEach((ta, idx) => {
                 let label = '';
 
@@ -39,20 +66,7 @@ async def autofill_form(url: str, answers: list[dict]) -> int:
                 }
 
                 // Walk up DOM
-                if (!label) {
-                    let el = ta.parentElement;
-                    for (let i = 0; i < 5 && el; i++) {
-                        const prev = el.previousElementSibling;
-                        if (prev) {
-                            const text = prev.textContent.trim();
-                            if (text.length > 3 && text.length < 500) {
-                                label = text;
-                                break;
-                            }
-                        }
-                        el = el.parentElement;
-                    }
-                }
+                if (!label) label = nearestHeading(ta);
 
                 if (!label) label = ta.placeholder || '';
 
@@ -63,6 +77,7 @@ async def autofill_form(url: str, answers: list[dict]) -> int:
 
         # Match answers to textareas by label similarity
         textareas = await page.query_selector_all("textarea")
+        prepared = _prepare_answers(answers)
         filled = 0
 
         for ta_info in textarea_info:
@@ -73,11 +88,11 @@ async def autofill_form(url: str, answers: list[dict]) -> int:
                 continue
 
             # Skip script content, generic labels
-            if any(skip in ta_label.lower() for skip in ["window.", "function ", "datalayer"]):
+            if _SCRIPT_LABEL_RE.search(ta_label):
                 continue
 
             # Find matching answer
-            matched_answer = _find_matching_answer(ta_label, answers)
+            matched_answer = _find_matching_answer(ta_label, prepared)
             if matched_answer:
                 ta = textareas[ta_idx]
                 await ta.click()
@@ -90,25 +105,38 @@ async def autofill_form(url: str, answers: list[dict]) -> int:
     return filled
 
 
-def _find_matching_answer(label: str, answers: list[dict]) -> dict | None:
+_PreparedAnswer = tuple[dict, str, frozenset[str]]  # (answer, question_lower, question_words)
+
+
+def _prepare_answers(answers: list[dict]) -> list[_PreparedAnswer]:
+    """Lowercase and tokenize each answer's question once, ahead of matching."""
+    prepared = []
+    for ans in answers:
+        q = ans["question"].lower()
+        prepared.append((ans, q.strip(), frozenset(q.split())))
+    return prepared
+
+
+def _find_matching_answer(label: str, answers: list[_PreparedAnswer]) -> dict | None:
     """Find the best matching answer for a textarea label."""
     label_lower = label.lower().strip()
 
     # Direct substring match
-    for ans in answers:
-        q = ans["question"].lower().strip()
+    for ans, q, _ in answers:
         if q in label_lower or label_lower in q:
             return ans
 
     # Keyword overlap match
     best_match = None
     best_score = 0
-    for ans in answers:
-        q_words = set(ans["question"].lower().split())
-        l_words = set(label_lower.split())
+    l_words = set(label_lower.split())
+    for ans, _, q_words in answers:
         overlap = len(q_words & l_words)
         if overlap > best_score and overlap >= 2:
             best_score = overlap
             best_match = ans
+            # Every label word matched: no later answer can score higher
+            if overlap == len(l_words):
+                break
 
     return best_match
@@ -2,12 +2,28 @@
 
 from __future__ import annotations
 
-import asyncio
+import logging
+import re
+
+from pydantic import BaseModel
 
 from resume_tailor.clients.llm_client import LLMClient
 from resume_tailor.models.resume import TailoredResume
 from resume_tailor.parsers.form_parser import FormQuestion
 from resume_tailor.utils.json_parser import extract_json
+from resume_tailor.utils.token_budget import truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+# Questions capped at this many characters are short enough to answer
+# together in one request; longer essay questions each get their own call.
+BATCH_MAX_LENGTH = 300
+
+# Approximate token budget for the JD included in every answer's context
+JD_TOKEN_BUDGET = 1500
+
+# Sentence endings _smart_truncate may cut after; group 1 marks "다. "
+_SENTENCE_END_RE = re.compile(r"\.\n|(다)?\. ")
 
 
 FORM_FILLER_SYSTEM = """\
@@ -42,24 +58,52 @@ async def generate_form_answers(
     company_name: str = "",
     language: str = "ko",
     model: str = "claude-sonnet-4-5-20250929",
+    concurrency: int = 5,
+    batch: bool = False,
 ) -> list[dict]:
     """Generate answers for each form question.
 
+    Short questions (limit of at most ``BATCH_MAX_LENGTH`` characters) are
+    answered together in a single request. The rest, and any short ones the
+    batch missed, are answered concurrently, with at most ``concurrency``
+    requests in flight to stay within API rate limits.
+
+    With ``batch`` every question is instead submitted through the Message
+    Batches API at half the cost; that can take minutes, so it is meant
+    for non-interactive bulk runs. Questions the batch fails to answer fall
+    back to the real-time path.
+
     Returns list of {"question": str, "answer": str, "char_count": int}
     """
-    tasks = [
-        _answer_question(
-            llm=llm,
-            question=q,
-            resume=resume,
-            jd_text=jd_text,
-            company_name=company_name,
-            language=language,
-            model=model,
-        )
-        for q in questions
+    # Resume, JD and company form one system block shared by every call;
+    # build it once rather than re-interpolating the resume per question.
+    system = _with_resume(FORM_FILLER_SYSTEM, resume, jd_text, company_name)
+
+    answers: list[str | None] = [None] * len(questions)
+    short = [
+        i for i, q in enumerate(questions)
+        if q.max_length and q.max_length <= BATCH_MAX_LENGTH
     ]
-    answers = list(await asyncio.gather(*tasks))
+    if batch and questions:
+        responses = await llm.batch_generate([
+            _question_job(q, system, language, model) for q in questions
+        ])
+        answers = [r.text.strip() if r is not None else None for r in responses]
+    elif len(short) > 1:
+        batched = await _answer_batch(
+            llm, [questions[i] for i in short], system, language, model,
+        )
+        for i, answer in zip(short, batched):
+            answers[i] = answer
+
+    pending = [i for i, answer in enumerate(answers) if answer is None]
+    if pending:
+        singles = await llm.generate_many(
+            [_question_job(questions[i], system, language, model) for i in pending],
+            concurrency=concurrency,
+        )
+        for i, resp in zip(pending, singles):
+            answers[i] = resp.text.strip()
 
     results = []
     for q, answer in zip(questions, answers):
@@ -88,10 +132,7 @@ async def extract_structured_fields(
     if form_fields:
         fields_hint = f"\n\n이 지원서에 있는 필드 목록: {', '.join(form_fields)}"
 
-    prompt = f"""다음 이력서에서 구조화된 정보를 JSON으로 추출하세요.{fields_hint}
-
-## 이력서
-{resume.full_markdown}
+    prompt = f"""위 이력서에서 구조화된 정보를 JSON으로 추출하세요.{fields_hint}
 
 아래 형식으로 추출하세요:
 {{
@@ -152,23 +193,33 @@ async def extract_structured_fields(
 
     data = await llm.generate_json(
         prompt=prompt,
-        system=STRUCTURED_EXTRACTOR_SYSTEM,
+        system=_with_resume(STRUCTURED_EXTRACTOR_SYSTEM, resume),
         model=model,
         max_tokens=4096,
+        cache_system=True,
     )
     return data
 
 
-async def _answer_question(
-    llm: LLMClient,
+def _question_job(
     question: FormQuestion,
-    resume: TailoredResume,
-    jd_text: str,
-    company_name: str,
+    system: str,
     language: str = "ko",
     model: str = "claude-sonnet-4-5-20250929",
-) -> str:
-    """Generate an answer for a single question."""
+) -> dict:
+    """Build the ``generate`` keyword arguments answering one question."""
+    return {
+        "prompt": _question_prompt(question, language),
+        "system": system,
+        "model": model,
+        "max_tokens": 4096,
+        "temperature": 0.3,
+        "cache_system": True,
+    }
+
+
+def _question_prompt(question: FormQuestion, language: str = "ko") -> str:
+    """Build the user prompt asking for one question's answer."""
     char_limit_note = ""
     if question.max_length:
         # Target 75% to leave comfortable margin
@@ -182,36 +233,91 @@ async def _answer_question(
             f"- 짧더라도 제한 내에 맞추는 것이 최우선입니다"
         )
 
-    jd_section = ""
-    if jd_text:
-        jd_section = f"\n\n## 채용공고\n{jd_text[:3000]}"
-
-    company_section = ""
-    if company_name:
-        company_section = f"\n지원 회사: {company_name}"
-
     lang_instruction = ""
     if language == "en":
         lang_instruction = "\n\n**[CRITICAL] Write the answer in English. Do NOT use Korean.**"
 
-    prompt = f"""다음 지원서 문항에 대한 답변을 작성하세요.{lang_instruction}
+    return f"""다음 지원서 문항에 대한 답변을 작성하세요.{lang_instruction}
 
 ## 문항
 {question.label}{char_limit_note}
 
-## 내 이력서
-{resume.full_markdown}{jd_section}{company_section}
+위 이력서와 정보를 바탕으로 이 문항에 맞는 답변만 작성하세요. 다른 설명 없이 답변 텍스트만 출력하세요."""
 
-위 정보를 바탕으로 이 문항에 맞는 답변만 작성하세요. 다른 설명 없이 답변 텍스트만 출력하세요."""
 
-    resp = await llm.generate(
-        prompt=prompt,
-        system=FORM_FILLER_SYSTEM,
-        model=model,
-        max_tokens=4096,
-        temperature=0.3,
-    )
-    return resp.text.strip()
+class _BatchAnswer(BaseModel):
+    id: int
+    answer: str
+
+
+class _BatchAnswers(BaseModel):
+    answers: list[_BatchAnswer]
+
+
+async def _answer_batch(
+    llm: LLMClient,
+    questions: list[FormQuestion],
+    system: str,
+    language: str = "ko",
+    model: str = "claude-sonnet-4-5-20250929",
+) -> list[str | None]:
+    """Answer several short questions in one request.
+
+    Returns one entry per question; ``None`` where the model gave no usable
+    answer (or the whole call failed), for the caller to answer singly.
+    """
+    lines = []
+    for i, q in enumerate(questions, 1):
+        limit = ""
+        if q.max_length:
+            limit = f" (최대 {q.max_length}자, 목표 {int(q.max_length * 0.75)}자 내외)"
+        lines.append(f"{i}. {q.label}{limit}")
+
+    lang_instruction = ""
+    if language == "en":
+        lang_instruction = "\n\n**[CRITICAL] Write every answer in English. Do NOT use Korean.**"
+
+    prompt = f"""다음 지원서 문항들에 대한 답변을 각각 작성하세요.{lang_instruction}
+
+## 문항
+{chr(10).join(lines)}
+
+문항 번호를 id로 하여 각 문항의 답변 텍스트만 작성하세요. 마크다운 없이 순수 텍스트로, 문항별 글자수 제한을 절대 넘기지 마세요."""
+
+    try:
+        data = await llm.generate_json(
+            prompt=prompt,
+            system=system,
+            model=model,
+            max_tokens=4096,
+            temperature=0.3,
+            cache_system=True,
+            schema=_BatchAnswers,
+        )
+        by_id = {a.id: a.answer.strip() for a in _BatchAnswers.model_validate(data).answers}
+    except Exception:
+        logger.warning("Batched answer call failed; answering questions singly", exc_info=True)
+        return [None] * len(questions)
+    return [by_id.get(i) or None for i in range(1, len(questions) + 1)]
+
+
+def _with_resume(
+    system: str,
+    resume: TailoredResume,
+    jd_text: str = "",
+    company_name: str = "",
+) -> str:
+    """Append the resume, and the JD and company when given, to a system prompt.
+
+    These are the large, repeated part of every form-filling call, so they
+    live in the (prompt-cached) system block rather than the user prompt.
+    """
+    system = f"{system}\n\n## 내 이력서\n{resume.full_markdown}"
+    if jd_text:
+        system += f"\n\n## 채용공고\n{truncate_to_tokens(jd_text, JD_TOKEN_BUDGET)}"
+    if company_name:
+        system += f"\n\n지원 회사: {company_name}"
+    return system
 
 
 def _smart_truncate(text: str, max_length: int) -> str:
@@ -221,16 +327,32 @@ def _smart_truncate(text: str, max_length: int) -> str:
 
     # Try to cut at last sentence ending (. or 다.)
     truncated = text[:max_length]
-
-    # Find last sentence boundary
-    for ending in [".\n", "다.\n", "다. ", "습니다. ", "합니다. ", ". "]:
-        last_pos = truncated.rfind(ending)
-        if last_pos > max_length * 0.5:  # at least keep 50%
-            return truncated[:last_pos + len(ending)].rstrip()
+    half = max_length * 0.5  # at least keep 50%
+
+    # One scan finds the last qualifying cut for each kind of ending; the
+    # kinds are then tried in priority order: ".\n", then "다. ", then ". ".
+    # ("다.\n", "습니다. " and "합니다. " never win on their own: each one
+    # contains a higher-priority ending that cuts at the same place.)
+    cuts = [0, 0, 0]
+    for m in _SENTENCE_END_RE.finditer(truncated):
+        start = m.start()
+        if m[0] == ".\n":
+            if start > half:
+                cuts[0] = m.end()
+            continue
+        if m[1]:
+            if start > half:
+                cuts[1] = m.end()
+            start += 1  # the ". " inside "다. "
+        if start > half:
+            cuts[2] = m.end()
+    for cut in cuts:
+        if cut:
+            return truncated[:cut].rstrip()
 
     # Fallback: cut at last space
     last_space = truncated.rfind(" ")
-    if last_space > max_length * 0.5:
+    if last_space > half:
         return truncated[:last_space].rstrip()
 
     return truncated.rstrip()
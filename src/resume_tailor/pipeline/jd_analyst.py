@@ -2,14 +2,74 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import re
 
+from pydantic.json_schema import SkipJsonSchema
+
+from resume_tailor.cache.memo import AsyncMemo
 from resume_tailor.clients.llm_client import LLMClient
 from resume_tailor.models.job import JobAnalysis
 
 logger = logging.getLogger(__name__)
 
-SYSTEM_PROMPT = """\
+# Keywords that mark a JD's role category. ASCII terms match whole words so
+# short ones ("ui", "sql") don't fire inside longer words.
+_ROLE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "tech": (
+        "python", "java", "javascript", "typescript", "kotlin", "golang", "c++",
+        "spring", "django", "react", "node.js", "kubernetes", "docker", "aws",
+        "sql", "api", "devops", "backend", "frontend", "software engineer",
+        "백엔드", "프론트엔드", "서버 개발", "개발자", "소프트웨어", "인프라",
+        "데이터 엔지니어", "머신러닝",
+    ),
+    "business": (
+        "strategy", "business development", "marketing", "sales", "consulting",
+        "product manager", "전략기획", "사업개발", "사업기획", "마케팅", "영업",
+        "컨설팅", "경영지원", "재무", "회계", "인사",
+    ),
+    "design": (
+        "ux", "ui", "figma", "sketch", "prototype", "wireframe", "branding",
+        "디자이너", "디자인", "프로토타입", "와이어프레임", "사용자 경험", "브랜드",
+    ),
+}
+_ROLE_RES = {
+    category: re.compile("|".join(
+        rf"(?<![a-z]){re.escape(k)}(?![a-z])" if k.isascii() else re.escape(k)
+        for k in keywords
+    ))
+    for category, keywords in _ROLE_KEYWORDS.items()
+}
+# Distinct keywords the top category needs, and its margin over the runner-up
+_ROLE_MIN_HITS = 3
+_ROLE_MARGIN = 2
+
+
+def classify_role(jd_text: str) -> str | None:
+    """Guess the JD's role category from keywords.
+
+    Returns the category only when it is clear-cut, i.e. it has at least
+    ``_ROLE_MIN_HITS`` distinct keywords and more than ``_ROLE_MARGIN``
+    times as many as any other category; otherwise ``None``.
+    """
+    text = jd_text.casefold()
+    hits = sorted(
+        ((len(set(pattern.findall(text))), category) for category, pattern in _ROLE_RES.items()),
+        reverse=True,
+    )
+    (top, category), (second, _) = hits[0], hits[1]
+    if top >= _ROLE_MIN_HITS and top > _ROLE_MARGIN * second:
+        return category
+    return None
+
+
+# Output schema without role_category, for JDs classify_role() settled. (No
+# docstring: it would be sent to the model as the schema description.)
+class _JobAnalysisRoleKnown(JobAnalysis):
+    role_category: SkipJsonSchema[str] = "general"
+
+_SYSTEM_HEAD = """\
 당신은 채용공고 분석 전문가입니다. 주어진 채용공고를 분석하여 구직자가 이력서를 맞춤화하는 데 필요한 핵심 정보를 추출합니다.
 
 반드시 아래 JSON 형식으로만 응답하세요:
@@ -22,8 +82,12 @@ SYSTEM_PROMPT = """\
   "tone": "formal/casual/technical",
   "key_responsibilities": ["핵심 업무 1", "핵심 업무 2"],
   "preferred_qualifications": ["우대사항 1", "우대사항 2"],
-  "years_experience": "요구 경력 (예: 3-5년)",
-  "role_category": "tech/business/design/general 중 하나"
+  "years_experience": "요구 경력 (예: 3-5년)\""""
+
+_ROLE_FIELD = """,
+  "role_category": "tech/business/design/general 중 하나\""""
+
+_SYSTEM_NOTES = """
 }
 
 주의사항:
@@ -31,21 +95,36 @@ SYSTEM_PROMPT = """\
 - 영문 JD의 키워드는 "한국어 번역 (영문 원문)" 형태로 추출하세요. 예: "분쟁 해결 (dispute resolution)", "규제 준수 (regulatory compliance)". 단, 고유명사(회사명, 제품명)와 널리 쓰이는 약어(ATS, CRM 등)는 영어 그대로 유지합니다.
 - ats_keywords는 이력서에 반드시 포함되어야 할 키워드를 추출합니다
 - hard_skills와 soft_skills를 명확히 구분합니다
-- 채용공고에 명시되지 않은 내용은 추론하지 마세요
+- 채용공고에 명시되지 않은 내용은 추론하지 마세요"""
+
+_ROLE_RULES = """
 - role_category 분류 기준:
   tech: 소프트웨어 개발, 데이터 엔지니어링, DevOps, QA, 인프라
   business: 전략기획, PM, 컨설팅, 사업개발, 마케팅, 경영지원
   design: UX/UI, 프로덕트 디자인, 그래픽 디자인, 브랜드
   general: 위에 해당하지 않는 직군"""
 
+SYSTEM_PROMPT = _SYSTEM_HEAD + _ROLE_FIELD + _SYSTEM_NOTES + _ROLE_RULES
+# Used when classify_role() has already settled the role category
+_SYSTEM_PROMPT_ROLE_KNOWN = _SYSTEM_HEAD + _SYSTEM_NOTES
+
 
 class JDAnalyst:
     def __init__(self, llm: LLMClient, model: str = "claude-haiku-4-5-20251001"):
         self.llm = llm
         self.model = model
+        self._memo: AsyncMemo[JobAnalysis] = AsyncMemo()
 
     async def analyze(self, jd_text: str) -> JobAnalysis:
-        """Analyze a job description and return structured analysis."""
+        """Analyze a job description and return structured analysis.
+
+        Results are memoized per instance by JD content, so repeated runs
+        over the same posting skip the LLM call.
+        """
+        key = hashlib.blake2b(jd_text.encode(), digest_size=16).hexdigest()
+        return await self._memo.get_or_compute(key, lambda: self._analyze(jd_text))
+
+    async def _analyze(self, jd_text: str) -> JobAnalysis:
         logger.info("Analyzing JD...")
         prompt = f"""다음 채용공고를 분석하세요:
 
@@ -55,11 +134,16 @@ class JDAnalyst:
 
 JSON 형식으로만 응답하세요."""
 
+        # A clear-cut role category is set here rather than asked of the model
+        role = classify_role(jd_text)
         data = await self.llm.generate_json(
             prompt=prompt,
-            system=SYSTEM_PROMPT,
+            system=SYSTEM_PROMPT if role is None else _SYSTEM_PROMPT_ROLE_KNOWN,
             model=self.model,
+            schema=JobAnalysis if role is None else _JobAnalysisRoleKnown,
         )
         if not isinstance(data, dict):
             raise ValueError(f"Expected dict from LLM, got {type(data).__name__}")
-        return JobAnalysis(**data)
+        if role is not None:
+            data["role_category"] = role
+        return JobAnalysis.model_validate(data)
@@ -14,7 +14,7 @@ from resume_tailor.clients.search_client import SearchClient
 from resume_tailor.models.company import CompanyProfile
 from resume_tailor.models.job import JobAnalysis
 from resume_tailor.models.qa import QAResult
-from resume_tailor.models.resume import TailoredResume
+from resume_tailor.models.resume import ResumeSection, TailoredResume
 from resume_tailor.models.strategy import ResumeStrategy
 from resume_tailor.pipeline.company_researcher import CompanyResearcher
 from resume_tailor.pipeline.jd_analyst import JDAnalyst
@@ -30,6 +30,10 @@ TEMPLATE_MAP: dict[str, str] = {
     "design": "korean_standard",
 }
 
+# A failing QA score at most this far below the threshold is fixed with
+# targeted edits (ResumeWriter.patch) instead of a full rewrite
+PATCH_MARGIN = 5
+
 
 @dataclass
 class PipelineResult:
@@ -68,7 +72,7 @@ class PipelineOrchestrator:
         self.researcher = CompanyResearcher(llm, search, model=haiku_model)
         self.jd_analyst = JDAnalyst(llm, model=haiku_model)
         self.strategy_planner = StrategyPlanner(llm, model=sonnet_model)
-        self.resume_writer = ResumeWriter(llm, model=sonnet_model)
+        self.resume_writer = ResumeWriter(llm, model=sonnet_model, patch_model=haiku_model)
         self.qa_reviewer = QAReviewer(llm, model=haiku_model)
         self.qa_threshold = qa_threshold
         self.max_rewrites = max_rewrites
@@ -142,30 +146,64 @@ class PipelineOrchestrator:
 
         _notify("writing", "이력서 작성 중")
         logger.info("Starting resume writing")
+        def _on_section(section: ResumeSection) -> None:
+            _notify("section_ready", f"섹션 작성 완료: {section.label}")
+
+        # Stream the first draft section by section when progress is watched
         resume = await self.resume_writer.write(
             strategy, resume_text, template, language=language, role_category=effective_category,
+            on_section=_on_section if on_phase else None,
         )
         logger.info("Resume writing complete")
 
         _notify("qa", "품질 검수 중")
         logger.info("Starting QA review")
+        # A failing review that only triggers a full rewrite can stop at the
+        # score; borderline ones keep their issues for patching
+        patch_floor = self.qa_threshold - PATCH_MARGIN
         qa = await self.qa_reviewer.review(
-            resume.full_markdown, resume_text, jd_text
+            resume.full_markdown, resume_text, jd_text,
+            job=job, stop_if_failing=self.max_rewrites > 0, stop_below=patch_floor,
         )
         logger.info("QA review complete: score=%d, pass=%s", qa.overall_score, qa.pass_)
 
         # --- QA rewrite loop ---
-        rewrites = 0
-        while not qa.pass_ and rewrites < self.max_rewrites:
-            _notify("rewrite", f"QA 점수 {qa.overall_score} < {self.qa_threshold}, 재작성 중")
-            logger.info("QA score %d < %d, starting rewrite #%d", qa.overall_score, self.qa_threshold, rewrites + 1)
-            resume = await self.resume_writer.write(
+        def _rewrite():
+            return self.resume_writer.write(
                 strategy, resume_text, template, language=language, role_category=effective_category,
             )
-            qa = await self.qa_reviewer.review(
-                resume.full_markdown, resume_text, jd_text
-            )
-            rewrites += 1
+
+        rewrites = 0
+        next_resume: asyncio.Task[TailoredResume] | None = None
+        try:
+            while not qa.pass_ and rewrites < self.max_rewrites:
+                patched = None
+                # A rewrite already under way is used as is
+                if next_resume is None and qa.overall_score >= patch_floor:
+                    _notify("rewrite", f"QA 점수 {qa.overall_score} < {self.qa_threshold}, 부분 수정 중")
+                    logger.info("QA score %d < %d, patching (attempt #%d)", qa.overall_score, self.qa_threshold, rewrites + 1)
+                    patched = await self.resume_writer.patch(resume, qa, resume_text)
+                if patched is not None:
+                    resume = patched
+                else:
+                    _notify("rewrite", f"QA 점수 {qa.overall_score} < {self.qa_threshold}, 재작성 중")
+                    logger.info("QA score %d < %d, starting rewrite #%d", qa.overall_score, self.qa_threshold, rewrites + 1)
+                    resume = await (next_resume or _rewrite())
+                next_resume = None
+                rewrites += 1
+                review = self.qa_reviewer.review(
+                    resume.full_markdown, resume_text, jd_text,
+                    job=job, stop_if_failing=rewrites < self.max_rewrites, stop_below=patch_floor,
+                )
+                # A rewrite does not depend on the previous review, so once a
+                # rewrite has already failed QA, write the next one while this
+                # review runs; it is cancelled if the review passes.
+                if rewrites < self.max_rewrites:
+                    next_resume = asyncio.create_task(_rewrite())
+                qa = await review
+        finally:
+            if next_resume is not None:
+                next_resume.cancel()
 
         elapsed = time.monotonic() - start
         logger.info("Pipeline complete: score=%d, rewrites=%d, elapsed=%.1fs", qa.overall_score, rewrites, elapsed)
@@ -193,9 +231,37 @@ class PipelineOrchestrator:
             total_output_tokens=token_summary["output"],
             search_count=search_count,
             estimated_cost_usd=cost,
-            metadata={"role_category": effective_category},
+            metadata={
+                "role_category": effective_category,
+                "cache_read_tokens": token_summary["cache_read"],
+                "cache_creation_tokens": token_summary["cache_creation"],
+            },
         )
 
+    async def run_batch(
+        self, jobs: list[dict], concurrency: int = 3
+    ) -> list[PipelineResult | BaseException]:
+        """Tailor the same resume for several postings concurrently.
+
+        Each job is a dict of ``run`` keyword arguments. At most
+        ``concurrency`` pipelines are in flight at once; rate-limit (429)
+        retries are left to the LLM client. Results come back in job order,
+        with the exception in place of the result for a job that failed, so
+        one bad posting does not discard the others.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(job: dict) -> PipelineResult:
+            async with sem:
+                # Each job runs in its own task; keep its usage apart from
+                # the other runs sharing these clients
+                self.llm.track_task_usage()
+                if hasattr(self.search, "track_task_usage"):
+                    self.search.track_task_usage()
+                return await self.run(**job)
+
+        return await asyncio.gather(*(_one(job) for job in jobs), return_exceptions=True)
+
     async def research_only(self, company_name: str) -> CompanyProfile:
         """Run company research only (useful for caching)."""
         return await self.researcher.research(company_name)
@@ -3,12 +3,44 @@
 from __future__ import annotations
 
 import logging
+import re
+
+from pydantic import BaseModel
 
 from resume_tailor.clients.llm_client import LLMClient
+from resume_tailor.models.job import JobAnalysis
 from resume_tailor.models.qa import QAResult
+from resume_tailor.utils.json_parser import extract_json
 
 logger = logging.getLogger(__name__)
 
+# Must match the "pass" rule in SYSTEM_PROMPT
+PASS_SCORE = 80
+
+# A fully emitted integer field ("key": 87,) in the partially streamed JSON
+_INT_FIELD_RE = re.compile(r'"(\w+)"\s*:\s*(\d+)\s*[,}]')
+# Longer than any such field, so text before this tail never needs rescanning
+_FIELD_TAIL = 64
+# Fields that precede overall_score and are required to build a QAResult
+_SCORE_FIELDS = frozenset({"factual_accuracy", "keyword_coverage", "template_compliance"})
+# overall_score weights; must match the "overall_score" rule in SYSTEM_PROMPT
+_SCORE_WEIGHTS = {
+    "factual_accuracy": 0.3,
+    "keyword_coverage": 0.2,
+    "template_compliance": 0.2,
+    "content_richness": 0.2,
+    "detail_depth": 0.1,
+}
+# Axes still scored by the model when keyword coverage is computed locally
+_JUDGED_FIELDS = frozenset(_SCORE_WEIGHTS) - {"keyword_coverage"}
+
+_EXAMPLE_RULES = """\
+suggestion_examples 작성 규칙:
+- suggestions와 1:1 대응 (같은 인덱스)
+- 각 예시는 이력서에 바로 넣을 수 있는 구체적 문장으로 작성
+- 예: suggestion이 "Python 키워드를 추가하세요"이면, example은 "Python 3.11 기반 REST API 서버 개발 및 운영 (일 평균 10만 요청 처리)"
+"""
+
 SYSTEM_PROMPT = """\
 당신은 이력서 품질 검수 전문가입니다. 생성된 이력서를 원본과 비교하여 5가지 축으로 평가합니다.
 
@@ -39,11 +71,7 @@ SYSTEM_PROMPT = """\
   "pass": true/false
 }
 
-suggestion_examples 작성 규칙:
-- suggestions와 1:1 대응 (같은 인덱스)
-- 각 예시는 이력서에 바로 넣을 수 있는 구체적 문장으로 작성
-- 예: suggestion이 "Python 키워드를 추가하세요"이면, example은 "Python 3.11 기반 REST API 서버 개발 및 운영 (일 평균 10만 요청 처리)"
-
+""" + _EXAMPLE_RULES + """
 채점 기준:
 - factual_accuracy: 원본에 없는 정보가 있으면 -20점/건
 - keyword_coverage: (포함된 키워드 수 / 총 키워드 수) × 100
@@ -53,6 +81,54 @@ suggestion_examples 작성 규칙:
 - overall_score: 가중 평균 (정확성 30%, 키워드 20%, 템플릿 20%, 충실도 20%, 깊이 10%)
 - pass: overall_score >= 80"""
 
+# Used when keyword coverage is computed locally: the model scores only the
+# judgement axes, and overall_score / pass are derived from them in Python.
+JUDGED_SYSTEM_PROMPT = """\
+당신은 이력서 품질 검수 전문가입니다. 생성된 이력서를 원본과 비교하여 4가지 축으로 평가합니다.
+키워드 커버리지는 별도로 계산되므로 평가하지 마세요.
+
+평가 기준:
+1. **사실 정확성 (factual_accuracy)**: 원본에 없는 경력, 기술, 수치가 추가되었는지 확인
+2. **템플릿 준수 (template_compliance)**: 요청된 섹션 구조를 따르는지 확인
+3. **내용 충실도 (content_richness)**: 이력서가 충분히 구체적이고 풍부한가
+   - 정량적 근거 (매출, 사용자 수, % 등 수치) 포함 여부
+   - 성과의 구체성 (모호한 서술 vs 명확한 결과)
+   - 기술/방법론 언급의 깊이
+   - 업무 범위/규모 명확성
+4. **서술 깊이 (detail_depth)**: 각 경력 항목이 충분히 상세하게 서술되었는가
+   - 경력 항목당 3개 이상의 bullet point로 상세 설명
+   - 기술이 단순 나열이 아니라 사용 맥락과 함께 서술
+
+반드시 아래 JSON 형식으로만 응답하세요:
+{
+  "factual_accuracy": 0-100,
+  "template_compliance": 0-100,
+  "content_richness": 0-100,
+  "detail_depth": 0-100,
+  "issues": ["발견된 문제점 1", "문제점 2"],
+  "suggestions": ["개선 제안 1", "제안 2"],
+  "suggestion_examples": ["제안 1에 대한 구체적 예시 문장", "제안 2에 대한 구체적 예시 문장"]
+}
+
+""" + _EXAMPLE_RULES + """
+채점 기준:
+- factual_accuracy: 원본에 없는 정보가 있으면 -20점/건
+- template_compliance: 필수 섹션 누락 시 -20점/건
+- content_richness: 정량적 근거 부재 -15점, 모호한 서술 -10점/건, 기술 맥락 없음 -10점
+- detail_depth: 경력 항목에 bullet 2개 이하 -15점/건, 기술 단순 나열 -10점"""
+
+
+class _JudgedQA(BaseModel):
+    """Review fields the model fills in when keyword coverage is computed locally."""
+
+    factual_accuracy: int
+    template_compliance: int
+    content_richness: int
+    detail_depth: int
+    issues: list[str]
+    suggestions: list[str]
+    suggestion_examples: list[str] = []
+
 
 class QAReviewer:
     def __init__(self, llm: LLMClient, model: str = "claude-haiku-4-5-20251001"):
@@ -64,27 +140,57 @@ class QAReviewer:
         generated_resume: str,
         original_resume: str,
         jd_text: str,
+        *,
+        job: JobAnalysis | None = None,
+        stop_if_failing: bool = False,
+        stop_below: int = PASS_SCORE,
     ) -> QAResult:
-        """Review a generated resume against the original and JD."""
-        logger.info("Reviewing resume quality...")
-        prompt = f"""다음 생성된 이력서를 검수하세요.
+        """Review a generated resume against the original and JD.
 
-## 생성된 이력서
-{generated_resume}
+        With ``job``, keyword coverage is computed here from its ATS keywords
+        instead of being counted by the model. The model then scores only the
+        remaining axes, and ``overall_score`` and the pass flag are derived
+        from the weighted axes.
+
+        With ``stop_if_failing`` the response is streamed and generation is
+        aborted as soon as the overall score is below ``stop_below`` (the
+        pass score by default). The result then has scores only, with no
+        issues or suggestions. Use it when a failing review is only needed to
+        trigger a rewrite.
+        """
+        logger.info("Reviewing resume quality...")
+        coverage = None
+        if job is not None and job.ats_keywords:
+            coverage = _keyword_coverage(generated_resume, job.ats_keywords)
+        # The original resume and JD are identical across rewrite reviews, so
+        # they go in the prompt-cached system block; only the draft varies.
+        system = f"""{SYSTEM_PROMPT if coverage is None else JUDGED_SYSTEM_PROMPT}
 
 ## 원본 이력서
 {original_resume}
 
 ## 채용공고
-{jd_text}
+{jd_text}"""
+
+        prompt = f"""다음 생성된 이력서를 검수하세요.
+
+## 생성된 이력서
+{generated_resume}
 
 위 평가 기준에 따라 점수를 매기고 JSON 형식으로만 응답하세요."""
 
-        data = await self.llm.generate_json(
-            prompt=prompt,
-            system=SYSTEM_PROMPT,
-            model=self.model,
-        )
+        if stop_if_failing:
+            data = await self._stream_until_fail(prompt, system, coverage, stop_below)
+        else:
+            data = await self.llm.generate_json(
+                prompt=prompt,
+                system=system,
+                model=self.model,
+                cache_system=True,
+                schema=QAResult if coverage is None else _JudgedQA,
+            )
+        if coverage is not None:
+            _apply_coverage(data, coverage)
 
         # Handle "pass" being a Python keyword
         if "pass" in data and "pass_" not in data:
@@ -93,11 +199,82 @@ class QAReviewer:
         # Defensive padding: ensure suggestion_examples matches suggestions length
         suggestions = data.get("suggestions", [])
         examples = data.get("suggestion_examples", [])
-        if len(examples) < len(suggestions):
+        missing = len(suggestions) - len(examples)
+        if missing > 0:
             logger.warning(
                 "LLM returned %d suggestion_examples for %d suggestions; padding with empty strings",
                 len(examples), len(suggestions),
             )
-            data["suggestion_examples"] = examples + [""] * (len(suggestions) - len(examples))
+            examples.extend([""] * missing)
+            data["suggestion_examples"] = examples
+
+        return QAResult.model_validate(data)
+
+    async def _stream_until_fail(
+        self,
+        prompt: str,
+        system: str,
+        coverage: int | None = None,
+        stop_below: int = PASS_SCORE,
+    ) -> dict:
+        """Stream the review JSON, cutting it short once the score fails.
+
+        With a locally computed ``coverage`` the score is known as soon as
+        the model's own axes are out.
+        """
+        text = ""
+        fields: dict[str, int] = {}
+        scanned = 0
+        decided = False
+        stream = self.llm.generate_stream(
+            prompt=prompt,
+            system=system,
+            model=self.model,
+            cache_system=True,
+        )
+        try:
+            async for chunk in stream:
+                text += chunk
+                if decided:
+                    continue
+                # Only scan text not yet scanned, keeping a short tail in case
+                # a field was split across chunks.
+                for m in _INT_FIELD_RE.finditer(text, scanned):
+                    fields[m[1]] = int(m[2])
+                    scanned = m.end()
+                scanned = max(scanned, len(text) - _FIELD_TAIL)
+                if coverage is not None:
+                    if not _JUDGED_FIELDS <= fields.keys():
+                        continue
+                    _apply_coverage(fields, coverage)
+                score = fields.get("overall_score")
+                if score is None:
+                    continue
+                decided = True
+                if score < stop_below and _SCORE_FIELDS <= fields.keys():
+                    logger.info("QA score %d is failing; stopping review early", score)
+                    return {**fields, "issues": [], "suggestions": [], "pass": False}
+        finally:
+            await stream.aclose()
+        return extract_json(text)
+
+
+def _keyword_coverage(resume_md: str, keywords: list[str]) -> int:
+    """Percentage of keywords found in the resume, case-insensitively."""
+    text = resume_md.casefold()
+    found = sum(1 for k in keywords if k.casefold() in text)
+    return round(found * 100 / len(keywords))
+
+
+def _apply_coverage(data: dict, coverage: int) -> None:
+    """Set keyword coverage and, given every judged axis, the overall score.
 
-        return QAResult(**data)
+    If the model left out an axis, its own ``overall_score`` and pass flag
+    (when present) are kept rather than scoring the missing axis as 0.
+    """
+    data["keyword_coverage"] = coverage
+    if not _JUDGED_FIELDS <= data.keys():
+        return
+    overall = round(sum(w * data[k] for k, w in _SCORE_WEIGHTS.items()))
+    data["overall_score"] = overall
+    data["pass"] = overall >= PASS_SCORE
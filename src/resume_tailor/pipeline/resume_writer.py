@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
+import re
+from collections.abc import Callable
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from resume_tailor.clients.llm_client import LLMClient
 
 logger = logging.getLogger(__name__)
+from resume_tailor.models.qa import QAResult
 from resume_tailor.models.resume import ResumeSection, TailoredResume
 from resume_tailor.models.strategy import ResumeStrategy
 from resume_tailor.templates.loader import ResumeTemplate
+from resume_tailor.utils.json_parser import extract_json
+
+# Opening of the "sections" array in the streamed JSON reply
+_SECTIONS_START_RE = re.compile(r'"sections"\s*:\s*\[')
+_DECODER = json.JSONDecoder()
+# Validates the whole sections list in one pydantic-core call
+_SECTIONS_ADAPTER = TypeAdapter(list[ResumeSection])
 
 EXPERIENCE_FORMAT = {
     "tech": """각 경력 항목은 프로젝트 단위로 구분하여 STAR 형식으로 작성합니다.
@@ -79,10 +93,37 @@ Respond ONLY in this JSON format:
 }}"""
 
 
+PATCH_SYSTEM_PROMPT = """\
+당신은 이력서 교정 전문가입니다. 검수 결과를 반영하여 이력서에서 고쳐야 할 부분만 최소한으로 수정합니다.
+
+규칙:
+1. 이력서 전체를 다시 쓰지 말고, 고칠 문장만 수정안(edits)으로 제시합니다.
+2. old에는 현재 이력서의 문자열을 공백과 줄바꿈까지 글자 그대로 복사합니다.
+3. new에는 old를 대체할 문자열을 씁니다. section_id에는 old가 있는 섹션 ID를 씁니다.
+4. 원본 이력서에 있는 사실만 사용합니다. 새로운 경험이나 수치를 만들지 마세요.
+5. 현재 이력서의 언어, 톤, 마크다운 서식을 유지합니다."""
+
+
+class _Edit(BaseModel):
+    section_id: str = ""
+    old: str
+    new: str
+
+
+class _Patch(BaseModel):
+    edits: list[_Edit]
+
+
 class ResumeWriter:
-    def __init__(self, llm: LLMClient, model: str = "claude-sonnet-4-5-20250929"):
+    def __init__(
+        self,
+        llm: LLMClient,
+        model: str = "claude-sonnet-4-5-20250929",
+        patch_model: str = "claude-haiku-4-5-20251001",
+    ):
         self.llm = llm
         self.model = model
+        self.patch_model = patch_model
 
     async def write(
         self,
@@ -92,35 +133,52 @@ class ResumeWriter:
         *,
         language: str = "ko",
         role_category: str = "general",
+        on_section: Callable[[ResumeSection], None] | None = None,
     ) -> TailoredResume:
-        """Generate a tailored resume based on strategy and template."""
+        """Generate a tailored resume based on strategy and template.
+
+        With ``on_section`` the reply is streamed and each section is passed
+        to the callback as soon as its JSON object is complete, well before
+        the whole resume has been generated.
+        """
         logger.info("Writing resume...")
-        template_spec = self._format_template(template)
-        strategy_spec = self._format_strategy(strategy)
+        template_spec = _format_template(
+            template.name,
+            tuple((s.id, s.label, s.required, s.max_length, s.content_type) for s in template.sections),
+        )
+        # QA rewrites pass the same strategy again; its JSON dump is the key
+        strategy_spec = _format_strategy(strategy.model_dump_json())
 
         exp_format = EXPERIENCE_FORMAT.get(role_category, EXPERIENCE_FORMAT["general"])
         system_prompt_template = SYSTEM_PROMPT_EN if language == "en" else SYSTEM_PROMPT_KO
+        # Template and original resume are reused by QA rewrites, so they go
+        # in the prompt-cached system block ahead of the strategy.
         system_prompt = system_prompt_template.format(experience_format=exp_format)
-
-        prompt = f"""다음 전략과 템플릿에 따라 맞춤 이력서를 작성하세요.
+        system_prompt = f"""{system_prompt}
 
 ## 템플릿 구조 (반드시 이 순서와 섹션을 따르세요)
 {template_spec}
 
+## 원본 이력서
+{resume_text}"""
+
+        prompt = f"""다음 전략과 템플릿에 따라 맞춤 이력서를 작성하세요.
+
 ## 맞춤화 전략
 {strategy_spec}
 
-## 원본 이력서
-{resume_text}
-
 위 템플릿 구조의 각 섹션에 맞춰 이력서를 작성하세요. JSON 형식으로만 응답하세요."""
 
-        data = await self.llm.generate_json(
-            prompt=prompt,
-            system=system_prompt,
-            model=self.model,
-            temperature=0.3,
-        )
+        if on_section is None:
+            data = await self.llm.generate_json(
+                prompt=prompt,
+                system=system_prompt,
+                model=self.model,
+                temperature=0.3,
+                cache_system=True,
+            )
+        else:
+            data = await self._stream_sections(prompt, system_prompt, on_section)
 
         if not isinstance(data, dict):
             if isinstance(data, list):
@@ -128,7 +186,7 @@ class ResumeWriter:
             else:
                 data = {"sections": [], "full_markdown": str(data)}
 
-        sections = [ResumeSection(**s) for s in data.get("sections", [])]
+        sections = _SECTIONS_ADAPTER.validate_python(data.get("sections", []))
         full_md = data.get("full_markdown", "")
 
         if not full_md and sections:
@@ -140,41 +198,158 @@ class ResumeWriter:
             metadata={},
         )
 
-    def _format_template(self, template: ResumeTemplate) -> str:
-        lines = [f"템플릿: {template.name}\n"]
-        for s in template.sections:
-            req = "필수" if s.required else "선택"
-            line = f"- [{s.id}] {s.label} ({req})"
-            if s.max_length:
-                line += f" | 최대 {s.max_length}자"
-            if s.content_type:
-                line += f" | 형식: {s.content_type}"
-            lines.append(line)
-        return "\n".join(lines)
-
-    def _format_strategy(self, strategy: ResumeStrategy) -> str:
-        parts = []
-        parts.append(f"톤앤매너: {strategy.tone_guidance}")
-        parts.append(f"자기소개 방향: {strategy.summary_direction}")
-        parts.append(f"\n강조 포인트: {', '.join(strategy.emphasis_points)}")
-
-        parts.append("\n키워드 배치 계획:")
-        for kp in strategy.keyword_plan:
-            parts.append(f"  - '{kp.keyword}' → {kp.placement}")
-
-        parts.append("\n매칭 분석:")
-        for m in strategy.match_matrix:
-            parts.append(f"  - [{m.strength}] {m.requirement} ← {m.my_experience}")
-
-        if strategy.gaps:
-            parts.append("\n갭 분석:")
-            for g in strategy.gaps:
-                parts.append(f"  - {g.requirement}: {g.mitigation}")
-
-        return "\n".join(parts)
+    async def patch(
+        self, resume: TailoredResume, qa: QAResult, resume_text: str
+    ) -> TailoredResume | None:
+        """Fix the issues a QA review found with targeted edits.
+
+        Instead of generating the whole resume again, the (cheaper) patch
+        model returns old/new string pairs that are applied in place.
+        Returns ``None`` when none of the edits could be applied, so the
+        caller can fall back to a full rewrite.
+        """
+        logger.info("Patching resume...")
+        feedback = [f"- {issue}" for issue in qa.issues]
+        for suggestion, example in zip(qa.suggestions, qa.suggestion_examples):
+            feedback.append(f"- {suggestion}" + (f" (예시: {example})" if example else ""))
+
+        prompt = f"""다음 검수 결과를 반영하여 이력서를 최소한으로 수정하세요.
+
+## 현재 이력서
+{resume.full_markdown}
+
+## 검수 결과 (점수 {qa.overall_score})
+{chr(10).join(feedback)}
+
+고쳐야 할 부분만 edits로 응답하세요."""
+
+        data = await self.llm.generate_json(
+            prompt=prompt,
+            system=f"{PATCH_SYSTEM_PROMPT}\n\n## 원본 이력서\n{resume_text}",
+            model=self.patch_model,
+            cache_system=True,
+            schema=_Patch,
+        )
+        try:
+            edits = _Patch.model_validate(data).edits
+        except ValidationError:
+            logger.warning("Unusable patch response; falling back to a rewrite", exc_info=True)
+            return None
+        return _apply_edits(resume, edits)
+
+    async def _stream_sections(
+        self, prompt: str, system: str, on_section: Callable[[ResumeSection], None]
+    ) -> dict:
+        """Stream the resume JSON, reporting each section once it closes."""
+        text = ""
+        pos: int | None = None
+        stream = self.llm.generate_stream(
+            prompt=prompt,
+            system=system,
+            model=self.model,
+            temperature=0.3,
+            cache_system=True,
+        )
+        try:
+            async for chunk in stream:
+                text += chunk
+                if pos is None:
+                    m = _SECTIONS_START_RE.search(text)
+                    if m is None:
+                        continue
+                    pos = m.end()
+                elif "}" not in chunk:
+                    # No section object can have closed in this chunk
+                    continue
+                pos = _emit_sections(text, pos, on_section)
+        finally:
+            await stream.aclose()
+        return extract_json(text)
 
     def _build_markdown(self, sections: list[ResumeSection]) -> str:
-        parts = []
-        for s in sections:
-            parts.append(f"## {s.label}\n\n{s.content}")
-        return "\n\n".join(parts)
+        return "\n\n".join(f"## {s.label}\n\n{s.content}" for s in sections)
+
+
+@functools.lru_cache(maxsize=16)
+def _format_template(
+    name: str,
+    sections: tuple[tuple[str, str, bool, int | None, str | None], ...],
+) -> str:
+    """Render the template outline from (id, label, required, max_length, content_type)."""
+    lines = [f"템플릿: {name}\n"]
+    for section_id, label, required, max_length, content_type in sections:
+        req = "필수" if required else "선택"
+        limit = f" | 최대 {max_length}자" if max_length else ""
+        kind = f" | 형식: {content_type}" if content_type else ""
+        lines.append(f"- [{section_id}] {label} ({req}){limit}{kind}")
+    return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=16)
+def _format_strategy(strategy_json: str) -> str:
+    """Render a strategy, given as ``ResumeStrategy.model_dump_json()``."""
+    strategy = ResumeStrategy.model_validate_json(strategy_json)
+    parts = [
+        f"톤앤매너: {strategy.tone_guidance}",
+        f"자기소개 방향: {strategy.summary_direction}",
+        f"\n강조 포인트: {', '.join(strategy.emphasis_points)}",
+        "\n키워드 배치 계획:",
+    ]
+    parts.extend(f"  - '{kp.keyword}' → {kp.placement}" for kp in strategy.keyword_plan)
+
+    parts.append("\n매칭 분석:")
+    parts.extend(
+        f"  - [{m.strength}] {m.requirement} ← {m.my_experience}" for m in strategy.match_matrix
+    )
+
+    if strategy.gaps:
+        parts.append("\n갭 분석:")
+        parts.extend(f"  - {g.requirement}: {g.mitigation}" for g in strategy.gaps)
+
+    return "\n".join(parts)
+
+
+def _emit_sections(
+    text: str, pos: int, on_section: Callable[[ResumeSection], None]
+) -> int:
+    """Report the complete section objects in ``text`` from ``pos`` onward.
+
+    Returns the position to resume from once more text has streamed in.
+    """
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos == len(text) or text[pos] != "{":
+            return pos
+        try:
+            obj, end = _DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return pos  # still being generated
+        pos = end
+        try:
+            section = ResumeSection.model_validate(obj)
+        except ValidationError:
+            logger.warning("Skipping malformed streamed section", exc_info=True)
+            continue
+        on_section(section)
+
+
+def _apply_edits(resume: TailoredResume, edits: list[_Edit]) -> TailoredResume | None:
+    """Apply old/new string edits to a resume; ``None`` if none matched."""
+    full_md = resume.full_markdown
+    sections = [s.model_copy() for s in resume.sections]
+    applied = 0
+    for edit in edits:
+        if not edit.old or edit.old not in full_md:
+            logger.debug("Patch edit not found in resume: %r", edit.old[:40])
+            continue
+        full_md = full_md.replace(edit.old, edit.new, 1)
+        applied += 1
+        # Prefer the section the edit names, then any section containing it
+        for s in sorted(sections, key=lambda s: s.id != edit.section_id):
+            if edit.old in s.content:
+                s.content = s.content.replace(edit.old, edit.new, 1)
+                break
+    if not applied:
+        return None
+    return TailoredResume(sections=sections, full_markdown=full_md, metadata=resume.metadata)
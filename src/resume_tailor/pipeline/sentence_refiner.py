@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from resume_tailor.clients.llm_client import LLMClient
@@ -9,6 +10,9 @@ from resume_tailor.models.refinement import RefinementSuggestion
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on simultaneous refine calls, to stay within provider rate limits.
+MAX_CONCURRENT_REFINES = 8
+
 REFINE_SYSTEM = """\
 당신은 이력서 문장 개선 전문가입니다.
 주어진 문장에 대해 {num_alternatives}개의 대안을 제시합니다.
@@ -46,15 +50,17 @@ class SentenceRefiner:
         if not selected_text or not selected_text.strip():
             return []
 
-        system = REFINE_SYSTEM.replace("{num_alternatives}", str(num_alternatives))
-
-        prompt = f"""다음 이력서에서 선택된 문장의 대안을 {num_alternatives}개 제시하세요.
+        # The JD and resume stay the same while the user refines sentence
+        # after sentence, so they go in the prompt-cached system block.
+        system = f"""{REFINE_SYSTEM.replace("{num_alternatives}", str(num_alternatives))}
 
 채용공고:
 {jd_text}
 
 전체 이력서:
-{full_resume}
+{full_resume}"""
+
+        prompt = f"""위 이력서에서 선택된 문장의 대안을 {num_alternatives}개 제시하세요.
 
 선택된 문장:
 {selected_text}
@@ -66,6 +72,7 @@ class SentenceRefiner:
                 prompt=prompt,
                 system=system,
                 model=self.model,
+                cache_system=True,
             )
         except Exception:
             logger.exception("Sentence refinement LLM call failed")
@@ -73,6 +80,33 @@ class SentenceRefiner:
 
         return self._parse_suggestions(data, num_alternatives)
 
+    async def refine_many(
+        self,
+        selected_texts: list[str],
+        full_resume: str,
+        jd_text: str,
+        num_alternatives: int = 3,
+        language: str = "ko",
+    ) -> list[list[RefinementSuggestion]]:
+        """Refine several sentences concurrently.
+
+        Returns one suggestion list per input, in input order; a sentence
+        whose refinement fails gets an empty list.
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REFINES)
+
+        async def _one(text: str) -> list[RefinementSuggestion]:
+            async with sem:
+                return await self.refine(
+                    text, full_resume, jd_text,
+                    num_alternatives=num_alternatives, language=language,
+                )
+
+        results = await asyncio.gather(
+            *(_one(t) for t in selected_texts), return_exceptions=True
+        )
+        return [[] if isinstance(r, BaseException) else r for r in results]
+
     @staticmethod
     def _parse_suggestions(data, max_count: int) -> list[RefinementSuggestion]:
         """Parse LLM response into RefinementSuggestion list."""
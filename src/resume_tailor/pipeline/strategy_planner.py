@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 
 from resume_tailor.clients.llm_client import LLMClient
@@ -73,19 +74,15 @@ class StrategyPlanner:
     ) -> ResumeStrategy:
         """Create a tailoring strategy based on company, JD, and resume."""
         logger.info("Planning strategy...")
-        lang_note = ""
-        if language == "en":
-            lang_note = "\n\n**The final resume will be written in English. Plan keywords and tone accordingly.**"
-        else:
-            lang_note = "\n\n**최종 이력서는 한국어로 작성됩니다. 키워드, 톤, 전략을 모두 한국어 기준으로 수립하세요. 영문 JD의 용어는 한국어로 번역하여 사용합니다.**"
+        # Everything but the company and job is fixed for a given resume,
+        # language and role, so it forms the prompt-cached system block that
+        # tailoring one resume to several postings keeps reusing.
+        system = f"""{_system_head(language, role_category)}
 
-        role_hint = STRATEGY_HINTS.get(role_category, "")
-        if role_hint:
-            role_hint_section = f"\n\n## 직군별 전략 가이드\n{role_hint}"
-        else:
-            role_hint_section = ""
+## 지원자 이력서
+{resume_text}"""
 
-        prompt = f"""다음 정보를 바탕으로 이력서 맞춤화 전략을 수립하세요.{lang_note}
+        prompt = f"""다음 정보를 바탕으로 이력서 맞춤화 전략을 수립하세요.
 
 ## 회사 정보
 - 회사명: {company.name}
@@ -105,14 +102,25 @@ class StrategyPlanner:
 - 우대사항: {', '.join(job.preferred_qualifications)}
 - 톤: {job.tone}
 
-## 지원자 이력서
-{resume_text}
-{role_hint_section}
-JSON 형식으로만 응답하세요."""
+위 지원자 이력서를 기준으로 JSON 형식으로만 응답하세요."""
 
         data = await self.llm.generate_json(
             prompt=prompt,
-            system=SYSTEM_PROMPT,
+            system=system,
             model=self.model,
+            cache_system=True,
         )
-        return ResumeStrategy(**data)
+        return ResumeStrategy.model_validate(data)
+
+
+@functools.lru_cache(maxsize=16)
+def _system_head(language: str, role_category: str) -> str:
+    """SYSTEM_PROMPT plus the language note and role guide, built once per pair."""
+    if language == "en":
+        lang_note = "\n\n**The final resume will be written in English. Plan keywords and tone accordingly.**"
+    else:
+        lang_note = "\n\n**최종 이력서는 한국어로 작성됩니다. 키워드, 톤, 전략을 모두 한국어 기준으로 수립하세요. 영문 JD의 용어는 한국어로 번역하여 사용합니다.**"
+
+    role_hint = STRATEGY_HINTS.get(role_category, "")
+    role_hint_section = f"\n\n## 직군별 전략 가이드\n{role_hint}" if role_hint else ""
+    return f"{SYSTEM_PROMPT}{lang_note}{role_hint_section}"
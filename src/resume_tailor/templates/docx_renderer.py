@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import bisect
+import itertools
 import re
 from copy import deepcopy
 from pathlib import Path
@@ -9,10 +11,24 @@ from pathlib import Path
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Pt, RGBColor
+from docx.text.paragraph import Paragraph
 
 from resume_tailor.models.resume import TailoredResume
 from resume_tailor.parsers.resume_parser import EMOJI_PATTERN
 
+_PLACEHOLDER_RE = re.compile(r"\{\{(.+?)\}\}")
+_BOLD_SPLIT_RE = re.compile(r"(\*{2,3}.+?\*{2,3})")
+_BOLD_RE = re.compile(r"\*{2,3}(.+?)\*{2,3}")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_HR_RE = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+_BLANKS_RE = re.compile(r"\n{3,}")
+_EMOJI_RE = re.compile(EMOJI_PATTERN)
+# Emphasis, links and emojis in one alternation, so stripping inline
+# markdown is a single scan instead of one re.sub per construct
+_INLINE_MD = rf"\*{{1,3}}(?P<emph>.+?)\*{{1,3}}|\[(?P<link>[^\]]+)\]\([^)]+\)|{EMOJI_PATTERN}"
+_INLINE_MD_RE = re.compile(_INLINE_MD)
+# The same plus headers and horizontal rules, for whole-document text
+_MD_PLAIN_RE = re.compile(rf"^#{{1,6}}\s+|^-{{3,}}\s*$|{_INLINE_MD}", re.MULTILINE)
 
 # ---------------------------------------------------------------------------
 # Mode 1: Template-based placeholder replacement
@@ -44,16 +60,10 @@ def fill_docx_template(
     # Build replacement map
     replacements = _build_replacement_map(resume, extra_vars)
 
-    # Replace in paragraphs
-    for para in doc.paragraphs:
-        _replace_in_paragraph(para, replacements)
-
-    # Replace in table cells
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    _replace_in_paragraph(para, replacements)
+    # Replace in body paragraphs and table cells. One XPath query picks out
+    # the paragraphs containing "{{", so the rest are never wrapped.
+    for p in doc.element.body.xpath('.//w:p[contains(string(.), "{{")]'):
+        _replace_in_paragraph(Paragraph(p, doc), replacements)
 
     # Replace in headers/footers
     for section in doc.sections:
@@ -70,7 +80,11 @@ def _build_replacement_map(
     resume: TailoredResume,
     extra_vars: dict[str, str] | None = None,
 ) -> dict[str, str]:
-    """Build a {placeholder_key: content} map."""
+    """Build a {placeholder_key: content} map, keyed by lowercased key.
+
+    Placeholders match case-insensitively; when two keys differ only in
+    case, the first one added wins.
+    """
     m: dict[str, str] = {}
 
     # Full resume
@@ -85,98 +99,91 @@ def _build_replacement_map(
     if extra_vars:
         m.update(extra_vars)
 
-    return m
+    ci: dict[str, str] = {}
+    for key, value in m.items():
+        ci.setdefault(key.lower(), value)
+    return ci
 
 
 def _replace_in_paragraph(para, replacements: dict[str, str]) -> None:
     """Replace {{key}} placeholders in a paragraph, preserving formatting.
 
+    ``replacements`` is keyed by lowercased placeholder key.
+
     Handles the case where a placeholder may be split across multiple runs
     (e.g. Word sometimes splits {{자기소개}} into runs like "{{", "자기소개", "}}").
     """
-    full_text = para.text
+    runs = para.runs
+    texts = [run.text for run in runs]
+    full_text = "".join(texts)
     if "{{" not in full_text:
         return
 
-    # Find all placeholders in the combined text
-    pattern = re.compile(r"\{\{(.+?)\}\}")
-    matches = list(pattern.finditer(full_text))
+    def _fill(match: re.Match) -> str:
+        value = replacements.get(match.group(1).strip().lower())
+        # Replace markdown content with plain text for docx
+        return match.group(0) if value is None else _md_to_plain(value)
+
+    # Find the placeholders that have a value in the combined text
+    matches = [
+        m for m in _PLACEHOLDER_RE.finditer(full_text)
+        if m.group(1).strip().lower() in replacements
+    ]
     if not matches:
         return
 
-    # Try simple run-level replacement first (placeholder in single run)
-    for run in para.runs:
-        for match in pattern.finditer(run.text):
-            key = match.group(1).strip().lower()
-            for rkey, rval in replacements.items():
-                if rkey.lower() == key:
-                    # Replace markdown content with plain text for docx
-                    clean = _md_to_plain(rval)
-                    run.text = run.text.replace(match.group(0), clean)
-                    return
-
-    # If placeholders span multiple runs, rebuild the paragraph
-    for match in matches:
-        key = match.group(1).strip().lower()
-        for rkey, rval in replacements.items():
-            if rkey.lower() == key:
-                clean = _md_to_plain(rval)
-                _rebuild_paragraph_with_replacement(para, match.group(0), clean)
-                return
-
-
-def _rebuild_paragraph_with_replacement(para, placeholder: str, replacement: str) -> None:
-    """Rebuild paragraph runs when placeholder spans multiple runs."""
-    full_text = "".join(run.text for run in para.runs)
-    if placeholder not in full_text:
+    # Simple run-level replacement when no placeholder crosses a run boundary
+    ends = list(itertools.accumulate(len(t) for t in texts))
+    run_of = [bisect.bisect_right(ends, m.start()) for m in matches]
+    if all(m.end() <= ends[i] for m, i in zip(matches, run_of)):
+        for i in set(run_of):
+            runs[i].text = _PLACEHOLDER_RE.sub(_fill, texts[i])
         return
 
-    new_text = full_text.replace(placeholder, replacement)
+    # Otherwise rebuild the paragraph from the text already joined above
+    _rebuild_paragraph_with_replacement(runs, _PLACEHOLDER_RE.sub(_fill, full_text))
+
 
+def _rebuild_paragraph_with_replacement(runs: list, new_text: str) -> None:
+    """Put the replaced paragraph text into the first run and drop the rest."""
     # Preserve formatting from the first run
-    if para.runs:
-        fmt_run = para.runs[0]
-        # Clear all runs
-        for run in para.runs:
-            run.text = ""
-        fmt_run.text = new_text
+    fmt_run, *rest = runs
+    for run in rest:
+        run._element.getparent().remove(run._element)
+    fmt_run.text = new_text
 
 
 def _md_to_plain(md: str) -> str:
-    """Convert simple markdown to plain text for DOCX embedding."""
-    text = md
-    # Remove markdown headers
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-    # Remove bold/italic markers
-    text = re.sub(r"\*{1,3}(.+?)\*{1,3}", r"\1", text)
-    # Remove links [text](url) → text
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    # Remove horizontal rules
-    text = re.sub(r"^-{3,}\s*$", "", text, flags=re.MULTILINE)
-    # Remove emojis
-    text = re.sub(EMOJI_PATTERN, "", text)
-    # Remove excessive blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text.strip()
+    """Convert simple markdown to plain text for DOCX embedding.
+
+    Headers, horizontal rules, emphasis, links and emojis are stripped in
+    one pass; removed lines are then collapsed to at most one blank line.
+    """
+    text = _MD_PLAIN_RE.sub(_plain_inline, md)
+    return _BLANKS_RE.sub("\n\n", text).strip()
+
+
+def _plain_inline(match: re.Match) -> str:
+    """Replacement for the inline markdown patterns: keep only the text."""
+    inner = match.group("emph") or match.group("link")
+    if inner is None:
+        return ""
+    # Emphasis may wrap a link or emoji (and vice versa)
+    return _INLINE_MD_RE.sub(_plain_inline, inner)
 
 
 def list_docx_placeholders(template_path: str | Path) -> list[str]:
     """Scan a .docx template and return all {{placeholder}} keys found."""
     doc = Document(str(template_path))
     placeholders = set()
-    pattern = re.compile(r"\{\{(.+?)\}\}")
 
-    for para in doc.paragraphs:
-        for m in pattern.finditer(para.text):
+    # Read the <w:t> text of candidate paragraphs straight from the XML
+    # instead of building python-docx wrappers for every paragraph and cell
+    for p in doc.element.body.xpath('.//w:p[contains(string(.), "{{")]'):
+        text = "".join(p.xpath("./w:r/w:t/text() | ./w:hyperlink/w:r/w:t/text()"))
+        for m in _PLACEHOLDER_RE.finditer(text):
             placeholders.add(m.group(1).strip())
 
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    for m in pattern.finditer(para.text):
-                        placeholders.add(m.group(1).strip())
-
     return sorted(placeholders)
 
 
@@ -224,7 +231,7 @@ def _render_section(doc: Document, label: str, content: str) -> None:
             continue
 
         # Skip horizontal rules
-        if re.match(r"^-{3,}\s*$", line):
+        if _HR_RE.match(line):
             i += 1
             continue
 
@@ -258,12 +265,12 @@ def _add_rich_text(paragraph, text: str) -> None:
     # Remove emojis first
     text = _strip_emoji(text)
     # Remove link syntax [text](url) → text
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
+    text = _LINK_RE.sub(r"\1", text)
 
     # Split on bold markers and render with actual bold
-    parts = re.split(r"(\*{2,3}.+?\*{2,3})", text)
+    parts = _BOLD_SPLIT_RE.split(text)
     for part in parts:
-        bold_match = re.match(r"\*{2,3}(.+?)\*{2,3}", part)
+        bold_match = _BOLD_RE.match(part)
         if bold_match:
             run = paragraph.add_run(bold_match.group(1))
             run.bold = True
@@ -274,12 +281,9 @@ def _add_rich_text(paragraph, text: str) -> None:
 
 def _strip_emoji(text: str) -> str:
     """Remove common emoji/icon characters."""
-    return re.sub(EMOJI_PATTERN, "", text)
+    return _EMOJI_RE.sub("", text)
 
 
 def _strip_md_plain(text: str) -> str:
     """Strip inline markdown formatting to plain text."""
-    text = _strip_emoji(text)
-    text = re.sub(r"\*{1,3}(.+?)\*{1,3}", r"\1", text)
-    text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-    return text
+    return _INLINE_MD_RE.sub(_plain_inline, text)
@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 import yaml
@@ -24,14 +25,28 @@ TEMPLATES_DIR = Path(__file__).parent.parent.parent.parent / "templates"
 
 def load_template(name: str) -> ResumeTemplate:
     """Load a template by name from the templates directory."""
+    # A fresh model each call, so callers can't mutate a shared instance
+    return ResumeTemplate.model_validate_json(_template_json(name))
+
+
+@functools.lru_cache(maxsize=8)
+def _template_json(name: str) -> str:
+    # Bundled templates are fixed at runtime, so each YAML file is parsed
+    # once; the writer's template outline cache then sees identical input.
     path = TEMPLATES_DIR / f"{name}.yaml"
     if not path.exists():
         raise FileNotFoundError(f"Template not found: {name}")
     with open(path, encoding="utf-8") as f:
         data = yaml.safe_load(f)
-    return ResumeTemplate(**data)
+    return ResumeTemplate(**data).model_dump_json()
 
 
 def list_templates() -> list[str]:
     """List available template names."""
-    return [p.stem for p in TEMPLATES_DIR.glob("*.yaml")]
+    return list(_template_names())
+
+
+@functools.lru_cache(maxsize=1)
+def _template_names() -> tuple[str, ...]:
+    # The bundled templates directory does not change at runtime
+    return tuple(p.stem for p in TEMPLATES_DIR.glob("*.yaml"))
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
-import re
+from pydantic_core import from_json
 
 
 def extract_json(text: str) -> dict | list:
     """Extract JSON from LLM response, handling ```json blocks.
 
+    Parsing goes through pydantic-core's native ``from_json``, which is
+    several times faster than ``json.loads`` on large responses.
+
     Tries in order:
-    1. Direct json.loads on the full text
+    1. Direct parse of the full text
     2. Strip fenced code block markers and parse
     3. Find first '{' to last '}' and parse
     4. Find first '[' to last ']' and parse (JSON array)
@@ -20,16 +22,16 @@ def extract_json(text: str) -> dict | list:
 
     # 1) Direct parse
     try:
-        return json.loads(text)
-    except (json.JSONDecodeError, TypeError):
+        return from_json(text)
+    except ValueError:
         pass
 
     # 2) Strip fenced code block markers
     stripped = _strip_code_fences(text)
     if stripped != text:
         try:
-            return json.loads(stripped)
-        except json.JSONDecodeError:
+            return from_json(stripped)
+        except ValueError:
             pass
         # Also try { to } extraction on stripped text
         result = _extract_braces(stripped)
@@ -75,8 +77,8 @@ def _extract_braces(text: str) -> dict | None:
     end = text.rfind("}")
     if start != -1 and end != -1 and end > start:
         try:
-            return json.loads(text[start : end + 1])
-        except json.JSONDecodeError:
+            return from_json(text[start : end + 1])
+        except ValueError:
             pass
     return None
 
@@ -87,8 +89,8 @@ def _extract_brackets(text: str) -> list | None:
     end = text.rfind("]")
     if start != -1 and end != -1 and end > start:
         try:
-            return json.loads(text[start : end + 1])
-        except json.JSONDecodeError:
+            return from_json(text[start : end + 1])
+        except ValueError:
             pass
     return None
 
@@ -119,8 +121,8 @@ def _try_repair_truncated(text: str) -> dict | None:
     repaired += "]" * open_brackets + "}" * open_braces
 
     try:
-        return json.loads(repaired)
-    except json.JSONDecodeError:
+        return from_json(repaired)
+    except ValueError:
         pass
 
     # More aggressive: find last complete string value and truncate there
@@ -135,8 +137,8 @@ def _try_repair_truncated(text: str) -> dict | None:
             repaired = truncated.rstrip().rstrip(",")
             repaired += "]" * max(0, ol) + "}" * max(0, ob)
             try:
-                return json.loads(repaired)
-            except json.JSONDecodeError:
+                return from_json(repaired)
+            except ValueError:
                 pass
 
     return None
@@ -0,0 +1,39 @@
+"""Approximate token counting for trimming prompt context to a budget.
+
+Claude's tokenizer is not available offline, so counts are estimated per
+character class: ASCII text averages about four characters per token,
+while Hangul and other non-ASCII text costs far more per character. A
+fixed character cap therefore over-spends on Korean and under-uses the
+budget on English; these helpers even that out.
+"""
+
+from __future__ import annotations
+
+# Per-character costs in twentieths of a token, so sums stay exact:
+# 0.25 token per ASCII character, 0.7 per other character.
+_UNITS_PER_TOKEN = 20
+_ASCII_UNITS = 5
+_OTHER_UNITS = 14
+
+
+def _units(text: str) -> int:
+    other = len(text) - len(text.encode("ascii", "ignore"))
+    return (len(text) - other) * _ASCII_UNITS + other * _OTHER_UNITS
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate how many tokens ``text`` costs."""
+    return round(_units(text) / _UNITS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Return the longest prefix of ``text`` estimated to fit ``max_tokens``."""
+    limit = max_tokens * _UNITS_PER_TOKEN
+    if _units(text) <= limit:
+        return text
+    used = 0
+    for i, ch in enumerate(text):
+        used += _ASCII_UNITS if ch < "\x80" else _OTHER_UNITS
+        if used > limit:
+            return text[:i]
+    return text
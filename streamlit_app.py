@@ -8,6 +8,7 @@ Two modes:
 from __future__ import annotations
 
 import asyncio
+import io
 import json
 import logging
 import os
@@ -47,7 +48,7 @@ from resume_tailor.cache.company_cache import CompanyCache
 from resume_tailor.clients.llm_client import LLMClient
 from resume_tailor.clients.search_client import SearchClient
 from resume_tailor.config import load_config
-from resume_tailor.models.resume import ResumeSection, TailoredResume
+from resume_tailor.models.resume import TailoredResume
 from resume_tailor.parsers.form_parser import parse_text
 from resume_tailor.parsers.resume_parser import clean_markdown, parse_resume
 from resume_tailor.pipeline.form_filler import (
@@ -349,7 +350,7 @@ def _get_config():
 def _get_clients():
     config = _get_config()
     try:
-        llm = LLMClient(timeout=config.llm.timeout)
+        llm = LLMClient.from_config(config)
     except Exception as e:
         raise RuntimeError(f"LLM 클라이언트 초기화 실패 — ANTHROPIC_API_KEY를 확인하세요: {e}") from e
     try:
@@ -416,7 +417,7 @@ def _mode_resume_tailor():
         if jd_image_file and st.button("텍스트 추출"):
             with st.spinner("텍스트 추출 중..."):
                 try:
-                    llm_for_ocr = LLMClient(timeout=_get_config().llm.timeout)
+                    llm_for_ocr = LLMClient.from_config(_get_config())
                     extracted = _run_async(
                         extract_jd_from_file(
                             llm_for_ocr,
@@ -613,7 +614,9 @@ def _mode_resume_tailor():
         )
 
         try:
-            pdf_bytes = render_pdf(download_md, theme=selected_theme, title=f"{safe_fname}")
+            pdf_buffer = io.BytesIO()
+            render_pdf(download_md, theme=selected_theme, title=f"{safe_fname}", target=pdf_buffer)
+            pdf_buffer.seek(0)
             pdf_available = True
         except Exception:
             logger.exception("PDF rendering failed")
@@ -623,7 +626,7 @@ def _mode_resume_tailor():
         if pdf_available:
             st.download_button(
                 label="PDF 다운로드",
-                data=pdf_bytes,
+                data=pdf_buffer,
                 file_name=f"{safe_fname}.pdf",
                 mime="application/pdf",
                 type="primary",
@@ -669,7 +672,7 @@ def _mode_resume_tailor():
             if st.button("대안 생성", key="btn_refine") and selected.strip():
                 from resume_tailor.pipeline.sentence_refiner import SentenceRefiner
 
-                _refine_llm = LLMClient(timeout=_get_config().llm.timeout)
+                _refine_llm = LLMClient.from_config(_get_config())
                 refiner = SentenceRefiner(_refine_llm)
                 with st.spinner("대안 생성 중..."):
                     try:
@@ -765,7 +768,7 @@ def _mode_resume_tailor():
                             )
                         else:
                             st.info("플레이스홀더 없음 — AI 분석으로 양식을 채웁니다...")
-                            fill_llm = LLMClient(timeout=_get_config().llm.timeout)
+                            fill_llm = LLMClient.from_config(_get_config())
                             _run_async(
                                 smart_fill_docx(
                                     tmp_template_path, result.resume,
@@ -870,11 +873,7 @@ def _mode_form_answers():
             return
 
         resume_text = _parse_uploaded_resume(resume_file)
-        tailored = TailoredResume(
-            full_markdown=resume_text,
-            sections=[ResumeSection(id="full", label="전체", content=resume_text)],
-            metadata={},
-        )
+        tailored = TailoredResume.from_markdown(resume_text)
 
         # Parse questions
         form_questions = parse_text(questions_text)
@@ -884,7 +883,7 @@ def _mode_form_answers():
 
         st.info(f"발견된 문항: {len(form_questions)}개")
 
-        llm = LLMClient(timeout=_get_config().llm.timeout)
+        llm = LLMClient.from_config(_get_config())
 
         # Generate answers + structured fields in parallel
         async def _run_all():
@@ -1,10 +1,16 @@
 """Tests for company cache."""
 
+import asyncio
+import gc
+import sqlite3
 import time
+import weakref
 
 import pytest
 
 from resume_tailor.cache.company_cache import CompanyCache
+from resume_tailor.cache.llm_cache import LLMResponseCache, make_key
+from resume_tailor.cache.memo import AsyncMemo
 from resume_tailor.models.company import CompanyProfile
 
 
@@ -45,6 +51,12 @@ class TestCompanyCache:
         cache.put("  테스트  ", profile)
         assert cache.get("테스트") is not None
 
+    def test_put_many(self, cache, profile):
+        cache.put_many([("회사1", profile), ("  회사2 ", profile)])
+        assert cache.get("회사1") is not None
+        assert cache.get("회사2") is not None
+        assert cache.stats()["total"] == 2
+
     def test_delete(self, cache, profile):
         cache.put("테스트", profile)
         cache.delete("테스트")
@@ -74,6 +86,44 @@ class TestCompanyCache:
         time.sleep(0.1)
         assert cache.get("테스트") is None
 
+    def test_purge_expired(self, tmp_path, profile):
+        cache = CompanyCache(db_path=tmp_path / "purge_test.db", ttl_days=0)
+        cache.put("회사1", profile)
+        cache.put("회사2", profile)
+        time.sleep(0.1)
+        assert cache.get("회사1") is None
+        assert cache.stats()["total"] == 2
+        assert cache.purge_expired() == 2
+        assert cache.stats()["total"] == 0
+
+    def test_maintenance(self, tmp_path, profile):
+        cache = CompanyCache(db_path=tmp_path / "maint_test.db", ttl_days=0)
+        cache.put("회사1", profile)
+        time.sleep(0.1)
+        assert cache.maintenance() == 1
+        assert cache.stats()["total"] == 0
+
+    def test_fresh_db_uses_incremental_vacuum(self, cache):
+        assert cache._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    def test_existing_db_converted_to_incremental_vacuum(self, tmp_path, profile):
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE legacy (x INTEGER)")
+        conn.commit()
+        conn.close()
+
+        cache = CompanyCache(db_path=db_path)
+        assert cache._conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        cache.put("회사", profile)
+        assert cache.get("회사") is not None
+
+    def test_purge_uses_cached_at_index(self, cache):
+        plan = cache._conn.execute(
+            "EXPLAIN QUERY PLAN DELETE FROM company_cache WHERE cached_at <= ?", (0,)
+        ).fetchall()
+        assert any("idx_cached_at" in row[-1] for row in plan)
+
     def test_upsert(self, cache, profile):
         cache.put("테스트", profile)
         updated = CompanyProfile(
@@ -89,3 +139,194 @@ class TestCompanyCache:
         result = cache.get("테스트")
         assert result.name == "테스트 업데이트"
         assert result.industry == "금융"
+
+    def test_close_is_idempotent(self, cache):
+        cache.close()
+        cache.close()
+
+    def test_unreferenced_cache_is_collected(self, tmp_path):
+        ref = weakref.ref(CompanyCache(db_path=tmp_path / "gc.db"))
+        gc.collect()
+        assert ref() is None
+
+    def test_legacy_text_schema_is_rebuilt(self, tmp_path, profile):
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE company_cache "
+            "(company_name TEXT PRIMARY KEY, profile_json TEXT NOT NULL, cached_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO company_cache VALUES (?, ?, ?)",
+            ("테스트", profile.model_dump_json(), time.time()),
+        )
+        conn.commit()
+        conn.close()
+
+        cache = CompanyCache(db_path=db_path, ttl_days=1)
+        assert cache.get("테스트") is None
+        cache.put("테스트", profile)
+        assert cache.get("테스트").name == "테스트"
+
+
+class TestLLMResponseCache:
+    @pytest.fixture
+    def llm_cache(self, tmp_path):
+        return LLMResponseCache(db_path=tmp_path / "llm_cache.db", ttl_days=1)
+
+    def test_unreferenced_cache_is_collected(self, tmp_path):
+        ref = weakref.ref(LLMResponseCache(db_path=tmp_path / "gc.db"))
+        gc.collect()
+        assert ref() is None
+
+    def test_put_and_get(self, llm_cache):
+        key = make_key("model", "sys", "prompt", 100)
+        llm_cache.put(key, "응답", 10, 5)
+        assert llm_cache.get(key) == ("응답", 10, 5)
+
+    def test_get_nonexistent(self, llm_cache):
+        assert llm_cache.get(make_key("model", "sys", "prompt", 100)) is None
+
+    def test_key_depends_on_all_fields(self):
+        base = make_key("model", "sys", "prompt", 100)
+        assert base == make_key("model", "sys", "prompt", 100)
+        assert base != make_key("other", "sys", "prompt", 100)
+        assert base != make_key("model", "other", "prompt", 100)
+        assert base != make_key("model", "sys", "other", 100)
+        assert base != make_key("model", "sys", "prompt", 200)
+        assert base != make_key("model", "sys", "prompt", 100, "emit_QAResult")
+
+    def test_key_field_boundaries_are_unambiguous(self):
+        assert make_key("model", "ab", "c", 100) != make_key("model", "a", "bc", 100)
+
+    def test_key_ignores_layout_only_whitespace(self):
+        base = make_key("model", "sys", "경력:\n- Python  개발\n\n학력", 100)
+        assert base == make_key("model", "sys ", "경력: \r\n- Python 개발\n\n\n\n학력\n", 100)
+        assert base != make_key("model", "sys", "경력:\n- Python 개발 학력", 100)
+
+    def test_ttl_expiration(self, tmp_path):
+        llm_cache = LLMResponseCache(db_path=tmp_path / "ttl.db", ttl_days=0)
+        llm_cache.put("k", "text", 1, 1)
+        time.sleep(0.1)
+        assert llm_cache.get("k") is None
+
+    def test_purge_expired(self, tmp_path):
+        llm_cache = LLMResponseCache(db_path=tmp_path / "purge.db", ttl_days=0)
+        llm_cache.put("k1", "text", 1, 1)
+        llm_cache.put("k2", "text", 1, 1)
+        time.sleep(0.1)
+        assert llm_cache.purge_expired() == 2
+
+    def test_memory_tier_serves_repeat_lookups(self, llm_cache):
+        llm_cache.put("k", "text", 1, 1)
+        # Gone from SQLite, still served from memory
+        llm_cache._conn.execute("DELETE FROM llm_cache")
+        assert llm_cache.get("k") == ("text", 1, 1)
+        llm_cache.delete("k")
+        assert llm_cache.get("k") is None
+
+    def test_memory_tier_is_bounded_and_refilled_from_disk(self, tmp_path):
+        llm_cache = LLMResponseCache(db_path=tmp_path / "lru.db", memory_entries=2)
+        for key in ("a", "b", "c"):
+            llm_cache.put(key, key, 1, 1)
+        assert list(llm_cache._memory) == ["b", "c"]
+        assert llm_cache.get("a") == ("a", 1, 1)
+        assert list(llm_cache._memory) == ["c", "a"]
+
+    def test_memory_tier_respects_ttl(self, tmp_path):
+        llm_cache = LLMResponseCache(db_path=tmp_path / "ttl_mem.db", ttl_days=0)
+        llm_cache.put("k", "text", 1, 1)
+        time.sleep(0.1)
+        assert llm_cache.get("k") is None
+        assert "k" not in llm_cache._memory
+
+    def test_shares_db_with_company_cache(self, tmp_path, profile):
+        db_path = tmp_path / "shared.db"
+        company_cache = CompanyCache(db_path=db_path)
+        llm_cache = LLMResponseCache(db_path=db_path)
+        company_cache.put("테스트", profile)
+        llm_cache.put("k", "text", 1, 1)
+        assert company_cache.get("테스트") is not None
+        assert llm_cache.get("k") == ("text", 1, 1)
+
+
+class TestAsyncMemo:
+    async def test_concurrent_misses_share_one_call(self):
+        memo = AsyncMemo()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(memo.get_or_compute("k", compute) for _ in range(3)))
+        assert results == ["result"] * 3
+        assert await memo.get_or_compute("k", compute) == "result"
+        assert calls == 1
+
+    async def test_cancelling_one_caller_does_not_cancel_others(self):
+        memo = AsyncMemo()
+        started = asyncio.Event()
+
+        async def compute():
+            started.set()
+            await asyncio.sleep(0.01)
+            return "result"
+
+        a = asyncio.create_task(memo.get_or_compute("k", compute))
+        b = asyncio.create_task(memo.get_or_compute("k", compute))
+        await started.wait()
+        a.cancel()
+
+        assert await b == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await a
+        assert await memo.get_or_compute("k", compute) == "result"
+
+    async def test_computation_cancelled_when_all_callers_cancel(self):
+        memo = AsyncMemo()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def compute():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task = asyncio.create_task(memo.get_or_compute("k", compute))
+        await started.wait()
+        task.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    async def test_failures_are_not_memoized(self):
+        memo = AsyncMemo()
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def ok():
+            return 1
+
+        with pytest.raises(RuntimeError):
+            await memo.get_or_compute("k", fail)
+        assert await memo.get_or_compute("k", ok) == 1
+
+    async def test_evicts_least_recently_used(self):
+        memo = AsyncMemo(maxsize=2)
+
+        def value(v):
+            async def compute():
+                return v
+            return compute
+
+        await memo.get_or_compute("a", value(1))
+        await memo.get_or_compute("b", value(2))
+        await memo.get_or_compute("a", value(None))  # refresh "a"
+        await memo.get_or_compute("c", value(3))
+        assert await memo.get_or_compute("a", value(None)) == 1
+        assert await memo.get_or_compute("b", value("recomputed")) == "recomputed"
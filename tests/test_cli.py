@@ -0,0 +1,115 @@
+"""Tests for CLI commands."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from docx import Document
+from typer.testing import CliRunner
+
+from resume_tailor.cache.company_cache import CompanyCache
+from resume_tailor.cli import app
+from resume_tailor.config import AppConfig, CacheConfig
+from resume_tailor.pipeline.orchestrator import PipelineResult
+
+runner = CliRunner()
+
+
+class _FakeLLM:
+    """Stands in for LLMClient; records whether its pool was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+
+class TestTailorCommand:
+    def test_docx_smart_fill_runs_before_client_closes(
+        self, tmp_path, sample_company_profile, sample_job_analysis, sample_strategy,
+        sample_tailored_resume, sample_qa_result,
+    ):
+        jd = tmp_path / "jd.txt"
+        jd.write_text("백엔드 개발자 모집", encoding="utf-8")
+        resume = tmp_path / "resume.txt"
+        resume.write_text("홍길동 백엔드 개발자", encoding="utf-8")
+        template = tmp_path / "form.docx"
+        doc = Document()
+        doc.add_paragraph("성명")  # no {{placeholders}} → smart fill
+        doc.save(str(template))
+        output = tmp_path / "out" / "resume.md"
+
+        llm = _FakeLLM()
+        orchestrator = MagicMock()
+        orchestrator.run = AsyncMock(
+            return_value=PipelineResult(
+                company=sample_company_profile,
+                job=sample_job_analysis,
+                strategy=sample_strategy,
+                resume=sample_tailored_resume,
+                qa=sample_qa_result,
+            )
+        )
+        filled_while_open = []
+
+        async def _smart_fill(template_path, resume, output_path, llm):
+            filled_while_open.append(not llm.closed)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(b"docx")
+            return output_path
+
+        config = AppConfig(cache=CacheConfig(db_path=str(tmp_path / "cache.db")))
+        with (
+            patch("resume_tailor.config.load_config", return_value=config),
+            patch("resume_tailor.clients.llm_client.LLMClient.from_config", return_value=llm),
+            patch("resume_tailor.clients.search_client.SearchClient"),
+            patch(
+                "resume_tailor.pipeline.orchestrator.PipelineOrchestrator",
+                return_value=orchestrator,
+            ),
+            patch("resume_tailor.templates.smart_filler.smart_fill_docx", side_effect=_smart_fill),
+        ):
+            result = runner.invoke(
+                app,
+                ["tailor", "테스트", "--jd", str(jd), "--resume", str(resume),
+                 "--output", str(output), "--docx", str(template)],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert filled_while_open == [True]
+        assert llm.closed
+        assert output.with_suffix(".docx").read_bytes() == b"docx"
+        assert output.exists()
+
+
+class TestResearchCommand:
+    def test_failed_company_does_not_discard_others(self, tmp_path, sample_company_profile):
+        async def _research_only(company):
+            if company == "실패회사":
+                raise RuntimeError("search failed")
+            return sample_company_profile
+
+        orchestrator = MagicMock()
+        orchestrator.research_only = AsyncMock(side_effect=_research_only)
+        config = AppConfig(cache=CacheConfig(db_path=str(tmp_path / "cache.db")))
+        with (
+            patch("resume_tailor.config.load_config", return_value=config),
+            patch("resume_tailor.clients.llm_client.LLMClient.from_config", return_value=_FakeLLM()),
+            patch("resume_tailor.clients.search_client.SearchClient"),
+            patch(
+                "resume_tailor.pipeline.orchestrator.PipelineOrchestrator",
+                return_value=orchestrator,
+            ),
+        ):
+            result = runner.invoke(app, ["research", "테스트", "실패회사"])
+
+        assert result.exit_code == 1
+        assert "실패회사: 실패" in result.output
+
+        cache = CompanyCache(db_path=tmp_path / "cache.db")
+        assert cache.get("테스트") == sample_company_profile
+        assert cache.get("실패회사") is None
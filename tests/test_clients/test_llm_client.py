@@ -2,46 +2,123 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from resume_tailor.clients.llm_client import LLMClient, LLMResponse
+from resume_tailor.cache.llm_cache import LLMResponseCache
+from resume_tailor.clients.llm_client import LLMClient, LLMResponse, _fit_image
 
 
-def _make_api_message(text: str, input_tokens: int = 100, output_tokens: int = 50) -> MagicMock:
+def _make_api_message(
+    text: str,
+    input_tokens: int = 100,
+    output_tokens: int = 50,
+    cache_read: int = 0,
+    cache_creation: int = 0,
+    stop_reason: str = "end_turn",
+) -> MagicMock:
     """Build a mock anthropic Message-like object."""
     message = MagicMock()
+    message.stop_reason = stop_reason
     message.usage.input_tokens = input_tokens
     message.usage.output_tokens = output_tokens
+    message.usage.cache_read_input_tokens = cache_read
+    message.usage.cache_creation_input_tokens = cache_creation
     message.content = [MagicMock(text=text)]
     return message
 
 
 class TestLLMClientInit:
+    def test_from_config_passes_timeout_and_retries(self):
+        """from_config() wires llm.timeout and llm.max_retries into the SDK client."""
+        from resume_tailor.config import AppConfig, CacheConfig, LLMConfig
+
+        config = AppConfig(
+            llm=LLMConfig(timeout=90, max_retries=5),
+            cache=CacheConfig(llm_responses=False),
+        )
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            llm = LLMClient.from_config(config)
+        kwargs = mock_cls.call_args.kwargs
+        assert kwargs["timeout"] == 90
+        assert kwargs["max_retries"] == 5
+        assert llm.cache is None
+
+    def test_from_config_shares_response_cache_per_database(self, tmp_path):
+        """Clients built from the same config reuse one response cache (and its memory tier)."""
+        from resume_tailor.config import AppConfig, CacheConfig
+
+        config = AppConfig(cache=CacheConfig(db_path=str(tmp_path / "cache.db")))
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic"):
+            first = LLMClient.from_config(config)
+            second = LLMClient.from_config(config)
+        assert first.cache is not None
+        assert first.cache is second.cache
+
     def test_init_default_creates_client_with_no_kwargs(self):
-        """Creates AsyncAnthropic with no extra kwargs when no args supplied."""
+        """Creates AsyncAnthropic with only the pooled http client and retries when no args supplied."""
         with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
             LLMClient()
-            mock_cls.assert_called_once_with()
+            mock_cls.assert_called_once()
+            assert set(mock_cls.call_args.kwargs) == {"http_client", "max_retries"}
+            assert mock_cls.call_args.kwargs["max_retries"] == 3
 
     def test_init_with_api_key_passes_key(self):
         """Passes api_key kwarg when provided."""
         with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
             LLMClient(api_key="test-key")
-            mock_cls.assert_called_once_with(api_key="test-key")
+            assert mock_cls.call_args.kwargs["api_key"] == "test-key"
+            assert "timeout" not in mock_cls.call_args.kwargs
 
     def test_init_with_timeout_passes_timeout(self):
         """Passes timeout kwarg when provided."""
         with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
             LLMClient(timeout=30.0)
-            mock_cls.assert_called_once_with(timeout=30.0)
+            assert mock_cls.call_args.kwargs["timeout"] == 30.0
+            assert "api_key" not in mock_cls.call_args.kwargs
 
     def test_init_with_both_params_passes_both(self):
         """Passes both api_key and timeout when both are supplied."""
         with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
             LLMClient(api_key="test-key", timeout=30.0)
-            mock_cls.assert_called_once_with(api_key="test-key", timeout=30.0)
+            kwargs = mock_cls.call_args.kwargs
+            assert kwargs["api_key"] == "test-key"
+            assert kwargs["timeout"] == 30.0
+
+    def test_init_with_max_retries_passes_to_sdk(self):
+        """Retries are delegated to the SDK via max_retries."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            LLMClient(max_retries=5)
+            assert mock_cls.call_args.kwargs["max_retries"] == 5
+
+    def test_init_uses_pooled_http_client(self):
+        """The underlying httpx client is built with the shared keep-alive limits."""
+        with (
+            patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls,
+            patch("resume_tailor.clients.llm_client.anthropic.DefaultAsyncHttpxClient") as mock_http,
+        ):
+            LLMClient()
+        limits = mock_http.call_args.kwargs["limits"]
+        assert limits.max_keepalive_connections == 16
+        assert limits.keepalive_expiry == 60.0
+        assert mock_cls.call_args.kwargs["http_client"] is mock_http.return_value
+
+    async def test_async_context_manager_closes_client(self):
+        """Leaving ``async with`` closes the SDK client's pooled connections."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.close = AsyncMock()
+            mock_cls.return_value = mock_client
+
+            async with LLMClient() as llm:
+                assert isinstance(llm, LLMClient)
+                mock_client.close.assert_not_awaited()
+
+        mock_client.close.assert_awaited_once()
 
 
 class TestLLMClientGenerate:
@@ -78,7 +155,7 @@ class TestLLMClientGenerate:
         assert len(llm._token_log) == 2
 
     async def test_token_log_stores_model_and_counts(self):
-        """_token_log entries are (model, input_tokens, output_tokens) tuples."""
+        """_token_log entries are (model, input, output, cache_read, cache_creation) tuples."""
         with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
             mock_client = MagicMock()
             mock_client.messages.create = AsyncMock(
@@ -89,10 +166,288 @@ class TestLLMClientGenerate:
             llm = LLMClient()
             await llm.generate("prompt", model="claude-haiku-4-5-20251001")
 
-        model, inp, out = llm._token_log[0]
-        assert model == "claude-haiku-4-5-20251001"
-        assert inp == 20
-        assert out == 8
+        assert llm._token_log[0] == ("claude-haiku-4-5-20251001", 20, 8, 0, 0)
+
+    async def test_track_task_usage_keeps_concurrent_tasks_apart(self):
+        """Each tracking task's get_token_summary() reports only its own calls."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(
+                return_value=_make_api_message("resp", input_tokens=10, output_tokens=5)
+            )
+            mock_cls.return_value = mock_client
+            llm = LLMClient()
+
+            async def _run(calls: int) -> dict:
+                llm.track_task_usage()
+                for _ in range(calls):
+                    await llm.generate("prompt")
+                    await asyncio.sleep(0)
+                return llm.get_token_summary()
+
+            first, second = await asyncio.gather(_run(1), _run(3))
+            await llm.generate("outside")
+
+        assert first["input"] == 10 and len(first["calls"]) == 1
+        assert second["input"] == 30 and len(second["calls"]) == 3
+        assert len(llm._token_log) == 1
+
+    async def test_prompt_cache_usage_is_recorded(self):
+        """Prompt-cache read/write tokens are reported on the response and logged."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(
+                return_value=_make_api_message(
+                    "resp", input_tokens=20, output_tokens=8, cache_read=1500, cache_creation=300
+                )
+            )
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient()
+            result = await llm.generate("prompt", system="sys", cache_system=True)
+
+        assert result.cache_read_tokens == 1500
+        assert result.cache_creation_tokens == 300
+        summary = llm.get_token_summary()
+        assert summary["cache_read"] == 1500
+        assert summary["cache_creation"] == 300
+
+
+    async def test_generate_cache_system_sends_cache_control_block(self):
+        """cache_system=True sends the system prompt as a cached text block."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=_make_api_message("ok"))
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient()
+            await llm.generate("prompt", system="sys")
+            await llm.generate("prompt", system="sys", cache_system=True)
+
+        plain, cached = mock_client.messages.create.call_args_list
+        assert plain.kwargs["system"] == "sys"
+        assert cached.kwargs["system"] == [
+            {"type": "text", "text": "sys", "cache_control": {"type": "ephemeral"}}
+        ]
+
+
+class TestLLMClientErrors:
+    async def test_non_retryable_error_propagates_once(self, caplog):
+        """Client errors such as 400 are raised immediately and logged with the status."""
+        import anthropic
+        import httpx
+
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        error = anthropic.BadRequestError(
+            "bad request", response=httpx.Response(400, request=request), body=None
+        )
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(side_effect=error)
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient()
+            with pytest.raises(anthropic.BadRequestError):
+                await llm.generate("prompt")
+
+        assert mock_client.messages.create.await_count == 1
+        assert "HTTP 400" in caplog.text
+
+
+class TestLLMClientGenerateMany:
+    async def test_generate_many_preserves_order_and_bounds_concurrency(self):
+        """generate_many() returns results in job order with at most `concurrency` in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def _create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_api_message(kwargs["messages"][0]["content"].upper())
+
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(side_effect=_create)
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient()
+            jobs = [{"prompt": p} for p in ("a", "b", "c", "d", "e")]
+            results = await llm.generate_many(jobs, concurrency=2)
+
+        assert [r.text for r in results] == ["A", "B", "C", "D", "E"]
+        assert peak == 2
+        assert len(llm._token_log) == 5
+
+
+class TestLLMClientBatchGenerate:
+    async def test_batch_generate_polls_and_orders_by_custom_id(self):
+        """batch_generate() polls until the batch ends and maps results by custom_id."""
+        from types import SimpleNamespace
+
+        async def _results():
+            yield SimpleNamespace(
+                custom_id="1",
+                result=SimpleNamespace(type="succeeded", message=_make_api_message("B")),
+            )
+            yield SimpleNamespace(custom_id="2", result=SimpleNamespace(type="errored"))
+            yield SimpleNamespace(
+                custom_id="0",
+                result=SimpleNamespace(type="succeeded", message=_make_api_message("A")),
+            )
+
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls, \
+                patch("resume_tailor.clients.llm_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            mock_client = MagicMock()
+            batches = mock_client.messages.batches
+            batches.create = AsyncMock(
+                return_value=SimpleNamespace(id="b1", processing_status="in_progress")
+            )
+            batches.retrieve = AsyncMock(side_effect=[
+                SimpleNamespace(id="b1", processing_status="in_progress"),
+                SimpleNamespace(id="b1", processing_status="ended"),
+            ])
+            batches.results = AsyncMock(return_value=_results())
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient()
+            jobs = [{"prompt": p, "model": "m"} for p in ("a", "b", "c")]
+            results = await llm.batch_generate(jobs, poll_interval=1, max_poll_interval=1.5)
+
+        requests = batches.create.await_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["0", "1", "2"]
+        assert requests[1]["params"]["messages"][0]["content"] == "b"
+        assert [c.args[0] for c in sleep.await_args_list] == [1, 1.5]
+        assert [r.text if r else None for r in results] == ["A", "B", None]
+        assert [t[0] for t in llm._token_log] == ["m", "m"]
+
+
+class TestLLMClientGenerateStream:
+    async def test_generate_stream_yields_chunks_and_logs_usage(self):
+        """generate_stream() yields text deltas and records usage from the final message."""
+
+        async def _text_stream():
+            for chunk in ("안녕", "하세요"):
+                yield chunk
+
+        stream = MagicMock()
+        stream.text_stream = _text_stream()
+        stream.get_final_message = AsyncMock(
+            return_value=_make_api_message("안녕하세요", input_tokens=12, output_tokens=3)
+        )
+        stream_cm = MagicMock()
+        stream_cm.__aenter__ = AsyncMock(return_value=stream)
+        stream_cm.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.stream = MagicMock(return_value=stream_cm)
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient()
+            chunks = [c async for c in llm.generate_stream("prompt", system="sys")]
+
+        assert chunks == ["안녕", "하세요"]
+        assert mock_client.messages.stream.call_args.kwargs["system"] == "sys"
+        assert llm._token_log == [("claude-haiku-4-5-20251001", 12, 3, 0, 0)]
+
+    async def test_generate_stream_closed_early_logs_snapshot_usage(self):
+        """Closing the stream early still records the usage seen so far."""
+
+        async def _text_stream():
+            for chunk in ("a", "b", "c"):
+                yield chunk
+
+        stream = MagicMock()
+        stream.text_stream = _text_stream()
+        stream.get_final_message = AsyncMock()
+        stream.current_message_snapshot = _make_api_message("a", input_tokens=40, output_tokens=1)
+        stream_cm = MagicMock()
+        stream_cm.__aenter__ = AsyncMock(return_value=stream)
+        stream_cm.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.stream = MagicMock(return_value=stream_cm)
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient()
+            gen = llm.generate_stream("prompt")
+            assert await gen.__anext__() == "a"
+            await gen.aclose()
+
+        stream.get_final_message.assert_not_awaited()
+        stream_cm.__aexit__.assert_awaited_once()
+        assert llm._token_log == [("claude-haiku-4-5-20251001", 40, 1, 0, 0)]
+
+
+class TestLLMClientResponseCache:
+    async def test_deterministic_call_served_from_cache(self, tmp_path):
+        """A repeated temperature-0 call is answered from the cache without an API call."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=_make_api_message("cached"))
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient(cache=LLMResponseCache(db_path=tmp_path / "c.db"))
+            first = await llm.generate("prompt", system="sys")
+            second = await llm.generate("prompt", system="sys")
+
+        assert mock_client.messages.create.await_count == 1
+        assert second.text == first.text == "cached"
+        summary = llm.get_token_summary()
+        assert summary["cache_hits"] == 1
+        assert summary["cache_misses"] == 1
+        assert len(summary["calls"]) == 1
+
+    async def test_nonzero_temperature_bypasses_cache(self, tmp_path):
+        """Sampling calls (temperature > 0) always hit the API."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=_make_api_message("fresh"))
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient(cache=LLMResponseCache(db_path=tmp_path / "c.db"))
+            await llm.generate("prompt", temperature=0.3)
+            await llm.generate("prompt", temperature=0.3)
+
+        assert mock_client.messages.create.await_count == 2
+        assert llm.get_token_summary()["cache_misses"] == 0
+
+
+    async def test_truncated_reply_not_cached(self, tmp_path):
+        """A reply cut off at max_tokens is not replayed from the cache."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(
+                return_value=_make_api_message('{"a": ', stop_reason="max_tokens")
+            )
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient(cache=LLMResponseCache(db_path=tmp_path / "c.db"))
+            await llm.generate("prompt")
+            await llm.generate("prompt")
+
+        assert mock_client.messages.create.await_count == 2
+
+    async def test_unparseable_json_evicted_so_retry_calls_api(self, tmp_path):
+        """generate_json() drops a cached reply it cannot parse."""
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(side_effect=[
+                _make_api_message("not json at all"),
+                _make_api_message('{"ok": true}'),
+            ])
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient(cache=LLMResponseCache(db_path=tmp_path / "c.db"))
+            with pytest.raises(ValueError):
+                await llm.generate_json("prompt")
+            assert await llm.generate_json("prompt") == {"ok": True}
+
+        assert mock_client.messages.create.await_count == 2
 
 
 class TestLLMClientGenerateJson:
@@ -123,6 +478,25 @@ class TestLLMClientGenerateJson:
             with pytest.raises(ValueError):
                 await llm.generate_json("give me json")
 
+    async def test_generate_json_with_schema_forces_tool_use(self):
+        """With a schema, the request forces a tool call and its input is returned."""
+        from resume_tailor.models.company import CompanyProfile
+
+        message = _make_api_message("")
+        message.content = [MagicMock(type="tool_use", input={"name": "네이버", "tech_stack": ["Java"]})]
+        with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic") as mock_cls:
+            mock_client = MagicMock()
+            mock_client.messages.create = AsyncMock(return_value=message)
+            mock_cls.return_value = mock_client
+
+            llm = LLMClient()
+            result = await llm.generate_json("give me json", schema=CompanyProfile)
+
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "emit_CompanyProfile"}
+        assert kwargs["tools"][0]["input_schema"]["required"][0] == "name"
+        assert result == {"name": "네이버", "tech_stack": ["Java"]}
+
 
 class TestLLMClientTokenSummary:
     def test_get_token_summary_returns_correct_totals(self):
@@ -130,8 +504,8 @@ class TestLLMClientTokenSummary:
         with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic"):
             llm = LLMClient()
             llm._token_log = [
-                ("claude-haiku-4-5-20251001", 100, 50),
-                ("claude-haiku-4-5-20251001", 200, 80),
+                ("claude-haiku-4-5-20251001", 100, 50, 0, 0),
+                ("claude-haiku-4-5-20251001", 200, 80, 0, 0),
             ]
 
         summary = llm.get_token_summary()
@@ -144,7 +518,7 @@ class TestLLMClientTokenSummary:
         """get_token_summary() empties _token_log so subsequent calls return zeros."""
         with patch("resume_tailor.clients.llm_client.anthropic.AsyncAnthropic"):
             llm = LLMClient()
-            llm._token_log = [("claude-haiku-4-5-20251001", 50, 25)]
+            llm._token_log = [("claude-haiku-4-5-20251001", 50, 25, 0, 0)]
 
         llm.get_token_summary()
         second_summary = llm.get_token_summary()
@@ -185,6 +559,33 @@ class TestLLMClientExtractTextFromImage:
             await llm.extract_text_from_image(b"bytes", "image/jpeg")
 
         assert len(llm._token_log) == 1
-        _, inp, out = llm._token_log[0]
+        _, inp, out, _, _ = llm._token_log[0]
         assert inp == 200
         assert out == 40
+
+
+class TestFitImage:
+    def _png(self, size: tuple[int, int]) -> bytes:
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", size, "white").save(buf, format="PNG")
+        return buf.getvalue()
+
+    def test_large_image_is_downscaled(self):
+        """Images larger than the vision cap are shrunk to 1568px on the long edge."""
+        from PIL import Image
+
+        out = _fit_image(self._png((3136, 1000)), "image/png")
+        with Image.open(io.BytesIO(out)) as img:
+            assert img.size == (1568, 500)
+
+    def test_small_image_is_untouched(self):
+        """Images within the cap are returned byte-for-byte."""
+        data = self._png((800, 600))
+        assert _fit_image(data, "image/png") is data
+
+    def test_gif_is_untouched(self):
+        """GIFs are passed through (may be animated)."""
+        data = b"GIF89a..."
+        assert _fit_image(data, "image/gif") is data
@@ -31,6 +31,13 @@ class TestSearchClientInit:
             client = SearchClient()
             assert client is not None
 
+    def test_init_passes_pooled_http_client(self):
+        """The Tavily client is given the SearchClient's own pooled httpx client."""
+        with patch("resume_tailor.clients.search_client.AsyncTavilyClient") as mock_cls:
+            from resume_tailor.clients.search_client import SearchClient
+            client = SearchClient(api_key="test-key")
+        assert mock_cls.call_args.kwargs["client"] is client._http
+
 
 class TestSearchClientSearch:
     async def test_search_returns_formatted_results(self, monkeypatch):
@@ -83,6 +90,29 @@ class TestSearchClientSearch:
         assert first_count == 1
         assert second_count == 0
 
+    async def test_track_task_usage_counts_task_searches_apart(self, monkeypatch):
+        """A tracking task's get_search_count() reports only its own searches."""
+        import asyncio
+
+        monkeypatch.setenv("TAVILY_API_KEY", "test-key")
+        mock_tavily = AsyncMock()
+        mock_tavily.search = AsyncMock(return_value={"results": []})
+        with patch("resume_tailor.clients.search_client.AsyncTavilyClient", return_value=mock_tavily):
+            from resume_tailor.clients.search_client import SearchClient
+            client = SearchClient(api_key="test-key")
+
+            async def _run(searches: int) -> int:
+                client.track_task_usage()
+                for _ in range(searches):
+                    await client.search("query")
+                return client.get_search_count()
+
+            counts = await asyncio.gather(_run(1), _run(2))
+            await client.search("outside")
+
+        assert counts == [1, 2]
+        assert client.get_search_count() == 1
+
     async def test_search_returns_empty_list_when_no_results(self, monkeypatch):
         """search() returns an empty list when API response contains no results."""
         monkeypatch.setenv("TAVILY_API_KEY", "test-key")
@@ -1,5 +1,7 @@
 """Tests for config loading."""
 
+import os
+
 import pytest
 
 from resume_tailor.config import AppConfig, CacheConfig, LLMConfig, load_config
@@ -37,3 +39,20 @@ class TestConfig:
         config = LLMConfig()
         with pytest.raises(AttributeError):
             config.haiku_model = "changed"
+
+    def test_load_config_is_memoized(self, tmp_path):
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("pipeline:\n  qa_threshold: 90\n")
+        first = load_config(yaml_path)
+        assert load_config(yaml_path) is first
+
+    def test_load_config_reloads_when_file_changes(self, tmp_path):
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("pipeline:\n  qa_threshold: 90\n")
+        first = load_config(yaml_path)
+        yaml_path.write_text("pipeline:\n  qa_threshold: 70\n")
+        st = yaml_path.stat()
+        os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        second = load_config(yaml_path)
+        assert second is not first
+        assert second.pipeline.qa_threshold == 70
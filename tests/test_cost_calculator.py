@@ -73,3 +73,21 @@ class TestCostCalculator:
         assert "claude-haiku-4-5-20251001" in MODEL_PRICING
         assert "claude-sonnet-4-5-20250929" in MODEL_PRICING
         assert TAVILY_COST_PER_SEARCH == 0.01
+
+    def test_prompt_cache_tokens_priced(self):
+        # 1M cache reads ($0.08) + 1M cache writes ($1.00) for Haiku
+        calls = [("claude-haiku-4-5-20251001", 0, 0, 1_000_000, 1_000_000)]
+        assert calculate_cost(calls) == pytest.approx(1.08)
+
+    def test_mixed_tuple_lengths(self):
+        calls = [
+            ("claude-haiku-4-5-20251001", 1_000_000, 0),
+            ("claude-haiku-4-5-20251001", 1_000_000, 0, 1_000_000, 0),
+        ]
+        assert calculate_cost(calls) == pytest.approx(0.80 + 0.80 + 0.08)
+
+    def test_pricing_is_read_only(self):
+        with pytest.raises(TypeError):
+            MODEL_PRICING["claude-haiku-4-5-20251001"] = {"input": 0.0, "output": 0.0}
+        with pytest.raises(TypeError):
+            MODEL_PRICING["claude-haiku-4-5-20251001"]["input"] = 0.0
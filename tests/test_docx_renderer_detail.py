@@ -90,6 +90,20 @@ class TestListDocxPlaceholders:
 
         assert result == []
 
+    def test_list_docx_placeholders_in_tables_and_split_runs(self, tmp_path):
+        """Markers in table cells and split across runs are found."""
+        tpl = tmp_path / "tpl.docx"
+        doc = Document()
+        para = doc.add_paragraph()
+        for piece in ["{{", "이름", "}}"]:
+            para.add_run(piece)
+        cell = doc.add_table(rows=1, cols=1).cell(0, 0)
+        cell.text = "{{경력}}"
+        cell.add_table(rows=1, cols=1).cell(0, 0).text = "{{학력}}"
+        doc.save(str(tpl))
+
+        assert list_docx_placeholders(tpl) == ["경력", "이름", "학력"]
+
     def test_list_docx_placeholders_deduplicates(self, tmp_path):
         """The same placeholder appearing twice is returned only once."""
         tpl = tmp_path / "dup.docx"
@@ -138,6 +152,67 @@ class TestFillDocxTemplate:
         assert "{{custom_field}}" not in all_text
         assert "특별한 값" in all_text
 
+    def test_fill_docx_keys_match_case_insensitively(self, tmp_path, sample_tailored_resume):
+        """extra_vars keys and placeholders are compared ignoring case."""
+        tpl = tmp_path / "tpl.docx"
+        _create_template(tpl, ["{{COMPANY}}", "{{Full}}"])
+
+        out = tmp_path / "filled.docx"
+        fill_docx_template(tpl, sample_tailored_resume, out, extra_vars={"Company": "ABC 테크"})
+
+        texts = [p.text for p in Document(str(out)).paragraphs]
+        assert texts[0] == "ABC 테크"
+        assert "{{" not in texts[1]
+
+    def test_fill_docx_placeholder_split_across_runs(self, tmp_path, sample_tailored_resume):
+        """Placeholders split over several runs are all replaced in one rebuild."""
+        tpl = tmp_path / "tpl.docx"
+        doc = Document()
+        para = doc.add_paragraph()
+        for piece in ["{{", "Summary", "}} / {{경력", "사항}} / {{unknown}}"]:
+            para.add_run(piece)
+        doc.save(str(tpl))
+
+        out = tmp_path / "filled.docx"
+        fill_docx_template(tpl, sample_tailored_resume, out)
+
+        filled = Document(str(out)).paragraphs[0]
+        assert filled.text == "대규모 트래픽 처리 전문 백엔드 개발자 / ABC 테크\n- Spring Boot API / {{unknown}}"
+        assert len(filled.runs) == 1
+
+    def test_fill_docx_replaces_every_placeholder_in_run(self, tmp_path, sample_tailored_resume):
+        """Several placeholders inside one run are all replaced, keeping the runs."""
+        tpl = tmp_path / "tpl.docx"
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("이름 ").bold = True
+        para.add_run("{{custom}} | {{summary}}")
+        doc.save(str(tpl))
+
+        out = tmp_path / "filled.docx"
+        fill_docx_template(tpl, sample_tailored_resume, out, extra_vars={"custom": "홍길동"})
+
+        filled = Document(str(out)).paragraphs[0]
+        assert filled.text == "이름 홍길동 | 대규모 트래픽 처리 전문 백엔드 개발자"
+        assert filled.runs[0].bold
+
+    def test_fill_docx_replaces_in_table_cells(self, tmp_path, sample_tailored_resume):
+        """Placeholders inside table cells, including nested tables, are replaced."""
+        tpl = tmp_path / "tpl.docx"
+        doc = Document()
+        doc.add_paragraph("본문")
+        cell = doc.add_table(rows=1, cols=2).cell(0, 1)
+        cell.text = "{{summary}}"
+        cell.add_table(rows=1, cols=1).cell(0, 0).text = "{{full}}"
+        doc.save(str(tpl))
+
+        out = tmp_path / "filled.docx"
+        fill_docx_template(tpl, sample_tailored_resume, out)
+
+        filled = Document(str(out)).tables[0].cell(0, 1)
+        assert filled.paragraphs[0].text == "대규모 트래픽 처리 전문 백엔드 개발자"
+        assert "{{full}}" not in filled.tables[0].cell(0, 0).text
+
     def test_fill_docx_returns_output_path(self, tmp_path, sample_tailored_resume):
         """fill_docx_template returns the output path as a Path object."""
         tpl = tmp_path / "tpl.docx"
@@ -190,3 +265,13 @@ class TestMdToPlain:
         plain = "일반 텍스트 내용입니다."
         result = _md_to_plain(plain)
         assert result == plain
+
+    def test_strips_nested_link_and_emoji(self):
+        """Links and emojis inside emphasis are stripped along with the markers."""
+        result = _md_to_plain("**[깃허브](https://github.com)** \U0001f4e7 **\U0001f4de 연락처**")
+        assert result == "깃허브 연락처"
+
+    def test_collapses_blank_lines_left_by_rules(self):
+        """Lines emptied by rule removal collapse to a single blank line."""
+        result = _md_to_plain("경력\n\n---\n\n학력")
+        assert result == "경력\n\n학력"
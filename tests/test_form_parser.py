@@ -1,8 +1,17 @@
 """Tests for form_parser: parse_text and _extract_char_limit."""
 
+import sys
+import types
+
 import pytest
 
-from resume_tailor.parsers.form_parser import FormQuestion, _extract_char_limit, parse_text
+from resume_tailor.parsers.form_parser import (
+    FormQuestion,
+    _extract_char_limit,
+    _filter_form_items,
+    extract_from_url,
+    parse_text,
+)
 
 
 class TestParseText:
@@ -66,6 +75,109 @@ class TestExtractCharLimit:
         assert _extract_char_limit("(1,000자 이내)") == 1000
 
 
+class TestFilterFormItems:
+    def test_filters_scripts_duplicates_and_attaches_limits(self):
+        items = [
+            {"label": "지원동기를 작성해주세요", "maxLength": None, "type": "textarea"},
+            {"label": "내용 (800자 이내)", "maxLength": None, "type": "textarea"},
+            {"label": "지원동기를 작성해주세요", "maxLength": None, "type": "textarea"},
+            {"label": "window.dataLayer = []", "maxLength": None, "type": "textarea"},
+            {"label": "이름", "maxLength": 20, "type": "input"},
+        ]
+        questions, seen = _filter_form_items(items)
+        assert [q.label for q in questions] == ["지원동기를 작성해주세요"]
+        assert questions[0].max_length == 800
+        assert seen == {"지원동기를 작성해주세요"}
+
+
+class _FakePage:
+    async def goto(self, url, **kwargs):
+        pass
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+    async def evaluate(self, script):
+        return {
+            "form": [{"label": "지원동기를 작성해주세요", "maxLength": 500, "type": "textarea"}],
+            "text": None,
+        }
+
+
+class _FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return _FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts: list[_FakeContext] = []
+
+    async def new_context(self):
+        self.contexts.append(_FakeContext())
+        return self.contexts[-1]
+
+    async def close(self):
+        self.connected = False
+
+
+class _FakePlaywright:
+    launches = 0
+    browsers: list[_FakeBrowser] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    @property
+    def chromium(self):
+        return self
+
+    async def launch(self, headless):
+        _FakePlaywright.launches += 1
+        _FakePlaywright.browsers.append(_FakeBrowser())
+        return _FakePlaywright.browsers[-1]
+
+
+class TestExtractFromUrl:
+    @pytest.fixture(autouse=True)
+    def fake_playwright(self, monkeypatch):
+        module = types.ModuleType("playwright.async_api")
+        module.async_playwright = _FakePlaywright
+        monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("playwright"))
+        monkeypatch.setitem(sys.modules, "playwright.async_api", module)
+        monkeypatch.setattr("resume_tailor.parsers.form_parser.validate_url", lambda url: url)
+        _FakePlaywright.launches = 0
+        _FakePlaywright.browsers = []
+
+    async def test_launches_and_closes_own_browser(self):
+        questions = await extract_from_url("https://example.com/apply")
+
+        assert [(q.label, q.max_length) for q in questions] == [("지원동기를 작성해주세요", 500)]
+        [browser] = _FakePlaywright.browsers
+        assert not browser.connected
+        assert browser.contexts[0].closed
+
+    async def test_reuses_given_browser_and_leaves_it_open(self):
+        browser = _FakeBrowser()
+        for url in ("https://example.com/a", "https://example.com/b"):
+            assert await extract_from_url(url, browser=browser)
+
+        assert _FakePlaywright.launches == 0
+        assert browser.connected
+        assert len(browser.contexts) == 2
+        assert all(c.closed for c in browser.contexts)
+
+
 class TestFormQuestionModel:
     def test_form_question_defaults(self):
         q = FormQuestion(label="자기소개를 해주세요")
@@ -87,3 +199,9 @@ class TestFormQuestionModel:
         assert q.field_type == "text"
         assert q.options == ["A", "B"]
         assert q.section == "자기소개서"
+
+    def test_form_question_uses_slots(self):
+        q = FormQuestion(label="지원동기")
+        assert not hasattr(q, "__dict__")
+        q.max_length = 300
+        assert q.max_length == 300
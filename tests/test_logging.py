@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import gc
 import tempfile
+import weakref
 from datetime import datetime
 from pathlib import Path
 
@@ -194,3 +196,35 @@ class TestUsageStore:
         mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
         conn.close()
         assert mode == "wal"
+
+    def test_close_is_idempotent(self, store: UsageStore):
+        store.close()
+        store.close()
+
+    def test_unreferenced_store_is_collected(self, tmp_path: Path):
+        ref = weakref.ref(UsageStore(db_path=tmp_path / "gc.db"))
+        gc.collect()
+        assert ref() is None
+
+    def test_shared_across_threads(self, store: UsageStore):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: store.save_log(UsageLog(mode="resume_tailor")), range(20)))
+        assert len(store.get_logs(limit=100)) == 20
+
+    def test_queries_use_indexes(self, store: UsageStore):
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM usage_logs "
+            "WHERE session_id = ? ORDER BY timestamp DESC LIMIT ?",
+            ("s1", 10),
+        ).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        assert "idx_logs_session_ts" in detail
+        assert "TEMP B-TREE" not in detail
+
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM usage_logs WHERE timestamp >= ?",
+            ("2026-01-01",),
+        ).fetchall()
+        assert "idx_logs_ts" in " ".join(row[-1] for row in plan)
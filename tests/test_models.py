@@ -79,6 +79,15 @@ class TestTailoredResume:
         section = ResumeSection(id="test", label="테스트", content="내용")
         assert section.id == "test"
 
+    def test_from_markdown_wraps_full_section(self):
+        resume = TailoredResume.from_markdown("# 홍길동")
+        assert resume == TailoredResume(
+            sections=[ResumeSection(id="full", label="전체", content="# 홍길동")],
+            full_markdown="# 홍길동",
+            metadata={},
+        )
+        assert resume.model_dump()["sections"][0]["content"] == "# 홍길동"
+
 
 class TestQAResult:
     def test_create_with_alias(self):
@@ -42,6 +42,58 @@ class TestResumeParser:
         result = parse_resume(str(md_file))
         assert "홍길동" in result
 
+    def test_parse_pdf_joins_pages(self, tmp_path):
+        import fitz
+
+        doc = fitz.open()
+        for text in ("Page one", "Page two"):
+            doc.new_page().insert_text((72, 72), text)
+        pdf_file = tmp_path / "resume.pdf"
+        doc.save(str(pdf_file))
+        doc.close()
+
+        assert parse_resume(str(pdf_file)) == "Page one\n\nPage two\n"
+
+    def test_parse_docx_matches_python_docx(self, tmp_path):
+        from docx import Document
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+
+        doc = Document()
+        doc.add_paragraph("홍길동")
+        run = doc.add_paragraph("경력").add_run(" A")
+        run.add_tab()
+        run.add_text("B")
+        doc.add_paragraph("   ")
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = "table cell"
+        # Hyphen/tab elements, a hyperlink, and wrappers python-docx skips
+        # (content control, tracked insertion, text box with fallback copy)
+        doc.add_paragraph()._p.append(parse_xml(
+            f"<w:r {nsdecls('w')}><w:t>010</w:t><w:noBreakHyphen/><w:t>1234</w:t>"
+            "<w:ptab w:relativeTo='margin' w:alignment='right' w:leader='none'/>"
+            "<w:t>end</w:t></w:r>"
+        ))
+        para = doc.add_paragraph("링크: ")
+        for xml in (
+            f"<w:hyperlink {nsdecls('w')}><w:r><w:t>site</w:t></w:r></w:hyperlink>",
+            f"<w:sdt {nsdecls('w')}><w:sdtContent><w:r><w:t>SDT</w:t></w:r></w:sdtContent></w:sdt>",
+            f"<w:ins {nsdecls('w')} w:id='1' w:author='a'><w:r><w:t>INS</w:t></w:r></w:ins>",
+            f"<w:r {nsdecls('w')} xmlns:mc='http://schemas.openxmlformats.org/markup-compatibility/2006'>"
+            "<mc:AlternateContent><mc:Choice Requires='wps'><w:t>CHOICE</w:t></mc:Choice>"
+            "<mc:Fallback><w:t>FALLBACK</w:t></mc:Fallback></mc:AlternateContent></w:r>",
+        ):
+            para._p.append(parse_xml(xml))
+        doc.add_paragraph("끝")
+        docx_file = tmp_path / "resume.docx"
+        doc.save(str(docx_file))
+
+        expected = "\n".join(
+            p.text for p in Document(str(docx_file)).paragraphs if p.text.strip()
+        )
+        assert parse_resume(str(docx_file)) == expected == (
+            "홍길동\n경력 A\tB\n010-1234\tend\n링크: site\n끝"
+        )
+
     def test_unsupported_format(self, tmp_path):
         bad_file = tmp_path / "resume.xyz"
         bad_file.write_text("test")
@@ -67,6 +119,11 @@ class TestCleanMarkdown:
         assert "\n\n\n" not in result
         assert "본문 내용 여기" in result
 
+    def test_preserves_indent_and_expands_tabs(self):
+        text = "상위\n  - 하위  항목   \n\t- 탭  들여쓰기\r\n   \n끝"
+        result = clean_markdown(text)
+        assert result == "상위\n  - 하위 항목\n    - 탭 들여쓰기\n\n끝"
+
     def test_normalizes_bullets(self):
         text = "● 항목1\n•  항목2\n◆ 항목3\n*   항목4"
         result = clean_markdown(text)
@@ -105,3 +162,87 @@ class TestCleanMarkdown:
         assert "\n\n\n" not in result
         assert "- 항목1" in result
         assert "- 항목2" in result
+
+
+class TestJDImageParser:
+    def test_get_media_type_uses_extension(self):
+        from resume_tailor.parsers.jd_image_parser import _get_media_type
+
+        assert _get_media_type("공고.JPEG") == "image/jpeg"
+        assert _get_media_type("scan.v2.png") == "image/png"
+        assert _get_media_type("photo.myjpg") is None
+        assert _get_media_type("README") is None
+
+    def test_pdf_to_images_renders_each_page_as_jpeg(self):
+        import fitz
+
+        from resume_tailor.parsers.jd_image_parser import pdf_to_images
+
+        doc = fitz.open()
+        for i in range(2):
+            doc.new_page().insert_text((72, 72), f"page {i}")
+        images = pdf_to_images(doc.tobytes())
+        doc.close()
+
+        assert len(images) == 2
+        assert all(img.startswith(b"\xff\xd8") and mt == "image/jpeg" for img, mt in images)
+
+    def test_pdf_pages_render_within_vision_edge_limit(self):
+        import io
+
+        import fitz
+        from PIL import Image
+
+        from resume_tailor.clients.llm_client import MAX_IMAGE_EDGE, _fit_image
+        from resume_tailor.parsers.jd_image_parser import pdf_to_images
+
+        doc = fitz.open()
+        doc.new_page(width=595, height=842).insert_text((72, 72), "A4 page")
+        [(img, media_type)] = pdf_to_images(doc.tobytes())
+        doc.close()
+
+        with Image.open(io.BytesIO(img)) as page:
+            assert max(page.size) <= MAX_IMAGE_EDGE
+        # Already fits, so the client sends it without re-encoding
+        assert _fit_image(img, media_type) is img
+
+    async def test_iter_pdf_images_matches_pdf_to_images(self):
+        import fitz
+
+        from resume_tailor.parsers.jd_image_parser import iter_pdf_images, pdf_to_images
+
+        doc = fitz.open()
+        for i in range(3):
+            doc.new_page().insert_text((72, 72), f"page {i}")
+        pdf_bytes = doc.tobytes()
+        doc.close()
+
+        streamed = [item async for item in iter_pdf_images(pdf_bytes)]
+        assert streamed == pdf_to_images(pdf_bytes)
+
+    async def test_pdf_pages_ocr_concurrently_in_page_order(self, monkeypatch):
+        import asyncio
+
+        from resume_tailor.parsers import jd_image_parser
+
+        async def _fake_pages(_):
+            for i in range(3):
+                yield f"page{i}".encode(), "image/png"
+
+        monkeypatch.setattr(jd_image_parser, "iter_pdf_images", _fake_pages)
+        in_flight = 0
+        peak = 0
+
+        class FakeLLM:
+            async def extract_text_from_image(self, img: bytes, media_type: str) -> str:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                # Later pages finish first
+                await asyncio.sleep(0.03 - int(img[-1:]) * 0.01)
+                in_flight -= 1
+                return img.decode()
+
+        text = await jd_image_parser.extract_jd_from_file(FakeLLM(), b"%PDF", "jd.pdf")
+        assert text == "page0\n\npage1\n\npage2"
+        assert peak == 3
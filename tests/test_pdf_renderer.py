@@ -50,6 +50,17 @@ def test_render_pdf_valid_pdf_magic():
     assert result[:4] == b"%PDF"
 
 
+def test_render_pdf_writes_to_target():
+    """With a target, render_pdf should write the PDF into it and return None."""
+    import io
+
+    from resume_tailor.export.pdf_renderer import render_pdf
+
+    buf = io.BytesIO()
+    assert render_pdf(SAMPLE_MARKDOWN, target=buf) is None
+    assert buf.getvalue()[:4] == b"%PDF"
+
+
 def test_render_pdf_all_themes():
     """Each theme should produce valid PDF bytes."""
     from resume_tailor.export.pdf_renderer import AVAILABLE_THEMES, render_pdf
@@ -102,6 +113,18 @@ def test_md_to_styled_html_includes_body():
     assert "<h1>" in result or "홍길동" in result
 
 
+def test_md_to_styled_html_is_memoized():
+    """Repeated renders of the same input should reuse the cached HTML."""
+    from resume_tailor.export.pdf_renderer import _md_to_styled_html
+
+    _md_to_styled_html.cache_clear()
+    first = _md_to_styled_html(SAMPLE_MARKDOWN, "modern", "Test")
+    with patch("markdown.markdown") as mock_md:
+        second = _md_to_styled_html(SAMPLE_MARKDOWN, "modern", "Test")
+    mock_md.assert_not_called()
+    assert second == first
+
+
 # ---------------------------------------------------------------------------
 # AVAILABLE_THEMES
 # ---------------------------------------------------------------------------
@@ -200,3 +223,26 @@ def test_parse_html_to_lines_bullets():
     texts = [txt for _, txt in bullet_lines]
     assert "Python 개발" in texts
     assert "AWS 운영" in texts
+
+
+def test_parse_html_to_lines_inline_markup_and_entities():
+    """Inline tags should be dropped, entities decoded and <head> ignored."""
+    from resume_tailor.export.pdf_fallback import _parse_html_to_lines
+
+    html = (
+        "<html><head><title>T</title><style>h1{}</style></head><body>"
+        "<p><strong>이메일</strong>: a &amp; b</p></body></html>"
+    )
+    assert _parse_html_to_lines(html) == [("text", "이메일: a & b")]
+
+
+def test_export_import_does_not_load_pdf_stack():
+    """Importing the export package should not pull in markdown/jinja2/fpdf."""
+    import subprocess
+
+    code = (
+        "import sys, resume_tailor.export, resume_tailor.export.pdf_fallback;"
+        "print(any(m in sys.modules for m in ('markdown', 'jinja2', 'fpdf', 'weasyprint')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
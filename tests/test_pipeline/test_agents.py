@@ -72,6 +72,25 @@ class TestJDAnalyst:
         assert result.title == "백엔드 개발자"
         assert "Java" in result.hard_skills
 
+    @pytest.mark.asyncio
+    async def test_analyze_memoized_by_content(self, mock_llm_client, sample_jd_text):
+        mock_llm_client.generate_json.return_value = {
+            "title": "백엔드 개발자",
+            "hard_skills": ["Python"],
+            "soft_skills": [],
+            "ats_keywords": [],
+            "seniority_level": "미들",
+            "tone": "formal",
+            "key_responsibilities": [],
+            "preferred_qualifications": [],
+        }
+        analyst = JDAnalyst(mock_llm_client)
+        first = await analyst.analyze(sample_jd_text)
+        second = await analyst.analyze(sample_jd_text)
+
+        assert second is first
+        assert mock_llm_client.generate_json.await_count == 1
+
     @pytest.mark.asyncio
     async def test_prompt_includes_jd(self, mock_llm_client):
         mock_llm_client.generate_json.return_value = {
@@ -90,6 +109,38 @@ class TestJDAnalyst:
         call_args = mock_llm_client.generate_json.call_args
         assert "Python 개발자 모집" in call_args.kwargs["prompt"]
 
+    @pytest.mark.asyncio
+    async def test_clear_role_category_is_not_asked_of_the_model(self, mock_llm_client):
+        mock_llm_client.generate_json.return_value = {
+            "title": "백엔드 개발자",
+            "hard_skills": ["Python"],
+            "soft_skills": [],
+            "ats_keywords": [],
+            "seniority_level": "미들",
+            "tone": "technical",
+            "key_responsibilities": [],
+            "preferred_qualifications": [],
+        }
+        analyst = JDAnalyst(mock_llm_client)
+        result = await analyst.analyze("백엔드 개발자 모집. Python, Django, AWS 경험자 우대")
+
+        assert result.role_category == "tech"
+        kwargs = mock_llm_client.generate_json.call_args.kwargs
+        assert "role_category" not in kwargs["system"]
+        assert "role_category" not in kwargs["schema"].model_json_schema()["properties"]
+
+    def test_classify_role(self):
+        from resume_tailor.pipeline.jd_analyst import SYSTEM_PROMPT, classify_role
+
+        assert classify_role("UX/UI 디자이너. Figma 프로토타입 제작") == "design"
+        assert classify_role("마케팅 전략기획 담당, 사업개발 경험") == "business"
+        # Too few keywords, or two categories close together: left to the model
+        assert classify_role("Python 개발자 모집") is None
+        assert classify_role("UX 디자이너, Figma, React, TypeScript, 프론트엔드 개발자") is None
+        # Short ASCII keywords only match whole words
+        assert classify_role("guide, build, quality, maintenance, squid") is None
+        assert "role_category" in SYSTEM_PROMPT
+
 
 class TestStrategyPlanner:
     @pytest.mark.asyncio
@@ -120,6 +171,34 @@ class TestStrategyPlanner:
         assert len(result.match_matrix) == 1
         assert result.match_matrix[0].strength == "strong"
 
+    @pytest.mark.asyncio
+    async def test_plan_caches_resume_and_fixed_guidance_in_system(
+        self, mock_llm_client, sample_company_profile, sample_job_analysis, sample_resume_text
+    ):
+        """Only the company and job vary in the prompt; the rest is a cached system block."""
+        from resume_tailor.pipeline.strategy_planner import STRATEGY_HINTS
+
+        mock_llm_client.generate_json.return_value = {
+            "match_matrix": [], "gaps": [], "emphasis_points": [], "keyword_plan": [],
+            "tone_guidance": "기술적", "summary_direction": "백엔드 전문가",
+        }
+        planner = StrategyPlanner(mock_llm_client)
+        await planner.plan(
+            sample_company_profile, sample_job_analysis, sample_resume_text, role_category="tech",
+        )
+        other_job = sample_job_analysis.model_copy(update={"title": "다른 포지션"})
+        await planner.plan(
+            sample_company_profile, other_job, sample_resume_text, role_category="tech",
+        )
+
+        first, second = mock_llm_client.generate_json.call_args_list
+        assert first.kwargs["cache_system"] is True
+        assert first.kwargs["system"] == second.kwargs["system"]
+        assert sample_resume_text in first.kwargs["system"]
+        assert STRATEGY_HINTS["tech"] in first.kwargs["system"]
+        assert sample_resume_text not in first.kwargs["prompt"]
+        assert sample_job_analysis.title in first.kwargs["prompt"]
+
 
 class TestResumeWriter:
     @pytest.mark.asyncio
@@ -196,6 +275,136 @@ class TestResumeWriter:
         assert len(result.sections) == 0
         assert "홍길동" in result.full_markdown
 
+    @pytest.mark.asyncio
+    async def test_static_context_in_cached_system(
+        self, mock_llm_client, sample_strategy, sample_resume_text
+    ):
+        """Template and original resume are cached; the strategy stays in the prompt."""
+        from resume_tailor.templates.loader import load_template
+
+        mock_llm_client.generate_json.return_value = {"sections": [], "full_markdown": "# 홍길동"}
+        writer = ResumeWriter(mock_llm_client)
+        await writer.write(sample_strategy, sample_resume_text, load_template("korean_standard"))
+
+        kwargs = mock_llm_client.generate_json.call_args.kwargs
+        assert kwargs["cache_system"] is True
+        assert sample_resume_text in kwargs["system"]
+        assert sample_resume_text not in kwargs["prompt"]
+        assert sample_strategy.tone_guidance in kwargs["prompt"]
+
+    @pytest.mark.asyncio
+    async def test_cached_prefix_independent_of_strategy(
+        self, mock_llm_client, sample_strategy, sample_resume_text
+    ):
+        """Writes with different strategies share the cached system block byte for byte."""
+        from resume_tailor.templates.loader import load_template
+
+        mock_llm_client.generate_json.return_value = {"sections": [], "full_markdown": "# 홍길동"}
+        writer = ResumeWriter(mock_llm_client)
+        template = load_template("korean_standard")
+        other = sample_strategy.model_copy(update={"tone_guidance": "친근한 톤"})
+        await writer.write(sample_strategy, sample_resume_text, template)
+        await writer.write(other, sample_resume_text, template)
+
+        first, second = mock_llm_client.generate_json.call_args_list
+        assert first.kwargs["system"] == second.kwargs["system"]
+        assert first.kwargs["prompt"] != second.kwargs["prompt"]
+
+
+    @pytest.mark.asyncio
+    async def test_rewrite_reuses_formatted_specs(
+        self, mock_llm_client, sample_strategy, sample_resume_text
+    ):
+        """A rewrite with the same strategy and template skips re-formatting both."""
+        from resume_tailor.pipeline.resume_writer import _format_strategy, _format_template
+        from resume_tailor.templates.loader import load_template
+
+        mock_llm_client.generate_json.return_value = {"sections": [], "full_markdown": "# 홍길동"}
+        writer = ResumeWriter(mock_llm_client)
+        template = load_template("korean_standard")
+        await writer.write(sample_strategy, sample_resume_text, template)
+        template_hits = _format_template.cache_info().hits
+        strategy_hits = _format_strategy.cache_info().hits
+        await writer.write(sample_strategy, sample_resume_text, template)
+
+        assert _format_template.cache_info().hits == template_hits + 1
+        assert _format_strategy.cache_info().hits == strategy_hits + 1
+        first, second = mock_llm_client.generate_json.call_args_list
+        assert first.kwargs == second.kwargs
+
+    @pytest.mark.asyncio
+    async def test_on_section_reports_sections_while_streaming(
+        self, mock_llm_client, sample_strategy, sample_resume_text
+    ):
+        """Each section reaches on_section as soon as its object closes in the stream."""
+        from resume_tailor.templates.loader import load_template
+
+        payload = json.dumps({
+            "sections": [
+                {"id": "header", "label": "인적사항", "content": "# 홍길동 {본문}"},
+                {"id": "summary", "label": "자기소개", "content": "백엔드 개발자"},
+            ],
+            "full_markdown": "# 홍길동\n\n## 자기소개\n백엔드 개발자",
+        }, ensure_ascii=False)
+        consumed: list[str] = []
+        reported: list[tuple[str, int]] = []
+
+        async def _stream(prompt, **kwargs):
+            for i in range(0, len(payload), 8):
+                consumed.append(payload[i:i + 8])
+                yield payload[i:i + 8]
+
+        mock_llm_client.generate_stream = _stream
+        writer = ResumeWriter(mock_llm_client)
+        result = await writer.write(
+            sample_strategy, sample_resume_text, load_template("korean_standard"),
+            on_section=lambda s: reported.append((s.id, len("".join(consumed)))),
+        )
+
+        assert [sid for sid, _ in reported] == ["header", "summary"]
+        # The first section was reported long before the reply finished
+        assert reported[0][1] < payload.index('"summary"')
+        assert [s.id for s in result.sections] == ["header", "summary"]
+        assert "자기소개" in result.full_markdown
+        mock_llm_client.generate_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_patch_applies_edits_and_returns_none_when_nothing_matches(
+        self, mock_llm_client
+    ):
+        resume = TailoredResume(
+            sections=[
+                {"id": "header", "label": "인적사항", "content": "# 홍길동"},
+                {"id": "summary", "label": "자기소개", "content": "백엔드 개발자"},
+            ],
+            full_markdown="# 홍길동\n\n## 자기소개\n백엔드 개발자",
+            metadata={},
+        )
+        qa = QAResult(
+            factual_accuracy=80, keyword_coverage=70, template_compliance=80,
+            overall_score=77, issues=["구체성 부족"], suggestions=["기술 스택 명시"],
+            suggestion_examples=["Python 백엔드 개발자"], pass_=False,
+        )
+        writer = ResumeWriter(mock_llm_client, patch_model="haiku")
+
+        mock_llm_client.generate_json.return_value = {"edits": [
+            {"section_id": "summary", "old": "백엔드 개발자", "new": "Python 백엔드 개발자"},
+            {"section_id": "summary", "old": "없는 문장", "new": "무시됨"},
+        ]}
+        patched = await writer.patch(resume, qa, "원본 이력서")
+
+        assert patched.full_markdown == "# 홍길동\n\n## 자기소개\nPython 백엔드 개발자"
+        assert patched.sections[1].content == "Python 백엔드 개발자"
+        assert resume.sections[1].content == "백엔드 개발자"
+        kwargs = mock_llm_client.generate_json.call_args.kwargs
+        assert kwargs["model"] == "haiku"
+        assert "원본 이력서" in kwargs["system"]
+        assert "구체성 부족" in kwargs["prompt"] and "Python 백엔드 개발자" in kwargs["prompt"]
+
+        mock_llm_client.generate_json.return_value = {"edits": [
+            {"section_id": "summary", "old": "없는 문장", "new": "무시됨"},
+        ]}
+        assert await writer.patch(resume, qa, "원본 이력서") is None
 
 class TestQAReviewer:
     @pytest.mark.asyncio
@@ -213,6 +422,11 @@ class TestQAReviewer:
         result = await reviewer.review("generated", "original", "jd text")
 
         assert isinstance(result, QAResult)
+        kwargs = mock_llm_client.generate_json.call_args.kwargs
+        # Original resume and JD are shared by rewrite reviews and cached
+        assert kwargs["cache_system"] is True
+        assert "original" in kwargs["system"] and "jd text" in kwargs["system"]
+        assert "generated" in kwargs["prompt"]
         assert result.pass_ is True
         assert result.overall_score == 90
 
@@ -232,3 +446,153 @@ class TestQAReviewer:
 
         assert result.pass_ is False
         assert len(result.issues) == 1
+
+    @staticmethod
+    def _chunked_stream(payload: str, consumed: list[str]):
+        async def _stream(prompt, **kwargs):
+            for i in range(0, len(payload), 8):
+                consumed.append(payload[i:i + 8])
+                yield payload[i:i + 8]
+
+        return _stream
+
+    @pytest.mark.asyncio
+    async def test_stop_if_failing_cuts_stream_at_score(self, mock_llm_client):
+        payload = json.dumps({
+            "factual_accuracy": 60,
+            "keyword_coverage": 50,
+            "template_compliance": 70,
+            "overall_score": 61,
+            "issues": ["긴 문제 설명 " * 20],
+            "suggestions": ["긴 제안 " * 20],
+            "pass": False,
+        }, ensure_ascii=False)
+        consumed: list[str] = []
+        mock_llm_client.generate_stream = self._chunked_stream(payload, consumed)
+
+        reviewer = QAReviewer(mock_llm_client)
+        result = await reviewer.review("generated", "original", "jd", stop_if_failing=True)
+
+        assert result.pass_ is False
+        assert result.overall_score == 61
+        assert result.factual_accuracy == 60
+        assert result.issues == []
+        assert len("".join(consumed)) < len(payload) // 2
+        mock_llm_client.generate_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stop_if_failing_reads_full_review_when_passing(self, mock_llm_client):
+        payload = json.dumps({
+            "factual_accuracy": 95,
+            "keyword_coverage": 85,
+            "template_compliance": 90,
+            "overall_score": 90,
+            "issues": [],
+            "suggestions": ["좋습니다"],
+            "pass": True,
+        }, ensure_ascii=False)
+        consumed: list[str] = []
+        mock_llm_client.generate_stream = self._chunked_stream(payload, consumed)
+
+        reviewer = QAReviewer(mock_llm_client)
+        result = await reviewer.review("generated", "original", "jd", stop_if_failing=True)
+
+        assert result.pass_ is True
+        assert result.suggestions == ["좋습니다"]
+        assert "".join(consumed) == payload
+
+    @pytest.mark.asyncio
+    async def test_stop_below_keeps_details_of_borderline_fail(self, mock_llm_client):
+        payload = json.dumps({
+            "factual_accuracy": 80,
+            "keyword_coverage": 70,
+            "template_compliance": 80,
+            "overall_score": 77,
+            "issues": ["구체성 부족"],
+            "suggestions": ["수치 추가"],
+            "pass": False,
+        }, ensure_ascii=False)
+        consumed: list[str] = []
+        mock_llm_client.generate_stream = self._chunked_stream(payload, consumed)
+
+        reviewer = QAReviewer(mock_llm_client)
+        result = await reviewer.review(
+            "generated", "original", "jd", stop_if_failing=True, stop_below=75,
+        )
+
+        assert result.pass_ is False
+        assert result.issues == ["구체성 부족"]
+        assert "".join(consumed) == payload
+
+    @staticmethod
+    def _job(keywords):
+        return JobAnalysis(
+            title="백엔드", hard_skills=[], soft_skills=[], ats_keywords=keywords,
+            seniority_level="미들", tone="formal", key_responsibilities=[],
+            preferred_qualifications=[],
+        )
+
+    @pytest.mark.asyncio
+    async def test_review_with_job_computes_keyword_coverage(self, mock_llm_client):
+        mock_llm_client.generate_json.return_value = {
+            "factual_accuracy": 90,
+            "template_compliance": 80,
+            "content_richness": 80,
+            "detail_depth": 70,
+            "issues": [],
+            "suggestions": [],
+        }
+        reviewer = QAReviewer(mock_llm_client)
+        result = await reviewer.review(
+            "PYTHON, django 경험", "original", "jd",
+            job=self._job(["Python", "Django", "AWS", "Kotlin"]),
+        )
+
+        kwargs = mock_llm_client.generate_json.call_args.kwargs
+        assert '"keyword_coverage"' not in kwargs["system"]
+        assert "keyword_coverage" not in kwargs["schema"].model_fields
+        assert result.keyword_coverage == 50
+        # 0.3*90 + 0.2*50 + 0.2*80 + 0.2*80 + 0.1*70
+        assert result.overall_score == 76
+        assert result.pass_ is False
+
+    @pytest.mark.asyncio
+    async def test_review_with_job_keeps_model_score_when_axis_missing(self, mock_llm_client):
+        mock_llm_client.generate_json.return_value = {
+            "factual_accuracy": 90,
+            "template_compliance": 80,
+            "overall_score": 85,
+            "issues": [],
+            "suggestions": [],
+            "pass": True,
+        }
+        reviewer = QAReviewer(mock_llm_client)
+        result = await reviewer.review("Python", "original", "jd", job=self._job(["Python"]))
+
+        assert result.keyword_coverage == 100
+        assert result.overall_score == 85
+        assert result.pass_ is True
+
+    @pytest.mark.asyncio
+    async def test_stop_if_failing_with_job_stops_after_judged_axes(self, mock_llm_client):
+        payload = json.dumps({
+            "factual_accuracy": 60,
+            "template_compliance": 70,
+            "content_richness": 60,
+            "detail_depth": 60,
+            "issues": ["긴 문제 설명 " * 20],
+            "suggestions": ["긴 제안 " * 20],
+        }, ensure_ascii=False)
+        consumed: list[str] = []
+        mock_llm_client.generate_stream = self._chunked_stream(payload, consumed)
+
+        reviewer = QAReviewer(mock_llm_client)
+        result = await reviewer.review(
+            "Python", "original", "jd", job=self._job(["Python", "Go"]), stop_if_failing=True,
+        )
+
+        assert result.keyword_coverage == 50
+        assert result.overall_score == 60
+        assert result.pass_ is False
+        assert result.issues == []
+        assert len("".join(consumed)) < len(payload) // 2
@@ -1,10 +1,11 @@
 """Tests for form_filler: generate_form_answers, extract_structured_fields, _smart_truncate."""
 
+import functools
 from unittest.mock import AsyncMock
 
 import pytest
 
-from resume_tailor.clients.llm_client import LLMResponse
+from resume_tailor.clients.llm_client import LLMClient, LLMResponse
 from resume_tailor.parsers.form_parser import FormQuestion
 from resume_tailor.pipeline.form_filler import (
     _smart_truncate,
@@ -13,10 +14,17 @@ from resume_tailor.pipeline.form_filler import (
 )
 
 
+def _llm_mock() -> AsyncMock:
+    """An LLM mock whose generate_many fans out to its mocked generate."""
+    llm = AsyncMock()
+    llm.generate_many = functools.partial(LLMClient.generate_many, llm)
+    return llm
+
+
 class TestGenerateFormAnswers:
     @pytest.mark.asyncio
     async def test_generate_form_answers_returns_list(self, sample_tailored_resume):
-        mock_llm = AsyncMock()
+        mock_llm = _llm_mock()
         mock_llm.generate = AsyncMock(
             return_value=LLMResponse(text="답변 텍스트", input_tokens=10, output_tokens=5)
         )
@@ -42,7 +50,7 @@ class TestGenerateFormAnswers:
             call_count += 1
             return LLMResponse(text="답변", input_tokens=10, output_tokens=5)
 
-        mock_llm = AsyncMock()
+        mock_llm = _llm_mock()
         mock_llm.generate = AsyncMock(side_effect=dispatch)
         questions = [
             FormQuestion(label="자기소개를 해주세요"),
@@ -53,11 +61,54 @@ class TestGenerateFormAnswers:
         # All three questions must be answered (asyncio.gather runs them all)
         assert call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_generate_form_answers_bounds_concurrency(self, sample_tailored_resume):
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def dispatch(prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return LLMResponse(text=prompt.split("## 문항\n")[1][:2], input_tokens=10, output_tokens=5)
+
+        mock_llm = _llm_mock()
+        mock_llm.generate = AsyncMock(side_effect=dispatch)
+        questions = [FormQuestion(label=f"Q{i}") for i in range(6)]
+        result = await generate_form_answers(
+            mock_llm, questions, sample_tailored_resume, concurrency=2
+        )
+        assert peak == 2
+        assert [r["answer"] for r in result] == [f"Q{i}" for i in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_generate_form_answers_caches_resume_in_system(self, sample_tailored_resume):
+        mock_llm = _llm_mock()
+        mock_llm.generate = AsyncMock(
+            return_value=LLMResponse(text="답변", input_tokens=10, output_tokens=5)
+        )
+        questions = [FormQuestion(label="자기소개"), FormQuestion(label="지원동기")]
+        await generate_form_answers(
+            mock_llm, questions, sample_tailored_resume, jd_text="채용공고 본문", company_name="네이버"
+        )
+        systems = {c.kwargs["system"] for c in mock_llm.generate.call_args_list}
+        # Identical system block across questions so the cached prefix is reused
+        assert len(systems) == 1
+        system = systems.pop()
+        assert sample_tailored_resume.full_markdown in system
+        assert "채용공고 본문" in system and "네이버" in system
+        assert all("채용공고 본문" not in c.kwargs["prompt"] for c in mock_llm.generate.call_args_list)
+        assert all(c.kwargs["cache_system"] for c in mock_llm.generate.call_args_list)
+
     @pytest.mark.asyncio
     async def test_generate_form_answers_respects_max_length(self, sample_tailored_resume):
         long_answer = "가" * 50  # 50 chars, well over max_length=10
 
-        mock_llm = AsyncMock()
+        mock_llm = _llm_mock()
         mock_llm.generate = AsyncMock(
             return_value=LLMResponse(text=long_answer, input_tokens=10, output_tokens=5)
         )
@@ -65,9 +116,72 @@ class TestGenerateFormAnswers:
         result = await generate_form_answers(mock_llm, questions, sample_tailored_resume)
         assert result[0]["char_count"] <= 10
 
+    @pytest.mark.asyncio
+    async def test_short_questions_answered_in_one_batch(self, sample_tailored_resume):
+        mock_llm = _llm_mock()
+        mock_llm.generate_json = AsyncMock(
+            return_value={"answers": [{"id": 2, "answer": "둘"}, {"id": 1, "answer": "하나"}]}
+        )
+        mock_llm.generate = AsyncMock(
+            return_value=LLMResponse(text="긴 답변", input_tokens=10, output_tokens=5)
+        )
+        questions = [
+            FormQuestion(label="한 줄 소개", max_length=50),
+            FormQuestion(label="지원동기", max_length=1000),
+            FormQuestion(label="희망 직무", max_length=100),
+        ]
+        result = await generate_form_answers(mock_llm, questions, sample_tailored_resume)
+
+        assert [r["answer"] for r in result] == ["하나", "긴 답변", "둘"]
+        mock_llm.generate_json.assert_awaited_once()
+        prompt = mock_llm.generate_json.call_args.kwargs["prompt"]
+        assert "1. 한 줄 소개" in prompt and "2. 희망 직무" in prompt
+        assert "지원동기" not in prompt
+        assert mock_llm.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_gaps_fall_back_to_single_calls(self, sample_tailored_resume):
+        mock_llm = _llm_mock()
+        mock_llm.generate_json = AsyncMock(return_value={"answers": [{"id": 1, "answer": "하나"}]})
+        mock_llm.generate = AsyncMock(
+            return_value=LLMResponse(text="따로", input_tokens=10, output_tokens=5)
+        )
+        questions = [
+            FormQuestion(label="한 줄 소개", max_length=50),
+            FormQuestion(label="희망 직무", max_length=100),
+        ]
+        result = await generate_form_answers(mock_llm, questions, sample_tailored_resume)
+
+        assert [r["answer"] for r in result] == ["하나", "따로"]
+        assert mock_llm.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_mode_uses_message_batches(self, sample_tailored_resume):
+        mock_llm = _llm_mock()
+        mock_llm.batch_generate = AsyncMock(
+            return_value=[LLMResponse(text=" 배치 ", input_tokens=10, output_tokens=5), None]
+        )
+        mock_llm.generate = AsyncMock(
+            return_value=LLMResponse(text="실시간", input_tokens=10, output_tokens=5)
+        )
+        questions = [
+            FormQuestion(label="한 줄 소개", max_length=50),
+            FormQuestion(label="지원동기를 작성해주세요"),
+        ]
+        result = await generate_form_answers(
+            mock_llm, questions, sample_tailored_resume, batch=True
+        )
+
+        assert [r["answer"] for r in result] == ["배치", "실시간"]
+        jobs = mock_llm.batch_generate.await_args.args[0]
+        assert len(jobs) == 2
+        assert "한 줄 소개" in jobs[0]["prompt"] and jobs[0]["cache_system"] is True
+        mock_llm.generate_json.assert_not_called()
+        assert mock_llm.generate.await_count == 1
+
     @pytest.mark.asyncio
     async def test_generate_form_answers_empty_questions(self, sample_tailored_resume):
-        mock_llm = AsyncMock()
+        mock_llm = _llm_mock()
         result = await generate_form_answers(mock_llm, [], sample_tailored_resume)
         assert result == []
         mock_llm.generate.assert_not_called()
@@ -91,7 +205,8 @@ class TestExtractStructuredFields:
         mock_llm.generate_json = AsyncMock(return_value={})
         await extract_structured_fields(mock_llm, sample_tailored_resume)
         call_kwargs = mock_llm.generate_json.call_args.kwargs
-        assert sample_tailored_resume.full_markdown in call_kwargs["prompt"]
+        assert sample_tailored_resume.full_markdown in call_kwargs["system"]
+        assert call_kwargs["cache_system"] is True
 
 
 class TestSmartTruncate:
@@ -119,3 +234,11 @@ class TestSmartTruncate:
         text = "가" * 10
         result = _smart_truncate(text, 10)
         assert result == text
+
+    def test_smart_truncate_prefers_ending_priority_over_position(self):
+        # A line-ending period beats later "다. " and ". " endings
+        text = "가" * 13 + ".\n" + "다. " + "ab. " + "z" * 20
+        assert _smart_truncate(text, 25) == "가" * 13 + "."
+        # "다. " beats a later plain ". "
+        text = "가" * 13 + "다. " + "ab. " + "z" * 20
+        assert _smart_truncate(text, 25) == "가" * 13 + "다."
@@ -1,11 +1,25 @@
 """Tests for pipeline orchestrator."""
 
+import asyncio
+import json
+
 import pytest
 
 from resume_tailor.models.company import CompanyProfile
 from resume_tailor.pipeline.orchestrator import PipelineOrchestrator, PipelineResult
 
 
+@pytest.fixture(autouse=True)
+def stream_via_generate_json(mock_llm_client):
+    """Serve streamed (fail-fast) QA reviews from the generate_json mock."""
+
+    async def _stream(prompt, **kwargs):
+        data = await mock_llm_client.generate_json(prompt=prompt, **kwargs)
+        yield json.dumps(data, ensure_ascii=False)
+
+    mock_llm_client.generate_stream = _stream
+
+
 @pytest.fixture
 def mock_company_json():
     return {
@@ -68,6 +82,8 @@ def mock_qa_json():
         "factual_accuracy": 95,
         "keyword_coverage": 90,
         "template_compliance": 85,
+        "content_richness": 90,
+        "detail_depth": 90,
         "overall_score": 90,
         "issues": [],
         "suggestions": [],
@@ -79,23 +95,24 @@ def _make_dispatch(responses):
     """Create a side_effect function that dispatches by prompt content.
 
     This is needed because asyncio.gather makes LLM call order
-    non-deterministic in Phase 1 (company research + JD analysis).
+    non-deterministic in Phase 1 (company research + JD analysis), and
+    the QA rewrite loop overlaps a review with the next rewrite.
     """
-    remaining = list(responses)
+    resumes = [responses[k] for k in ("resume", "resume2", "resume3") if k in responses]
+    reviews = [responses[k] for k in ("qa", "qa2", "qa3") if k in responses]
 
     async def _dispatch(prompt, **kwargs):
         if "회사 프로필을 작성하세요" in prompt:
             return responses["company"]
         if "채용공고를 분석하세요" in prompt:
             return responses["job"]
-        # For sequential phases, pop from remaining list
-        return remaining.pop(0)
-
-    # Pre-fill remaining with sequential-phase responses only
-    remaining.clear()
-    for key in ("strategy", "resume", "qa", "resume2", "qa2", "resume3", "qa3"):
-        if key in responses:
-            remaining.append(responses[key])
+        if "이력서 맞춤화 전략을 수립하세요" in prompt:
+            return responses["strategy"]
+        if "맞춤 이력서를 작성하세요" in prompt:
+            return resumes.pop(0)
+        if "최소한으로 수정하세요" in prompt:
+            return responses["patch"]
+        return reviews.pop(0)
 
     return _dispatch
 
@@ -177,15 +194,19 @@ class TestOrchestrator:
             "factual_accuracy": 60,
             "keyword_coverage": 50,
             "template_compliance": 70,
+            "content_richness": 60,
+            "detail_depth": 60,
             "overall_score": 60,
             "issues": ["문제"],
             "suggestions": ["개선"],
             "pass": False,
         }
         qa_pass = {
-            "factual_accuracy": 90,
+            "factual_accuracy": 95,
             "keyword_coverage": 85,
             "template_compliance": 90,
+            "content_richness": 90,
+            "detail_depth": 90,
             "overall_score": 88,
             "issues": [],
             "suggestions": [],
@@ -211,6 +232,57 @@ class TestOrchestrator:
         assert result.rewrites == 1
         assert result.qa.pass_ is True
 
+    @pytest.mark.asyncio
+    async def test_borderline_score_is_patched_not_rewritten(
+        self,
+        mock_llm_client,
+        mock_search_client,
+        mock_company_json,
+        mock_job_json,
+        mock_strategy_json,
+        mock_resume_json,
+        mock_qa_json,
+    ):
+        # Judged axes give 77 with the locally computed 50% keyword coverage
+        qa_borderline = {
+            "factual_accuracy": 85,
+            "template_compliance": 85,
+            "content_richness": 80,
+            "detail_depth": 85,
+            "issues": ["직무 키워드 부족"],
+            "suggestions": ["Django 경험 언급"],
+            "suggestion_examples": ["Python 백엔드 개발자"],
+        }
+        mock_llm_client.generate_json.side_effect = _make_dispatch({
+            "company": mock_company_json,
+            "job": mock_job_json,
+            "strategy": mock_strategy_json,
+            "resume": mock_resume_json,
+            "qa": qa_borderline,
+            "patch": {"edits": [
+                {"section_id": "header", "old": "Python 개발자", "new": "Python 백엔드 개발자"},
+            ]},
+            "qa2": mock_qa_json,
+        })
+
+        orchestrator = PipelineOrchestrator(mock_llm_client, mock_search_client)
+        result = await orchestrator.run(
+            company_name="테스트",
+            jd_text="개발자",
+            resume_text="이력서",
+        )
+
+        assert result.rewrites == 1
+        assert result.resume.full_markdown == "# 홍길동\n\nPython 백엔드 개발자"
+        prompts = [c.kwargs["prompt"] for c in mock_llm_client.generate_json.call_args_list]
+        assert sum("맞춤 이력서를 작성하세요" in p for p in prompts) == 1
+        patch_call = next(
+            c for c in mock_llm_client.generate_json.call_args_list
+            if "최소한으로 수정하세요" in c.kwargs["prompt"]
+        )
+        assert patch_call.kwargs["model"] == "claude-haiku-4-5-20251001"
+        assert "직무 키워드 부족" in patch_call.kwargs["prompt"]
+
     @pytest.mark.asyncio
     async def test_qa_rewrite_loop_max_rewrites(
         self,
@@ -226,15 +298,19 @@ class TestOrchestrator:
             "factual_accuracy": 60,
             "keyword_coverage": 50,
             "template_compliance": 70,
+            "content_richness": 60,
+            "detail_depth": 60,
             "overall_score": 60,
             "issues": ["문제"],
             "suggestions": ["개선"],
             "pass": False,
         }
         qa_pass = {
-            "factual_accuracy": 90,
+            "factual_accuracy": 95,
             "keyword_coverage": 85,
             "template_compliance": 90,
+            "content_richness": 90,
+            "detail_depth": 90,
             "overall_score": 88,
             "issues": [],
             "suggestions": [],
@@ -281,6 +357,8 @@ class TestOrchestrator:
             "factual_accuracy": 60,
             "keyword_coverage": 50,
             "template_compliance": 70,
+            "content_richness": 60,
+            "detail_depth": 60,
             "overall_score": 60,
             "issues": ["문제"],
             "suggestions": ["개선"],
@@ -310,6 +388,59 @@ class TestOrchestrator:
         assert result.rewrites == 2
         assert result.qa.pass_ is False
 
+    @pytest.mark.asyncio
+    async def test_speculative_rewrite_cancelled_when_review_passes(
+        self,
+        mock_llm_client,
+        mock_search_client,
+        mock_company_json,
+        mock_job_json,
+        mock_strategy_json,
+        mock_resume_json,
+        mock_qa_json,
+    ):
+        """A failed rewrite starts the next one during its review; a pass cancels it."""
+        qa_fail = {**mock_qa_json, "factual_accuracy": 40, "overall_score": 60, "pass": False}
+        reviews = [qa_fail, mock_qa_json]
+        writes = 0
+        cancelled = False
+
+        async def _dispatch(prompt, **kwargs):
+            nonlocal writes, cancelled
+            if "회사 프로필을 작성하세요" in prompt:
+                return mock_company_json
+            if "채용공고를 분석하세요" in prompt:
+                return mock_job_json
+            if "이력서 맞춤화 전략을 수립하세요" in prompt:
+                return mock_strategy_json
+            if "맞춤 이력서를 작성하세요" in prompt:
+                writes += 1
+                if writes == 3:  # speculative second rewrite
+                    try:
+                        await asyncio.Event().wait()
+                    except asyncio.CancelledError:
+                        cancelled = True
+                        raise
+                return mock_resume_json
+            await asyncio.sleep(0)  # let the speculative write start
+            return reviews.pop(0)
+
+        mock_llm_client.generate_json.side_effect = _dispatch
+        orchestrator = PipelineOrchestrator(
+            mock_llm_client, mock_search_client, max_rewrites=3,
+        )
+        result = await orchestrator.run(
+            company_name="테스트",
+            jd_text="개발자",
+            resume_text="이력서",
+        )
+        await asyncio.sleep(0)
+
+        assert result.rewrites == 1
+        assert result.qa.pass_ is True
+        assert writes == 3
+        assert cancelled
+
     @pytest.mark.asyncio
     async def test_research_only(self, mock_llm_client, mock_search_client, mock_company_json):
         mock_llm_client.generate_json.return_value = mock_company_json
@@ -352,4 +483,57 @@ class TestOrchestrator:
         )
 
         assert "phase1" in phases
+        assert "section_ready" in phases
+        assert phases.index("writing") < phases.index("section_ready") < phases.index("qa")
         assert "done" in phases
+
+    @pytest.mark.asyncio
+    async def test_run_batch_returns_results_and_failures_in_order(
+        self,
+        mock_llm_client,
+        mock_search_client,
+        mock_company_json,
+        mock_job_json,
+        mock_strategy_json,
+        mock_resume_json,
+        mock_qa_json,
+    ):
+        in_flight = 0
+        peak = 0
+
+        async def _dispatch(prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "회사 프로필을 작성하세요" in prompt:
+                return mock_company_json
+            if "채용공고를 분석하세요" in prompt:
+                if "깨진 공고" in prompt:
+                    raise ValueError("unparseable JD")
+                return mock_job_json
+            if "이력서 맞춤화 전략을 수립하세요" in prompt:
+                return mock_strategy_json
+            if "맞춤 이력서를 작성하세요" in prompt:
+                return mock_resume_json
+            return mock_qa_json
+
+        mock_llm_client.generate_json.side_effect = _dispatch
+        mock_llm_client.get_token_summary.return_value = {
+            "input": 0, "output": 0, "cache_read": 0, "cache_creation": 0, "calls": [],
+        }
+        mock_search_client.get_search_count.return_value = 0
+        orchestrator = PipelineOrchestrator(mock_llm_client, mock_search_client)
+        jobs = [
+            {"company_name": f"회사{i}", "jd_text": jd, "resume_text": "이력서"}
+            for i, jd in enumerate(["개발자", "깨진 공고", "개발자", "개발자"])
+        ]
+        results = await orchestrator.run_batch(jobs, concurrency=2)
+
+        assert len(results) == 4
+        assert isinstance(results[1], ValueError)
+        assert all(isinstance(results[i], PipelineResult) for i in (0, 2, 3))
+        # Two pipelines at a time, each with at most two calls in flight
+        assert peak <= 4
+        assert mock_llm_client.track_task_usage.call_count == 4
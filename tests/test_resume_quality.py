@@ -70,6 +70,13 @@ class TestCheckResumeQuality:
         result = check_resume_quality(text)
         assert result.experience_items == 3
 
+    def test_bullets_and_numbers_on_same_line(self):
+        """Bullets are still counted when lines also carry quantities."""
+        text = "- 매출 30% 증가\n- 12명 팀 리드\n• 2020년 입사"
+        result = check_resume_quality(text)
+        assert result.experience_items == 3
+        assert result.has_quantitative is True
+
     def test_richness_score_bounded(self):
         """Score should always be between 0.0 and 1.0."""
         # Very long resume
@@ -107,7 +107,7 @@ class TestSentenceRefiner:
 
     @pytest.mark.asyncio
     async def test_refine_preserves_context(self, mock_llm_client):
-        """full_resume and jd_text appear in the prompt sent to LLM."""
+        """full_resume and jd_text are sent in the cached system block, the selection in the prompt."""
         mock_llm_client.generate_json.return_value = _make_suggestion_dicts(3)
         refiner = SentenceRefiner(llm=mock_llm_client)
 
@@ -117,10 +117,12 @@ class TestSentenceRefiner:
             jd_text="UNIQUE_JD_CONTENT",
         )
 
-        call_kwargs = mock_llm_client.generate_json.call_args
-        prompt = call_kwargs.kwargs.get("prompt") or call_kwargs[1].get("prompt") or call_kwargs[0][0]
-        assert "UNIQUE_RESUME_CONTENT" in prompt
-        assert "UNIQUE_JD_CONTENT" in prompt
+        call_kwargs = mock_llm_client.generate_json.call_args.kwargs
+        assert "UNIQUE_RESUME_CONTENT" in call_kwargs["system"]
+        assert "UNIQUE_JD_CONTENT" in call_kwargs["system"]
+        assert call_kwargs["cache_system"] is True
+        assert "선택 문장" in call_kwargs["prompt"]
+        assert "UNIQUE_RESUME_CONTENT" not in call_kwargs["prompt"]
 
     @pytest.mark.asyncio
     async def test_refine_handles_llm_error(self, mock_llm_client):
@@ -154,6 +156,27 @@ class TestSentenceRefiner:
         assert all(isinstance(s, RefinementSuggestion) for s in result)
 
 
+    @pytest.mark.asyncio
+    async def test_refine_many_keeps_order_and_isolates_failures(self, mock_llm_client):
+        """Each sentence gets its own result; a failed call yields an empty list."""
+        async def _fake(prompt, system, model, cache_system):
+            if "실패 문장" in prompt:
+                raise RuntimeError("rate limited")
+            return _make_suggestion_dicts(2)
+
+        mock_llm_client.generate_json.side_effect = _fake
+        refiner = SentenceRefiner(llm=mock_llm_client)
+
+        results = await refiner.refine_many(
+            ["첫 문장", "실패 문장", "세 번째 문장"],
+            full_resume="이력서",
+            jd_text="채용공고",
+            num_alternatives=2,
+        )
+
+        assert [len(r) for r in results] == [2, 0, 2]
+        assert mock_llm_client.generate_json.call_count == 3
+
 class TestParseSuggestions:
     """Tests for the _parse_suggestions static method."""
 
@@ -31,6 +31,13 @@ class TestTemplateLoader:
         with pytest.raises(FileNotFoundError, match="Template not found"):
             load_template("nonexistent")
 
+    def test_load_returns_independent_copies(self):
+        first = load_template("korean_standard")
+        first.sections.clear()
+        second = load_template("korean_standard")
+        assert len(second.sections) >= 4
+        assert second is not first
+
     def test_list_templates(self):
         names = list_templates()
         assert "korean_standard" in names
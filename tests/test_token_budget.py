@@ -0,0 +1,36 @@
+"""Tests for approximate token budgeting."""
+
+from __future__ import annotations
+
+from resume_tailor.utils.token_budget import estimate_tokens, truncate_to_tokens
+
+
+class TestEstimateTokens:
+    def test_ascii_is_cheaper_than_hangul(self):
+        assert estimate_tokens("a" * 400) == 100
+        assert estimate_tokens("가" * 100) == 70
+
+    def test_mixed_text(self):
+        assert estimate_tokens("Python 개발자") == round(7 * 0.25 + 3 * 0.7)
+
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+
+class TestTruncateToTokens:
+    def test_short_text_unchanged(self):
+        text = "채용공고 Python"
+        assert truncate_to_tokens(text, 100) is text
+
+    def test_korean_trimmed_harder_than_english(self):
+        korean = truncate_to_tokens("가" * 3000, 700)
+        english = truncate_to_tokens("a" * 12000, 700)
+        assert len(korean) == 1000
+        assert len(english) == 2800
+
+    def test_result_fits_budget(self):
+        text = "Backend 엔지니어 채용 " * 200
+        trimmed = truncate_to_tokens(text, 300)
+        assert text.startswith(trimmed)
+        assert estimate_tokens(trimmed) <= 300
+        assert estimate_tokens(text[: len(trimmed) + 1]) > 300